@@ -98,7 +98,8 @@ def main(sysArgs: list | None = None) -> GuiMain | None:
         "config=",
         "data=",
         "testmode",
-        "meminfo"
+        "meminfo",
+        "headless",
     ]
 
     helpMsg = (
@@ -120,6 +121,9 @@ def main(sysArgs: list | None = None) -> GuiMain | None:
         "     --style=   Sets Qt5 style flag. Defaults to 'Fusion'.\n"
         "     --config=  Alternative config file.\n"
         "     --data=    Alternative user data path.\n"
+        "     --headless Build a manuscript without the GUI. The project and\n"
+        "                the build options follow. Run it without them to\n"
+        "                list the build options.\n"
     )
 
     # Defaults
@@ -130,6 +134,7 @@ def main(sysArgs: list | None = None) -> GuiMain | None:
     testMode = False
     qtStyle  = "Fusion"
     cmdOpen  = None
+    headless = False
 
     # Parse Options
     try:
@@ -167,6 +172,8 @@ def main(sysArgs: list | None = None) -> GuiMain | None:
             testMode = True
         elif inOpt == "--meminfo":
             CONFIG.memInfo = True
+        elif inOpt == "--headless":
+            headless = True
 
     if fmtFlags & 0b01:
         # This will overwrite the default level names, and also ensure that
@@ -253,6 +260,11 @@ def main(sysArgs: list | None = None) -> GuiMain | None:
         except Exception:
             pass  # Quietly ignore error
 
+    if headless:
+        # Run a headless build instead of launching the GUI
+        from novelwriter.headless import runHeadlessBuild
+        sys.exit(runHeadlessBuild(inRemain))
+
     # Import GUI (after dependency checks), and launch
     from novelwriter.guimain import GuiMain
 
@@ -135,6 +135,7 @@ class Config:
         self.emphLabels      = True   # Add emphasis to H1 and H2 item labels
         self.backupOnClose   = False  # Flag for running automatic backups
         self.askBeforeBackup = True   # Flag for asking before running automatic backup
+        self.searchIndex     = True   # Keep a word index of the project text for searching
 
         # Text Editor Settings
         self.textFont        = QFont()  # Editor font
@@ -151,6 +152,7 @@ class Config:
         self.showTabsNSpaces = False    # Show tabs and spaces in editor
         self.showLineEndings = False    # Show line endings in editor
         self.showMultiSpaces = True     # Highlight multiple spaces in the text
+        self.largeDocLimit   = 100000   # Document size for preparing it in the background
 
         self.doReplace       = True     # Enable auto-replace as you type
         self.doReplaceSQuote = True     # Smart single quotes
@@ -628,6 +630,7 @@ class Config:
         self._backupPath     = conf.rdPath(sec, "backuppath", self._backupPath)
         self.backupOnClose   = conf.rdBool(sec, "backuponclose", self.backupOnClose)
         self.askBeforeBackup = conf.rdBool(sec, "askbeforebackup", self.askBeforeBackup)
+        self.searchIndex     = conf.rdBool(sec, "searchindex", self.searchIndex)
 
         # Editor
         sec = "Editor"
@@ -670,6 +673,7 @@ class Config:
         self.highlightEmph   = conf.rdBool(sec, "highlightemph", self.highlightEmph)
         self.stopWhenIdle    = conf.rdBool(sec, "stopwhenidle", self.stopWhenIdle)
         self.userIdleTime    = conf.rdInt(sec, "useridletime", self.userIdleTime)
+        self.largeDocLimit   = conf.rdInt(sec, "largedoclimit", self.largeDocLimit)
 
         # State
         sec = "State"
@@ -739,6 +743,7 @@ class Config:
             "backuppath":      str(self._backupPath),
             "backuponclose":   str(self.backupOnClose),
             "askbeforebackup": str(self.askBeforeBackup),
+            "searchindex":     str(self.searchIndex),
         }
 
         conf["Editor"] = {
@@ -781,6 +786,7 @@ class Config:
             "highlightemph":   str(self.highlightEmph),
             "stopwhenidle":    str(self.stopWhenIdle),
             "useridletime":    str(self.userIdleTime),
+            "largedoclimit":   str(self.largeDocLimit),
         }
 
         conf["State"] = {
@@ -147,7 +147,9 @@ class nwFiles:
 
     # Project Meta Files
     BUILDS_FILE = "builds.json"
+    BUILD_MAN   = "buildManifest.json"
     INDEX_FILE  = "index.json"
+    TEXT_INDEX  = "textIndex.json"
     OPTS_FILE   = "options.json"
     DICT_FILE   = "userdict.json"
     SESS_FILE   = "sessions.jsonl"
@@ -398,6 +400,7 @@ class nwLabels:
         "*.md":  QT_TRANSLATE_NOOP("Constant", "Markdown files"),
         "*.nwd": QT_TRANSLATE_NOOP("Constant", "novelWriter files"),
         "*.csv": QT_TRANSLATE_NOOP("Constant", "CSV files"),
+        "*.json": QT_TRANSLATE_NOOP("Constant", "JSON files"),
         "*":     QT_TRANSLATE_NOOP("Constant", "All files"),
     }
     UNIT_NAME = {
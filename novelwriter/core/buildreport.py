@@ -0,0 +1,184 @@
+"""
+novelWriter – Build Report
+==========================
+
+File History:
+Created: 2026-10-19 [2.6b2] BuildReport
+
+This file is a part of novelWriter
+Copyright (C) 2026 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import sys
+
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter, time
+
+from novelwriter import __version__
+from novelwriter.common import formatTimeStamp
+from novelwriter.error import logException
+
+logger = logging.getLogger(__name__)
+
+NO_MEASURE = nullcontext()
+
+
+class BuildReport:
+    """Core: Build Profiling Report
+
+    Collects the time spent in each stage of a build, per document and
+    per output file. Allocations are counted per document and output
+    file as the change in the number of memory blocks allocated by the
+    interpreter. Counting them is not free, so it is not done for each
+    stage.
+    """
+
+    STAGES = ("read", "preprocess", "tokenize", "count", "outline", "convert", "save")
+
+    __slots__ = ("_name", "_created", "_titles", "_rows", "_outputs")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._created = time()
+        self._titles: dict[str, str] = {}
+        self._rows: dict[str, list] = {}
+        self._outputs: list[str] = []
+        return
+
+    def __len__(self) -> int:
+        """Return the number of documents in the report."""
+        return len(self._rows) - len(self._outputs)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a document or output file is in the report."""
+        return key in self._rows
+
+    ##
+    #  Methods
+    ##
+
+    def addDocument(self, tHandle: str, title: str) -> None:
+        """Add a document to the report."""
+        if tHandle not in self._rows:
+            self._titles[tHandle] = title
+            self._rows[tHandle] = [0.0]*len(self.STAGES) + [0]
+        return
+
+    def addOutput(self, path: Path) -> None:
+        """Add an output file to the report."""
+        key = str(path)
+        if key not in self._rows:
+            self.addDocument(key, path.name)
+            self._outputs.append(key)
+        return
+
+    @contextmanager
+    def measure(self, key: str, stage: str) -> Iterator[None]:
+        """Measure the time of a build stage for a document or output
+        file. The key must be added first.
+        """
+        row = self._rows[key]
+        idx = self.STAGES.index(stage)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            row[idx] += perf_counter() - start
+        return
+
+    @contextmanager
+    def countBlocks(self, key: str) -> Iterator[None]:
+        """Count the memory blocks allocated for a document or output
+        file. The key must be added first.
+        """
+        row = self._rows[key]
+        blocks = sys.getallocatedblocks()
+        try:
+            yield
+        finally:
+            row[-1] += sys.getallocatedblocks() - blocks
+        return
+
+    def slowest(self, count: int = 10) -> list[tuple[str, str, float]]:
+        """Return the handle, title and total time in seconds of the
+        slowest documents.
+        """
+        totals = [
+            (key, self._titles[key], sum(row[:-1]))
+            for key, row in self._rows.items() if key not in self._outputs
+        ]
+        return sorted(totals, key=lambda x: x[2], reverse=True)[:count]
+
+    def packData(self, count: int = 10) -> dict:
+        """Pack the report into a dictionary."""
+        stages = dict.fromkeys(self.STAGES, 0.0)
+        documents = []
+        outputs = []
+        for key, row in self._rows.items():
+            times = {}
+            for stage, elapsed in zip(self.STAGES, row):
+                if elapsed > 0.0:
+                    times[stage] = elapsed
+                    stages[stage] += elapsed
+            entry = {"time": sum(row[:-1]), "blocks": row[-1], "stages": times}
+            if key in self._outputs:
+                outputs.append({"path": key, **entry})
+            else:
+                documents.append({"handle": key, "title": self._titles[key], **entry})
+        return {
+            "build": self._name,
+            "created": formatTimeStamp(self._created),
+            "version": __version__,
+            "time": sum(stages.values()),
+            "stages": stages,
+            "slowest": [key for key, _, _ in self.slowest(count)],
+            "documents": documents,
+            "outputs": outputs,
+        }
+
+    def saveReport(self, path: Path) -> bool:
+        """Save the report as JSON, or as CSV if the file extension is
+        '.csv'. The CSV file has one row per document or output file,
+        with the time of each stage in milliseconds.
+        """
+        logger.info("Writing build report: %s", path)
+        try:
+            if path.suffix.lower() == ".csv":
+                with open(path, mode="w", encoding="utf-8", newline="") as fObj:
+                    writer = csv.writer(fObj, dialect="excel")
+                    writer.writerow(
+                        ["key", "title", "total_ms"] + [f"{s}_ms" for s in self.STAGES]
+                        + ["blocks"]
+                    )
+                    for key, row in self._rows.items():
+                        writer.writerow(
+                            [key, self._titles[key], f"{1000.0*sum(row[:-1]):.3f}"]
+                            + [f"{1000.0*t:.3f}" for t in row[:-1]] + [row[-1]]
+                        )
+            else:
+                with open(path, mode="w", encoding="utf-8") as fObj:
+                    json.dump(self.packData(), fObj, indent=2)
+        except Exception:
+            logger.error("Failed to save build report")
+            logException()
+            return False
+        return True
@@ -5,6 +5,7 @@ novelWriter – Build Settings
 File History:
 Created: 2023-02-14 [2.1b1] BuildSettings
 Created: 2023-05-22 [2.1b1] BuildCollection
+Created: 2026-10-19 [2.6b2] BuildManifest
 
 This file is a part of novelWriter
 Copyright (C) 2023 Veronica Berglyd Olsen and novelWriter contributors
@@ -24,6 +25,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import uuid
@@ -31,6 +33,7 @@ import uuid
 from collections.abc import Iterable
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from PyQt5.QtCore import QT_TRANSLATE_NOOP, QCoreApplication
 
@@ -293,6 +296,18 @@ class BuildSettings:
         value = self._settings.get(key, SETTINGS_TEMPLATE.get(key, (None, None))[1])
         return float(value) if isinstance(value, (int, float)) else 0.0
 
+    def getValues(self) -> dict[str, Any]:
+        """Return all settings as a dictionary of type safe values."""
+        getters = {str: self.getStr, bool: self.getBool, int: self.getInt, float: self.getFloat}
+        return {k: getters[v[0]](k) for k, v in SETTINGS_TEMPLATE.items()}
+
+    def settingsDigest(self) -> str:
+        """Return a digest of the build settings values. The build name,
+        item filters and other meta data are not included.
+        """
+        data = json.dumps(self._settings, sort_keys=True)
+        return hashlib.sha1(data.encode()).hexdigest()
+
     ##
     #  Setters
     ##
@@ -658,3 +673,106 @@ class BuildCollection:
             return False
 
         return True
+
+
+class BuildManifest:
+    """Core: Build Manifest Class
+
+    Records what went into the last build of each format of each build
+    definition, so that a repeated build with unchanged input can be
+    skipped. A record is a dictionary of JSON compatible values, and
+    the output file's path, size and modification time are added to it
+    when it is saved. The manifest is stored next to the builds file.
+    """
+
+    __slots__ = ("_project", "_records")
+
+    def __init__(self, project: NWProject) -> None:
+        self._project = project
+        self._records: dict[str, dict[str, dict]] = {}
+        self._loadManifest()
+        return
+
+    def __len__(self) -> int:
+        """Return the number of recorded builds."""
+        return len(self._records)
+
+    ##
+    #  Methods
+    ##
+
+    def hasRecord(self, buildID: str, bFormat: nwBuildFmt) -> bool:
+        """Check if there is a record of a build format."""
+        return bFormat.name in self._records.get(buildID, {})
+
+    def isUnchanged(self, buildID: str, bFormat: nwBuildFmt, path: Path, record: dict) -> bool:
+        """Check if an output file was built from the same input as
+        the record, and is still unchanged on disk.
+        """
+        if (stored := self._records.get(buildID, {}).get(bFormat.name)) is None:
+            return False
+        return stored == {**record, "path": str(path), "output": self._outputStat(path)}
+
+    def setRecord(self, buildID: str, bFormat: nwBuildFmt, path: Path, record: dict) -> None:
+        """Record the input of a successfully built output file. The
+        record replaces any previous record of the same format.
+        """
+        if output := self._outputStat(path):
+            self._records.setdefault(buildID, {})[bFormat.name] = {
+                **record, "path": str(path), "output": output
+            }
+            self._saveManifest()
+        return
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _outputStat(self, path: Path) -> list[int]:
+        """Return the size and modification time of an output file."""
+        try:
+            stat = path.stat()
+            return [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            return []
+
+    def _loadManifest(self) -> bool:
+        """Load the build manifest file."""
+        manFile = self._project.storage.getMetaFile(nwFiles.BUILD_MAN)
+        if not isinstance(manFile, Path) or not manFile.exists():
+            return False
+
+        logger.debug("Loading build manifest file")
+        try:
+            with open(manFile, mode="r", encoding="utf-8") as inFile:
+                data = json.load(inFile)
+            records = data["novelWriter.buildManifest"]
+        except Exception:
+            logger.error("Failed to load build manifest file")
+            logException()
+            return False
+
+        if isinstance(records, dict):
+            self._records = {
+                k: {f: r for f, r in v.items() if f in nwBuildFmt.__members__}
+                for k, v in records.items() if isinstance(v, dict) and checkUuid(k, "")
+            }
+
+        return True
+
+    def _saveManifest(self) -> bool:
+        """Save the build manifest file."""
+        manFile = self._project.storage.getMetaFile(nwFiles.BUILD_MAN)
+        if not isinstance(manFile, Path):
+            return False
+
+        logger.debug("Saving build manifest file")
+        try:
+            with open(manFile, mode="w+", encoding="utf-8") as outFile:
+                json.dump({"novelWriter.buildManifest": self._records}, outFile)
+        except Exception:
+            logger.error("Failed to save build manifest file")
+            logException()
+            return False
+
+        return True
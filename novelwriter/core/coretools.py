@@ -26,12 +26,14 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 import shutil
 
 from collections.abc import Iterable
 from functools import partial
+from itertools import chain
 from pathlib import Path
 from zipfile import ZipFile, is_zipfile
 
@@ -40,12 +42,15 @@ from PyQt5.QtCore import QCoreApplication
 from novelwriter import CONFIG, SHARED
 from novelwriter.common import isHandle, minmax, simplified
 from novelwriter.constants import nwConst, nwFiles, nwItemClass, nwStats
+from novelwriter.core.index import RX_WORD, TextIndex
 from novelwriter.core.item import NWItem
 from novelwriter.core.project import NWProject
 from novelwriter.core.storage import NWStorageCreate
 
 logger = logging.getLogger(__name__)
 
+RX_LINE = re.compile("\n")
+
 
 class DocMerger:
     """Document tool for merging a set of documents into a single new
@@ -283,13 +288,25 @@ class DocDuplicator:
 
 class DocSearch:
 
+    MAX_WORDS = 20  # Max indexed words to search at their positions
+
     def __init__(self) -> None:
         self._regEx = re.compile("")
         self._opts = re.UNICODE | re.IGNORECASE
         self._words = False
         self._escape = True
+        self._indexed = False
         return
 
+    ##
+    #  Properties
+    ##
+
+    @property
+    def indexed(self) -> bool:
+        """Check if the text index was used for the prepared search."""
+        return self._indexed
+
     ##
     #  Methods
     ##
@@ -311,42 +328,127 @@ class DocSearch:
         self._escape = not state
         return
 
-    def iterSearch(
+    def prepareSearch(
         self, project: NWProject, search: str
-    ) -> Iterable[tuple[NWItem, list[tuple[int, int, str]], bool]]:
-        """Iteratively search through documents in a project."""
+    ) -> list[tuple[NWItem, list[int] | None]]:
+        """Prepare a search through the documents in a project, and
+        return the documents in tree order with the positions to search
+        at. An empty list means the whole document must be searched,
+        and None means it cannot contain a match. Unless the search is a
+        user RegEx, the text index is used to find the positions if it
+        has been loaded.
+        """
         self._regEx = re.compile(self._buildPattern(search), self._opts)
         logger.debug("Searching with pattern '%s'", self._regEx.pattern)
-        storage = project.storage
-        for item in project.tree:
-            if item.isFileType():
-                results, capped = self.searchText(storage.getDocumentText(item.itemHandle))
-                yield item, results, capped
+        index = project.index.getTextIndex() if self._escape else None
+        lookup = self._indexLookup(index, search) if index else None
+        self._indexed = lookup is not None
+        return [
+            (item, [] if lookup is None else lookup.get(item.itemHandle))
+            for item in project.tree if item.isFileType()
+        ]
+
+    def searchDocument(
+        self, project: NWProject, tHandle: str, positions: list[int],
+        limit: int | None = None
+    ) -> tuple[list[tuple[int, int, str, int]], bool]:
+        """Search a document of a prepared search, at the positions
+        returned for it, for up to a limit of results. This only reads
+        the compiled search, so it can be called from other threads.
+        """
+        text = project.storage.getDocumentText(tHandle)
+        if positions:
+            return self._searchWords(text, positions, limit)
+        return self.searchText(text, limit)
+
+    def iterSearch(
+        self, project: NWProject, search: str
+    ) -> Iterable[tuple[NWItem, list[tuple[int, int, str, int]], bool]]:
+        """Iteratively search through documents in a project. The search
+        stops when the max number of results is reached.
+        """
+        limit = nwConst.MAX_SEARCH_RESULT
+        for item, positions in self.prepareSearch(project, search):
+            if positions is None:
+                yield item, [], False
+                continue
+            results, capped = self.searchDocument(project, item.itemHandle, positions, limit)
+            limit -= len(results)
+            yield item, results, capped
+            if capped:
+                break
         return
 
-    def searchText(self, text: str) -> tuple[list[tuple[int, int, str]], bool]:
+    def searchText(
+        self, text: str, limit: int | None = None
+    ) -> tuple[list[tuple[int, int, str, int]], bool]:
         """Search a piece of text for RegEx matches."""
+        return self._collectResults(text, self._regEx.finditer(text), limit)
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _indexLookup(self, index: TextIndex, search: str) -> dict[str, list[int]] | None:
+        """Look up the documents that may contain the search text. If
+        the search is a single word matching only a few indexed words,
+        the positions of those words are included. Otherwise, the lists
+        of positions are empty.
+        """
+        words = [TextIndex.foldWord(w) for w in RX_WORD.findall(search)]
+        if not words:
+            return None
+        if len(words) == 1 and RX_WORD.fullmatch(search):
+            keys = index.matchWords(words[0], whole=self._words)
+            if len(keys) <= self.MAX_WORDS:
+                return index.findPositions(keys)
+            return dict.fromkeys(index.findHandles(keys), [])
+        handles = index.findHandles(index.matchWords(words[0]))
+        for word in words[1:]:
+            handles &= index.findHandles(index.matchWords(word))
+        return dict.fromkeys(handles, [])
+
+    def _searchWords(
+        self, text: str, positions: list[int], limit: int | None
+    ) -> tuple[list[tuple[int, int, str, int]], bool]:
+        """Search a piece of text for RegEx matches within the words
+        starting at the given positions.
+        """
+        matches = (
+            self._regEx.finditer(text, pos, word.end())
+            for pos in positions if (word := RX_WORD.match(text, pos))
+        )
+        return self._collectResults(text, chain.from_iterable(matches), limit)
+
+    def _collectResults(
+        self, text: str, matches: Iterable[re.Match], limit: int | None
+    ) -> tuple[list[tuple[int, int, str, int]], bool]:
+        """Collect the position, length, context and line number of
+        matches, up to a limit. The results are capped if the limit is
+        reached. The line of each match is looked up in a table of line
+        start positions, which is made on the first match.
+        """
+        limit = nwConst.MAX_SEARCH_RESULT if limit is None else limit
         count = 0
         capped = False
         results = []
-        for res in self._regEx.finditer(text):
-            pos = res.start(0)
-            num = len(res.group(0))
-            lim = text[:pos].rfind("\n") + 1
-            cut = text[lim:pos].rfind(" ") + lim + 1
+        lines = []
+        for res in matches:
+            pos, end = res.span(0)
+            if not lines:
+                lines = [0] + [m.end() for m in RX_LINE.finditer(text)]
+            line = bisect.bisect_right(lines, pos)
+            lim = lines[line - 1]
+            cut = text.rfind(" ", lim, pos) + 1 or lim
             context = text[cut:cut+100].partition("\n")[0]
             if context:
-                results.append((pos, num, context))
+                results.append((pos, end - pos, context, line))
                 count += 1
-                if count >= nwConst.MAX_SEARCH_RESULT:
+                if count >= limit:
                     capped = True
                     break
         return results, capped
 
-    ##
-    #  Internal Functions
-    ##
-
     def _buildPattern(self, search: str) -> str:
         """Build the search pattern string."""
         if self._escape:
@@ -4,6 +4,8 @@ novelWriter – Manuscript Document Builder
 
 File History:
 Created: 2022-12-01 [2.1b1] NWBuildDocument
+Created: 2026-10-19 [2.6b2] BackgroundBuild
+Created: 2026-10-19 [2.6b2] BuildProfile
 
 This file is a part of novelWriter
 Copyright (C) 2022 Veronica Berglyd Olsen and novelWriter contributors
@@ -23,16 +25,22 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
 
-from collections.abc import Iterable
+from collections.abc import Callable, Generator, Iterable
+from contextlib import AbstractContextManager
+from copy import copy
 from pathlib import Path
+from typing import Any, NamedTuple
 
+from PyQt5.QtCore import QObject, QRunnable, QThread, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
 
-from novelwriter import CONFIG
-from novelwriter.constants import nwLabels
-from novelwriter.core.buildsettings import BuildSettings
+from novelwriter import CONFIG, __version__
+from novelwriter.constants import nwHeadFmt, nwKeyWords, nwLabels
+from novelwriter.core.buildreport import NO_MEASURE, BuildReport
+from novelwriter.core.buildsettings import BuildManifest, BuildSettings, FilterMode
 from novelwriter.core.item import NWItem
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwBuildFmt
@@ -44,6 +52,7 @@ from novelwriter.formats.tomarkdown import ToMarkdown
 from novelwriter.formats.toodt import ToOdt
 from novelwriter.formats.toqdoc import ToQTextDocument
 from novelwriter.formats.toraw import ToRaw
+from novelwriter.text.patterns import compileAutoReplace
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +66,8 @@ class NWBuildDocument:
 
     __slots__ = (
         "_project", "_build", "_queue", "_error", "_cache", "_count",
-        "_outline",
+        "_outline", "_profile", "_skipped", "_written", "_report",
+        "_snapshot",
     )
 
     def __init__(self, project: NWProject, build: BuildSettings) -> None:
@@ -68,6 +78,11 @@ class NWBuildDocument:
         self._cache = None
         self._count = False
         self._outline = False
+        self._profile: BuildProfile | None = None
+        self._skipped: list[Path] = []
+        self._written: list[Path] = []
+        self._report: BuildReport | None = None
+        self._snapshot: BuildSnapshot | None = None
         return
 
     ##
@@ -87,6 +102,27 @@ class NWBuildDocument:
         """
         return self._cache
 
+    @property
+    def skipped(self) -> list[Path]:
+        """Return the output paths of the last build that were skipped
+        because their input was unchanged.
+        """
+        return self._skipped
+
+    @property
+    def written(self) -> list[Path]:
+        """Return the output paths of the last build that were saved."""
+        return self._written
+
+    ##
+    #  Setters
+    ##
+
+    def setReport(self, report: BuildReport | None) -> None:
+        """Set a report to collect build stage timings in."""
+        self._report = report
+        return
+
     ##
     #  Special Methods
     ##
@@ -113,259 +149,508 @@ class NWBuildDocument:
                 self._queue.append(item.itemHandle)
         return
 
+    def takeSnapshot(self) -> None:
+        """Copy the project data that the next build needs: the included
+        items, their text, and the references shown in their headings.
+        The build then doesn't access the project tree, index or
+        storage, so it can run in another thread while the project is
+        being edited. The snapshot is released when the build is done.
+        """
+        project = self._project
+        index = project.index
+        addRefs = self._digestRefs()
+        filtered = self._build.buildItemFilter(
+            project, withRoots=self._build.getBool("text.addNoteHeadings")
+        )
+        snapshot = BuildSnapshot(filtered, {}, {}, {})
+        for tHandle in self._queue:
+            if (tItem := project.tree[tHandle]) and filtered.get(tHandle, (False, 0))[0]:
+                snapshot.items[tHandle] = copy(tItem)
+                if tItem.isFileType():
+                    snapshot.texts[tHandle] = project.storage.getDocumentText(tHandle)
+                    if addRefs:
+                        for nHead in range(1, index.getHandleHeaderCount(tHandle) + 1):
+                            for keyClass in (nwKeyWords.POV_KEY, nwKeyWords.FOCUS_KEY):
+                                snapshot.refs[(tHandle, nHead, keyClass)] = (
+                                    index.getReferenceForHeader(tHandle, nHead, keyClass)
+                                )
+        self._profile = BuildProfile.fromBuild(project, self._build)
+        self._snapshot = snapshot
+        return
+
     def iterBuildPreview(self, newPage: bool) -> Iterable[tuple[int, bool]]:
         """Build a preview QTextDocument."""
         makeObj = ToQTextDocument(self._project)
-        filtered = self._setupBuild(makeObj)
+        self._setupBuild(makeObj)
         makeObj.initDocument()
         makeObj.setShowNewPage(newPage)
         self._outline = True
-        yield from self._iterBuild(makeObj, filtered)
+        yield from self._iterBuild([[makeObj]])
         makeObj.closeDocument()
         self._error = None
         self._cache = makeObj
         return
 
-    def iterBuildDocument(self, path: Path, bFormat: nwBuildFmt) -> Iterable[tuple[int, bool]]:
-        """Wrapper for builders based on format."""
+    def iterBuildDocument(
+        self, path: Path, bFormat: nwBuildFmt, force: bool = True
+    ) -> Iterable[tuple[int, bool]]:
+        """Wrapper for builders based on format. Unless forced, the
+        build is skipped if the build manifest shows that the output
+        file was built from the same input.
+        """
+        yield from self.iterBuildDocuments([(path, bFormat)], force=force)
+        return
+
+    def iterBuildDocuments(
+        self, targets: list[tuple[Path, nwBuildFmt]], force: bool = True
+    ) -> Iterable[tuple[int, bool]]:
+        """Build multiple formats in a single pass. Each document is
+        read once, and tokenized once per group of formats that share
+        the same pre-processing. The tokens are then converted by all
+        the format builders in the group. Unless forced, formats with
+        unchanged input are skipped, and the rest are recorded in the
+        build manifest.
+        """
         self._error = None
         self._cache = None
+        self._skipped = []
+        self._written = []
+
+        buildID = self._build.buildID
+        outPaths = [(self._buildPath(path, bFormat), bFormat) for path, bFormat in targets]
+
+        # The manifest is only used when unchanged builds are skipped.
+        # The input record is only needed up front if there is a
+        # previous build to compare with, otherwise the digests are
+        # added as the documents are read by the build
+        manifest = None if force else BuildManifest(self._project)
+        texts: dict[str, str] = {}
+        digests: list[list[str]] | None = None if force else []
+        record = None
+        if manifest is not None and any(manifest.hasRecord(buildID, f) for _, f in outPaths):
+            record = self._buildRecord(self._readDigests(texts))
+
+        builds: list[tuple[Path, nwBuildFmt, Tokenizer]] = []
+        for outPath, bFormat in outPaths:
+            if not (makeObj := self._makeBuilder(bFormat)):
+                logger.error("Unsupported document format")
+                continue
+            if (
+                manifest is not None and record is not None
+                and manifest.isUnchanged(buildID, bFormat, outPath, record)
+            ):
+                logger.info("Build input unchanged, skipping: %s", outPath)
+                self._skipped.append(outPath)
+            else:
+                builds.append((outPath, bFormat, makeObj))
 
-        if bFormat in (nwBuildFmt.J_HTML, nwBuildFmt.J_NWD):
-            # Ensure that JSON output has the correct extension
-            path = path.with_suffix(".json")
+        if not builds:
+            return
+
+        groups: dict[object, list[Tokenizer]] = {}
+        for _, _, makeObj in builds:
+            groups.setdefault(type(makeObj).doPreProcessing, []).append(makeObj)
+
+        chains: list[list[Tokenizer]] = []
+        for group in groups.values():
+            # The raw text builder doesn't tokenize, so it can only lead
+            # a group of other raw text builders
+            group.sort(key=lambda x: isinstance(x, ToRaw))
+            for makeObj in group[1:]:
+                group[0].linkTokenizer(makeObj)
+            chains.append(group)
+
+        if record is not None:
+            yield from self._iterBuild(chains, texts)
+        else:
+            yield from self._iterBuild(chains, digests=digests)
+            if digests is not None:
+                record = self._buildRecord(digests)
+
+        errors = []
+        for path, bFormat, makeObj in builds:
+            self._closeBuilder(makeObj, bFormat)
+            try:
+                if self._report is not None:
+                    self._report.addOutput(path)
+                with self._measure(str(path), "save"), self._countBlocks(str(path)):
+                    makeObj.saveDocument(path)
+                self._written.append(path)
+                if manifest is not None and record is not None:
+                    manifest.setRecord(buildID, bFormat, path, record)
+            except Exception as exc:
+                logException()
+                errors.append(formatException(exc))
+
+        self._error = "\n".join(errors) or None
+        self._cache = builds[0][2]
+
+        return
+
+    ##
+    #  Internal Functions
+    ##
 
+    def _makeBuilder(self, bFormat: nwBuildFmt) -> Tokenizer | None:
+        """Create and configure the build object for a format."""
         if bFormat in (nwBuildFmt.ODT, nwBuildFmt.FODT):
             makeObj = ToOdt(self._project, bFormat == nwBuildFmt.FODT)
-            filtered = self._setupBuild(makeObj)
+            self._setupBuild(makeObj)
             makeObj.initDocument()
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
 
         elif bFormat in (nwBuildFmt.HTML, nwBuildFmt.J_HTML):
             makeObj = ToHtml(self._project)
-            filtered = self._setupBuild(makeObj)
+            self._setupBuild(makeObj)
             makeObj.initDocument()
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
-            if not self._build.getBool("html.preserveTabs"):
-                makeObj.replaceTabs()
 
         elif bFormat in (nwBuildFmt.STD_MD, nwBuildFmt.EXT_MD):
             makeObj = ToMarkdown(self._project, bFormat == nwBuildFmt.EXT_MD)
-            filtered = self._setupBuild(makeObj)
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
-            if self._build.getBool("format.replaceTabs"):
-                makeObj.replaceTabs(nSpaces=4, spaceChar=" ")
+            self._setupBuild(makeObj)
 
         elif bFormat in (nwBuildFmt.NWD, nwBuildFmt.J_NWD):
             makeObj = ToRaw(self._project)
-            filtered = self._setupBuild(makeObj)
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
-            if self._build.getBool("format.replaceTabs"):
-                makeObj.replaceTabs(nSpaces=4, spaceChar=" ")
+            self._setupBuild(makeObj)
 
         elif bFormat == nwBuildFmt.DOCX:
             makeObj = ToDocX(self._project)
-            filtered = self._setupBuild(makeObj)
+            makeObj.setStreamMode(True)
+            self._setupBuild(makeObj)
             makeObj.initDocument()
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
 
         elif bFormat == nwBuildFmt.PDF:
             makeObj = ToQTextDocument(self._project)
             makeObj.disableAnchors()
-            filtered = self._setupBuild(makeObj)
+            self._setupBuild(makeObj)
             makeObj.initDocument(pdf=True)
-            yield from self._iterBuild(makeObj, filtered)
-            makeObj.closeDocument()
 
         else:
-            logger.error("Unsupported document format")
-            return
+            return None
 
-        self._error = None
-        self._cache = makeObj
-
-        try:
-            makeObj.saveDocument(path)
-        except Exception as exc:
-            logException()
-            self._error = formatException(exc)
+        return makeObj
 
+    def _closeBuilder(self, makeObj: Tokenizer, bFormat: nwBuildFmt) -> None:
+        """Run the format specific close document tasks."""
+        makeObj.closeDocument()
+        if isinstance(makeObj, ToHtml):
+            if not self._build.getBool("html.preserveTabs"):
+                makeObj.replaceTabs()
+        elif isinstance(makeObj, (ToMarkdown, ToRaw)):
+            if self._build.getBool("format.replaceTabs"):
+                makeObj.replaceTabs(nSpaces=4, spaceChar=" ")
         return
 
-    ##
-    #  Internal Functions
-    ##
+    def _buildPath(self, path: Path, bFormat: nwBuildFmt) -> Path:
+        """Adjust the output path for the format."""
+        if bFormat in (nwBuildFmt.J_HTML, nwBuildFmt.J_NWD):
+            # Ensure that JSON output has the correct extension
+            return path.with_suffix(".json")
+        return path
 
-    def _iterBuild(self, makeObj: Tokenizer, filtered: dict) -> Iterable[tuple[int, bool]]:
-        """Iterate over buildable documents."""
+    def _buildRecord(self, digests: list[list[str]]) -> dict:
+        """Return a build manifest record of the input of the build from
+        the document digests. The project's edit time and save count are
+        only written to the document meta data, and are not included.
+        """
+        data = self._project.data
+        return {
+            "version": __version__,
+            "settings": self._build.settingsDigest(),
+            "project": [
+                data.name, data.author, data.language, data.autoReplace,
+                CONFIG.textFont.toString(),
+            ],
+            "documents": digests,
+        }
+
+    def _readDigests(self, texts: dict[str, str]) -> list[list[str]]:
+        """Read the documents of the build and return their digests.
+        The text is added to the texts dict so that the build doesn't
+        have to read it again.
+        """
+        filtered = self._buildFilter()
+        addRefs = self._digestRefs()
+        digests = []
+        for tHandle in self._queue:
+            if (tItem := self._getItem(tHandle)) and filtered.get(tHandle, (False, 0))[0]:
+                text = None
+                if tItem.isFileType():
+                    if self._report is not None:
+                        self._report.addDocument(tHandle, tItem.itemName)
+                    with self._measure(tHandle, "read"):
+                        text = texts[tHandle] = self._getText(tHandle)
+                digests.append([tHandle, self._itemDigest(tItem, text, addRefs)])
+        return digests
+
+    def _digestRefs(self) -> bool:
+        """Check if the heading formats show references, in which case
+        they are part of the document digests.
+        """
+        values = self._build.getValues()
+        fmts = "".join(v for k, v in values.items() if k.startswith("headings.fmt"))
+        return nwHeadFmt.CHAR_POV in fmts or nwHeadFmt.CHAR_FOCUS in fmts
+
+    def _itemDigest(self, tItem: NWItem, text: str | None, addRefs: bool) -> str:
+        """Return the digest of a project item and its text."""
+        tHandle = tItem.itemHandle
+        digest = hashlib.sha1(
+            f"{tItem.itemName}:{tItem.itemClass.name}:{tItem.itemLayout.name}:".encode()
+        )
+        if tItem.isFileType():
+            if addRefs:
+                # Reference display names come from other documents
+                for nHead, keyClass, refs in self._getReferences(tHandle):
+                    digest.update(f"{nHead}:{keyClass}:{refs}:".encode())
+            digest.update((text or "").encode())
+        return digest.hexdigest()
+
+    def _iterBuild(
+        self, chains: list[list[Tokenizer]], texts: dict[str, str] | None = None,
+        digests: list[list[str]] | None = None,
+    ) -> Iterable[tuple[int, bool]]:
+        """Iterate over buildable documents. Each chain is a list of
+        build objects where the first one does the tokenization, and
+        the rest are linked to it. Document text that has already been
+        read can be passed in the texts dict, the rest is read here so
+        that each document is read only once. If a digests list is
+        passed, the digest of each document is added to it.
+        """
+        texts = texts or {}
         self._count = True
+        for chain in chains:
+            chain[0].setCounting(self._count)
+        filtered = self._buildFilter()
+        addRefs = self._digestRefs() if digests is not None else False
         for i, tHandle in enumerate(self._queue):
             self._error = None
             if filtered.get(tHandle, (False, 0))[0]:
-                yield i, self._doBuild(makeObj, tHandle)
+                tItem = self._getItem(tHandle)
+                text = texts.pop(tHandle, None)
+                if text is None and tItem and tItem.isFileType():
+                    if self._report is not None:
+                        self._report.addDocument(tHandle, tItem.itemName)
+                    with self._measure(tHandle, "read"):
+                        text = self._getText(tHandle)
+                if digests is not None and tItem:
+                    digests.append([tHandle, self._itemDigest(tItem, text, addRefs)])
+                with self._countBlocks(tHandle):
+                    status = [self._doBuild(chain, tHandle, text=text) for chain in chains]
+                yield i, all(status)
             else:
                 yield i, False
+        self._snapshot = None
+        return
+
+    def _buildFilter(self) -> dict[str, tuple[bool, FilterMode]]:
+        """Return the item filter of the build, including the roots if
+        they are added as headings.
+        """
+        if self._snapshot is not None:
+            return self._snapshot.filtered
+        return self._build.buildItemFilter(
+            self._project, withRoots=self._build.getBool("text.addNoteHeadings")
+        )
+
+    def _getItem(self, tHandle: str) -> NWItem | None:
+        """Return a project item from the snapshot or the project."""
+        if self._snapshot is not None:
+            return self._snapshot.items.get(tHandle)
+        return self._project.tree[tHandle]
+
+    def _getText(self, tHandle: str) -> str:
+        """Return a document's text from the snapshot or the project.
+        The snapshot's copy is released, as it is only read once.
+        """
+        if self._snapshot is not None:
+            return self._snapshot.texts.pop(tHandle, "")
+        return self._project.storage.getDocumentText(tHandle)
+
+    def _getReferences(self, tHandle: str) -> Iterable[tuple[int, str, list[str]]]:
+        """Iterate over the references of a document's headings, from
+        the snapshot or the project index.
+        """
+        if self._snapshot is not None:
+            refs = self._snapshot.refs
+            nHead = 1
+            while (tHandle, nHead, nwKeyWords.POV_KEY) in refs:
+                for keyClass in (nwKeyWords.POV_KEY, nwKeyWords.FOCUS_KEY):
+                    yield nHead, keyClass, refs[(tHandle, nHead, keyClass)]
+                nHead += 1
+            return
+        index = self._project.index
+        for nHead in range(1, index.getHandleHeaderCount(tHandle) + 1):
+            for keyClass in (nwKeyWords.POV_KEY, nwKeyWords.FOCUS_KEY):
+                yield nHead, keyClass, index.getReferenceForHeader(tHandle, nHead, keyClass)
         return
 
-    def _setupBuild(self, bldObj: Tokenizer) -> dict:
-        """Configure the build object."""
-        # Get Settings
-        textFont = QFont(CONFIG.textFont)
-        textFont.fromString(self._build.getStr("format.textFont"))
+    def _setupBuild(self, bldObj: Tokenizer) -> None:
+        """Configure the build object from the build profile."""
+        if self._profile is None:
+            self._profile = BuildProfile.fromBuild(self._project, self._build)
 
-        bldObj.setTextFont(textFont)
-        bldObj.setLanguage(self._project.data.language)
+        profile = self._profile
+        values = profile.values
+
+        bldObj.setTextFont(profile.textFont)
+        bldObj.setLanguage(profile.language)
+        bldObj.setAutoReplace(profile.autoReplace)
+        if self._snapshot is not None:
+            bldObj.setReferences(self._snapshot.refs)
 
         bldObj.setPartitionFormat(
-            self._build.getStr("headings.fmtPart"),
-            self._build.getBool("headings.hidePart")
+            values["headings.fmtPart"],
+            values["headings.hidePart"]
         )
         bldObj.setChapterFormat(
-            self._build.getStr("headings.fmtChapter"),
-            self._build.getBool("headings.hideChapter")
+            values["headings.fmtChapter"],
+            values["headings.hideChapter"]
         )
         bldObj.setUnNumberedFormat(
-            self._build.getStr("headings.fmtUnnumbered"),
-            self._build.getBool("headings.hideUnnumbered")
+            values["headings.fmtUnnumbered"],
+            values["headings.hideUnnumbered"]
         )
         bldObj.setSceneFormat(
-            self._build.getStr("headings.fmtScene"),
-            self._build.getBool("headings.hideScene")
+            values["headings.fmtScene"],
+            values["headings.hideScene"]
         )
         bldObj.setHardSceneFormat(
-            self._build.getStr("headings.fmtAltScene"),
-            self._build.getBool("headings.hideAltScene")
+            values["headings.fmtAltScene"],
+            values["headings.hideAltScene"]
         )
         bldObj.setSectionFormat(
-            self._build.getStr("headings.fmtSection"),
-            self._build.getBool("headings.hideSection")
+            values["headings.fmtSection"],
+            values["headings.hideSection"]
         )
         bldObj.setTitleStyle(
-            self._build.getBool("headings.centerTitle"),
-            self._build.getBool("headings.breakTitle")
+            values["headings.centerTitle"],
+            values["headings.breakTitle"]
         )
         bldObj.setPartitionStyle(
-            self._build.getBool("headings.centerPart"),
-            self._build.getBool("headings.breakPart")
+            values["headings.centerPart"],
+            values["headings.breakPart"]
         )
         bldObj.setChapterStyle(
-            self._build.getBool("headings.centerChapter"),
-            self._build.getBool("headings.breakChapter")
+            values["headings.centerChapter"],
+            values["headings.breakChapter"]
         )
         bldObj.setSceneStyle(
-            self._build.getBool("headings.centerScene"),
-            self._build.getBool("headings.breakScene")
+            values["headings.centerScene"],
+            values["headings.breakScene"]
         )
 
-        bldObj.setJustify(self._build.getBool("format.justifyText"))
-        bldObj.setLineHeight(self._build.getFloat("format.lineHeight"))
-        bldObj.setKeepLineBreaks(self._build.getBool("format.keepBreaks"))
-        bldObj.setDialogHighlight(self._build.getBool("format.showDialogue"))
+        bldObj.setJustify(values["format.justifyText"])
+        bldObj.setLineHeight(values["format.lineHeight"])
+        bldObj.setKeepLineBreaks(values["format.keepBreaks"])
+        bldObj.setDialogHighlight(values["format.showDialogue"])
         bldObj.setFirstLineIndent(
-            self._build.getBool("format.firstLineIndent"),
-            self._build.getFloat("format.firstIndentWidth"),
-            self._build.getBool("format.indentFirstPar"),
+            values["format.firstLineIndent"],
+            values["format.firstIndentWidth"],
+            values["format.indentFirstPar"],
         )
         bldObj.setHeadingStyles(
-            self._build.getBool("doc.colorHeadings"),
-            self._build.getBool("doc.scaleHeadings"),
-            self._build.getBool("doc.boldHeadings"),
+            values["doc.colorHeadings"],
+            values["doc.scaleHeadings"],
+            values["doc.boldHeadings"],
         )
 
         bldObj.setTitleMargins(
-            self._build.getFloat("format.titleMarginT"),
-            self._build.getFloat("format.titleMarginB"),
+            values["format.titleMarginT"],
+            values["format.titleMarginB"],
         )
         bldObj.setHead1Margins(
-            self._build.getFloat("format.h1MarginT"),
-            self._build.getFloat("format.h1MarginB"),
+            values["format.h1MarginT"],
+            values["format.h1MarginB"],
         )
         bldObj.setHead2Margins(
-            self._build.getFloat("format.h2MarginT"),
-            self._build.getFloat("format.h2MarginB"),
+            values["format.h2MarginT"],
+            values["format.h2MarginB"],
         )
         bldObj.setHead3Margins(
-            self._build.getFloat("format.h3MarginT"),
-            self._build.getFloat("format.h3MarginB"),
+            values["format.h3MarginT"],
+            values["format.h3MarginB"],
         )
         bldObj.setHead4Margins(
-            self._build.getFloat("format.h4MarginT"),
-            self._build.getFloat("format.h4MarginB"),
+            values["format.h4MarginT"],
+            values["format.h4MarginB"],
         )
         bldObj.setTextMargins(
-            self._build.getFloat("format.textMarginT"),
-            self._build.getFloat("format.textMarginB"),
+            values["format.textMarginT"],
+            values["format.textMarginB"],
         )
         bldObj.setSeparatorMargins(
-            self._build.getFloat("format.sepMarginT"),
-            self._build.getFloat("format.sepMarginB"),
+            values["format.sepMarginT"],
+            values["format.sepMarginB"],
         )
 
-        bldObj.setBodyText(self._build.getBool("text.includeBodyText"))
-        bldObj.setSynopsis(self._build.getBool("text.includeSynopsis"))
-        bldObj.setComments(self._build.getBool("text.includeComments"))
-        bldObj.setKeywords(self._build.getBool("text.includeKeywords"))
-        bldObj.setIgnoredKeywords(self._build.getStr("text.ignoredKeywords"))
+        bldObj.setBodyText(values["text.includeBodyText"])
+        bldObj.setSynopsis(values["text.includeSynopsis"])
+        bldObj.setComments(values["text.includeComments"])
+        bldObj.setKeywords(values["text.includeKeywords"])
+        bldObj.setIgnoredKeywords(values["text.ignoredKeywords"])
 
         if isinstance(bldObj, ToHtml):
-            bldObj.setStyles(self._build.getBool("html.addStyles"))
-            bldObj.setReplaceUnicode(self._build.getBool("format.stripUnicode"))
+            bldObj.setStyles(values["html.addStyles"])
+            bldObj.setReplaceUnicode(values["format.stripUnicode"])
 
         if isinstance(bldObj, (ToOdt, ToDocX)):
             bldObj.setHeaderFormat(
-                self._build.getStr("doc.pageHeader"),
-                self._build.getInt("doc.pageCountOffset"),
+                values["doc.pageHeader"],
+                values["doc.pageCountOffset"],
             )
 
         if isinstance(bldObj, (ToOdt, ToDocX, ToQTextDocument)):
-            scale = nwLabels.UNIT_SCALE.get(self._build.getStr("format.pageUnit"), 1.0)
-            pW, pH = nwLabels.PAPER_SIZE.get(self._build.getStr("format.pageSize"), (-1.0, -1.0))
+            scale = nwLabels.UNIT_SCALE.get(values["format.pageUnit"], 1.0)
+            pW, pH = nwLabels.PAPER_SIZE.get(values["format.pageSize"], (-1.0, -1.0))
             bldObj.setPageLayout(
-                pW if pW > 0.0 else scale*self._build.getFloat("format.pageWidth"),
-                pH if pH > 0.0 else scale*self._build.getFloat("format.pageHeight"),
-                scale*self._build.getFloat("format.topMargin"),
-                scale*self._build.getFloat("format.bottomMargin"),
-                scale*self._build.getFloat("format.leftMargin"),
-                scale*self._build.getFloat("format.rightMargin"),
+                pW if pW > 0.0 else scale*values["format.pageWidth"],
+                pH if pH > 0.0 else scale*values["format.pageHeight"],
+                scale*values["format.topMargin"],
+                scale*values["format.bottomMargin"],
+                scale*values["format.leftMargin"],
+                scale*values["format.rightMargin"],
             )
 
-        filtered = self._build.buildItemFilter(
-            self._project, withRoots=self._build.getBool("text.addNoteHeadings")
-        )
-
-        return filtered
+        return
 
-    def _doBuild(self, bldObj: Tokenizer, tHandle: str, convert: bool = True) -> bool:
-        """Build a single document and add it to the build object."""
-        tItem = self._project.tree[tHandle]
+    def _doBuild(
+        self, chain: list[Tokenizer], tHandle: str, convert: bool = True, text: str | None = None
+    ) -> bool:
+        """Build a single document and add it to the build objects. The
+        first build object tokenizes the text, and passes the tokens on
+        to the other build objects in the chain.
+        """
+        bldObj = chain[0]
+        tItem = self._getItem(tHandle)
         if isinstance(tItem, NWItem):
             try:
                 if tItem.isRootType():
                     if tItem.isNovelLike():
                         bldObj.setBreakNext()
                     else:
-                        bldObj.addRootHeading(tHandle)
+                        bldObj.addRootHeading(tHandle, item=tItem)
                         if convert:
-                            bldObj.doConvert()
+                            for cvtObj in chain:
+                                cvtObj.doConvert()
                         if self._count:
                             bldObj.countStats()
                         if self._outline:
                             bldObj.buildOutline()
                 elif tItem.isFileType():
-                    bldObj.setText(tHandle)
-                    bldObj.doPreProcessing()
-                    bldObj.tokenizeText()
+                    measure = self._measure
+                    bldObj.setText(tHandle, text, item=tItem)
+                    with measure(tHandle, "preprocess"):
+                        bldObj.doPreProcessing()
+                    with measure(tHandle, "tokenize"):
+                        bldObj.tokenizeText()
                     if self._count:
-                        bldObj.countStats()
+                        with measure(tHandle, "count"):
+                            bldObj.countStats()
                     if self._outline:
-                        bldObj.buildOutline()
+                        with measure(tHandle, "outline"):
+                            bldObj.buildOutline()
                     if convert:
-                        bldObj.doConvert()
+                        with measure(tHandle, "convert"):
+                            for cvtObj in chain:
+                                cvtObj.doConvert()
 
             except Exception:
                 self._error = f"Build: Failed to build '{tHandle}'"
@@ -373,3 +658,164 @@ class NWBuildDocument:
                 return False
 
         return True
+
+    def _measure(self, key: str, stage: str) -> AbstractContextManager:
+        """Measure a build stage, if there is a report."""
+        return self._report.measure(key, stage) if self._report is not None else NO_MEASURE
+
+    def _countBlocks(self, key: str) -> AbstractContextManager:
+        """Count allocated memory blocks, if there is a report."""
+        if self._report is not None and key in self._report:
+            return self._report.countBlocks(key)
+        return NO_MEASURE
+
+
+class BuildProfile:
+    """Core: Compiled Build Profile
+
+    Holds the values of a build definition, and everything derived from
+    them and the project that is needed to set up the build objects, so
+    that it is only processed once per build. Profiles are cached per
+    build definition in the project, and reused by later builds as long
+    as the settings and the project values they depend on are unchanged.
+    """
+
+    __slots__ = ("_key", "_values", "_textFont", "_language", "_autoReplace")
+
+    def __init__(self, project: NWProject, build: BuildSettings) -> None:
+        self._key = self._profileKey(project, build)
+        self._values = build.getValues()
+        self._textFont = QFont(CONFIG.textFont)
+        self._textFont.fromString(self._values["format.textFont"])
+        self._language = project.data.language
+        self._autoReplace = compileAutoReplace(project.data.autoReplace)
+        return
+
+    @classmethod
+    def fromBuild(cls, project: NWProject, build: BuildSettings) -> BuildProfile:
+        """Return a cached profile for a build, or a new one if the
+        settings have changed since it was compiled.
+        """
+        profiles = project.buildProfiles
+        profile = profiles.get(build.buildID)
+        if profile is None or profile._key != cls._profileKey(project, build):
+            logger.debug("Compiling build profile for '%s'", build.name)
+            profile = cls(project, build)
+            profiles[build.buildID] = profile
+        return profile
+
+    ##
+    #  Properties
+    ##
+
+    @property
+    def values(self) -> dict[str, Any]:
+        """Return the type safe build settings values."""
+        return self._values
+
+    @property
+    def textFont(self) -> QFont:
+        """Return the text font of the build."""
+        return self._textFont
+
+    @property
+    def language(self) -> str | None:
+        """Return the project language."""
+        return self._language
+
+    @property
+    def autoReplace(self) -> Callable[[str], str] | None:
+        """Return the compiled project auto-replace function."""
+        return self._autoReplace
+
+    ##
+    #  Internal Functions
+    ##
+
+    @staticmethod
+    def _profileKey(project: NWProject, build: BuildSettings) -> tuple:
+        """Return a key of everything the profile depends on."""
+        return (
+            build.settingsDigest(), CONFIG.textFont.toString(),
+            project.data.language, tuple(project.data.autoReplace.items()),
+        )
+
+
+class BuildSnapshot(NamedTuple):
+
+    filtered: dict[str, tuple[bool, FilterMode]]
+    items: dict[str, NWItem]
+    texts: dict[str, str]
+    refs: dict[tuple[str, int, str], list[str]]
+
+
+class BackgroundBuild(QRunnable):
+    """Core: Background Build Runnable
+
+    Runs one of the NWBuildDocument build iterators in the thread pool,
+    off the main GUI thread. The project data the build needs is copied
+    when the runnable is created, so the build doesn't touch the project
+    while it runs. The build can be cancelled between documents. A
+    QTextDocument generated by the build is handed over to the thread
+    that created the runnable when the build ends. Once started, the
+    runnable is owned by the thread pool, so the signals carry the
+    build object for the receivers to identify the build by.
+    """
+
+    def __init__(self, docBuild: NWBuildDocument, builder: Iterable[tuple[int, bool]]) -> None:
+        super().__init__()
+        docBuild.takeSnapshot()
+        self._docBuild = docBuild
+        self._builder = builder
+        self._thread = QThread.currentThread()
+        self._cancelled = False
+        self._finished = False
+        self.signals = BackgroundBuildSignals()
+        return
+
+    @property
+    def docBuild(self) -> NWBuildDocument:
+        """Return the document build object."""
+        return self._docBuild
+
+    def isCancelled(self) -> bool:
+        """Check if the build was cancelled or failed."""
+        return self._cancelled
+
+    def isFinished(self) -> bool:
+        """Check if the build has ended, whether it completed or not."""
+        return self._finished
+
+    def cancel(self) -> None:
+        """Stop the build before the next document."""
+        self._cancelled = True
+        return
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Run the build iterator and report progress."""
+        try:
+            for step, _ in self._builder:
+                if self._cancelled:
+                    break
+                self.signals.buildProgress.emit(self._docBuild, step + 1)
+            if isinstance(self._builder, Generator):
+                # Make sure a cancelled build is cleaned up on this thread
+                self._builder.close()
+            if isinstance(buildObj := self._docBuild.lastBuild, ToQTextDocument):
+                buildObj.document.moveToThread(self._thread)
+        except Exception:
+            logger.error("Background build failed")
+            logException()
+            self._cancelled = True
+        self._finished = True
+        self.signals.buildDone.emit(self._docBuild, not self._cancelled)
+        return
+
+
+class BackgroundBuildSignals(QObject):
+    """The QRunnable cannot emit a signal, so we need a simple QObject
+    to hold the build signals.
+    """
+    buildProgress = pyqtSignal(object, int)
+    buildDone = pyqtSignal(object, bool)
@@ -85,6 +85,11 @@ class NWDocument:
         """Check if the file hash has changed outside of novelWriter."""
         return self._hashError
 
+    @property
+    def lastHash(self) -> str:
+        """Return the hash of the text last read or written."""
+        return self._lastHash
+
     @property
     def fileLocation(self) -> str:
         """Return the file location of the current document."""
@@ -109,6 +114,11 @@ class NWDocument:
     #  Static Methods
     ##
 
+    @staticmethod
+    def textHash(text: str) -> str:
+        """Return the hash of a document text."""
+        return hashlib.sha1(text.encode()).hexdigest()
+
     @staticmethod
     def quickReadText(content: Path, tHandle: str) -> str:
         """Return the text of a document in a fast and efficient way."""
@@ -196,7 +206,7 @@ class NWDocument:
             # document and return an empty text string.
             logger.debug("The requested document does not exist")
 
-        self._lastHash = hashlib.sha1(text.encode()).hexdigest()
+        self._lastHash = self.textHash(text)
 
         return text
 
@@ -230,7 +240,7 @@ class NWDocument:
             return False
 
         currTime = formatTimeStamp(time())
-        writeHash = hashlib.sha1(text.encode()).hexdigest()
+        writeHash = self.textHash(text)
         createdDate = self._docMeta.get("created", "Unknown")
         updatedDate = self._docMeta.get("updated", "Unknown")
         if writeHash != self._lastHash:
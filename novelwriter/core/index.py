@@ -8,6 +8,7 @@ Created: 2022-05-28 [2.0rc1] IndexItem
 Created: 2022-05-28 [2.0rc1] IndexHeading
 Created: 2022-05-29 [2.0rc1] TagsIndex
 Created: 2022-05-29 [2.0rc1] ItemIndex
+Created: 2026-10-19 [2.6b2]  TextIndex
 
 This file is a part of novelWriter
 Copyright (C) 2019 Veronica Berglyd Olsen and novelWriter contributors
@@ -27,20 +28,26 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import bisect
 import json
 import logging
 import random
+import re
+import sys
 
+from array import array
 from collections.abc import ItemsView, Iterable
+from itertools import accumulate, chain
 from pathlib import Path
 from time import time
 from typing import TYPE_CHECKING, Literal
 
-from novelwriter import SHARED
+from novelwriter import CONFIG, SHARED
 from novelwriter.common import (
     checkInt, isHandle, isItemClass, isListInstance, isTitleTag, jsonEncode
 )
 from novelwriter.constants import nwFiles, nwKeyWords, nwStyles
+from novelwriter.core.document import NWDocument
 from novelwriter.enum import nwComment, nwItemClass, nwItemLayout, nwItemType
 from novelwriter.error import logException
 from novelwriter.text.counting import standardCounter
@@ -57,6 +64,8 @@ TT_NONE = "T0000"  # Default title key
 MAX_RETRY = 1000  # Key generator recursion limit
 KEY_SOURCE = "0123456789bcdfghjklmnpqrstvwxz"
 NOTE_TYPES: list[T_NoteTypes] = ["footnotes", "comments"]
+RX_WORD = re.compile(r"\w+")  # Words of the text index
+FOLD_TURKISH = {0x0130: "i", 0x0131: "i"}  # Dotted and dotless i
 
 
 class NWIndex:
@@ -79,6 +88,13 @@ class NWIndex:
     TagsIndex class. This is duplicate information used for quicker
     lookups from the tags and back to items where they are defined.
 
+    An optional word index of the text of all documents is contained in
+    a single instance of the TextIndex class. It is used by the project
+    search, and is loaded by a TextIndexLoader, which can run outside
+    the GUI thread, the first time it is needed. From then on, it is
+    kept up to date when documents are scanned, and it is cached in its
+    own file in the project meta data folder.
+
     The index data is cached in a JSON file between writing sessions in
     order to save startup time. The cached index is validated on input,
     and a broken flag set if it is not valid. If it is invalid, the
@@ -93,6 +109,10 @@ class NWIndex:
         # Storage and State
         self._tagsIndex = TagsIndex()
         self._itemIndex = ItemIndex(project)
+        self._textIndex = TextIndex()
+        self._textReady = False
+        self._textDirty: set[str] = set()
+        self._textGen = 0
         self._indexBroken = False
 
         # TimeStamps
@@ -120,6 +140,10 @@ class NWIndex:
         """Clear the index dictionaries and time stamps."""
         self._tagsIndex.clear()
         self._itemIndex.clear()
+        self._textIndex.clear()
+        self._textReady = False
+        self._textDirty = set()
+        self._textGen += 1
         self._indexChange = 0.0
         self._rootChange = {}
         SHARED.emitIndexCleared(self._project)
@@ -128,6 +152,7 @@ class NWIndex:
     def rebuild(self) -> None:
         """Rebuild the entire index from scratch."""
         self.clear()
+        self._textReady = CONFIG.searchIndex
         for nwItem in self._project.tree:
             if nwItem.isFileType():
                 text = self._project.storage.getDocumentText(nwItem.itemHandle)
@@ -143,6 +168,9 @@ class NWIndex:
         for tTag in delTags:
             del self._tagsIndex[tTag]
         del self._itemIndex[tHandle]
+        del self._textIndex[tHandle]
+        if not self._textReady:
+            self._textDirty.add(tHandle)
         SHARED.emitIndexChangedTags(self._project, [], delTags)
         return
 
@@ -215,9 +243,11 @@ class NWIndex:
 
         return True
 
-    def saveIndex(self) -> bool:
+    def saveIndex(self, autoSave: bool = False) -> bool:
         """Save the current index as a json file in the project meta
-        data folder.
+        data folder. The text index is not saved on auto save, as it is
+        slow to write for large projects, and stale entries are updated
+        when it is loaded.
         """
         indexFile = self._project.storage.getMetaFile(nwFiles.INDEX_FILE)
         if not isinstance(indexFile, Path):
@@ -242,18 +272,77 @@ class NWIndex:
 
         logger.debug("Index saved in %.3f ms", (time() - tStart)*1000)
 
+        return autoSave or self._saveTextIndex()
+
+    def getTextIndex(self) -> TextIndex | None:
+        """Return the text index, or None if it is turned off or not
+        loaded yet.
+        """
+        if not CONFIG.searchIndex:
+            self._textIndex.clear()
+            self._textReady = False
+            return None
+        return self._textIndex if self._textReady else None
+
+    def textIndexLoader(self) -> TextIndexLoader | None:
+        """Return a loader for the text index, or None if it is turned
+        off or already loaded. Documents scanned or deleted from here on
+        are updated when the loaded index is set.
+        """
+        if not CONFIG.searchIndex or self._textReady:
+            return None
+        handles = [n.itemHandle for n in self._project.tree if n.isFileType()]
+        self._textDirty = set()
+        return TextIndexLoader(self._project, handles, self._textGen)
+
+    def setTextIndex(self, loader: TextIndexLoader) -> bool:
+        """Take the text index from a loader that has finished. The
+        documents that have been scanned or deleted since the loader
+        was made are updated. A loader from before the index was last
+        cleared is ignored.
+        """
+        textIndex = loader.textIndex
+        if (
+            textIndex is None or loader.generation != self._textGen
+            or self._textReady or not CONFIG.searchIndex
+        ):
+            return False
+        storage = self._project.storage
+        for tHandle in self._textDirty:
+            if (nwItem := self._project.tree[tHandle]) and nwItem.isFileType():
+                stamp = storage.getDocumentStamp(tHandle)
+                textIndex.scanText(tHandle, storage.getDocumentText(tHandle))
+                textIndex.setStamp(tHandle, stamp)
+            else:
+                del textIndex[tHandle]
+        self._textIndex = textIndex
+        self._textDirty = set()
+        self._textReady = True
         return True
 
+    def loadTextIndex(self) -> None:
+        """Load the text index on the calling thread, if it isn't
+        already loaded.
+        """
+        if loader := self.textIndexLoader():
+            loader.run()
+            self.setTextIndex(loader)
+        return
+
     ##
     #  Index Building
     ##
 
-    def scanText(self, tHandle: str, text: str, blockSignal: bool = False) -> bool:
+    def scanText(
+        self, tHandle: str, text: str, blockSignal: bool = False,
+        counts: tuple[int, int, int] | None = None
+    ) -> bool:
         """Scan a piece of text associated with a handle. This will
         update the indices accordingly. This function takes the handle
         and text as separate inputs as we want to primarily scan the
         files before we save them, in which case we already have the
-        text.
+        text. If the caller already knows the character, word and
+        paragraph counts of the text, they can be passed as well.
         """
         tItem = self._project.tree[tHandle]
         if tItem is None:
@@ -268,11 +357,16 @@ class NWIndex:
         self._itemIndex.add(tHandle, tItem)
 
         # Run word counter for the whole text
-        cC, wC, pC = standardCounter(text)
+        cC, wC, pC = standardCounter(text) if counts is None else counts
         tItem.setCharCount(cC)
         tItem.setWordCount(wC)
         tItem.setParaCount(pC)
 
+        if self._textReady:
+            self._textIndex.scanText(tHandle, text)
+        else:
+            self._textDirty.add(tHandle)
+
         # If the file's meta data is missing, or the file is out of the
         # main project, we don't index the content
         if tItem.itemLayout == nwItemLayout.NO_LAYOUT:
@@ -297,6 +391,40 @@ class NWIndex:
 
         return True
 
+    ##
+    #  Internal Functions
+    ##
+
+    def _saveTextIndex(self) -> bool:
+        """Save the text index to the project meta data folder if it has
+        changed. If it is turned off, any old cache file is removed. If
+        it was never loaded in this session, the cache file is kept. The
+        documents scanned in this session are stamped with the size and
+        modification time of their files, which have been saved by now.
+        """
+        textFile = self._project.storage.getMetaFile(nwFiles.TEXT_INDEX)
+        if not isinstance(textFile, Path):
+            return False
+
+        try:
+            if not CONFIG.searchIndex:
+                textFile.unlink(missing_ok=True)
+            elif self._textReady and self._textIndex.changed:
+                logger.debug("Saving text index file")
+                storage = self._project.storage
+                for tHandle in self._textIndex.unstamped():
+                    self._textIndex.setStamp(tHandle, storage.getDocumentStamp(tHandle))
+                data = json.dumps(self._textIndex.packData(), separators=(",", ":"))
+                with open(textFile, mode="w", encoding="utf-8") as outFile:
+                    outFile.write(data)
+                self._textIndex.resetChangedState()
+        except Exception:
+            logger.error("Failed to save text index file")
+            logException()
+            return False
+
+        return True
+
     ##
     #  Internal Indexer Helpers
     ##
@@ -681,6 +809,13 @@ class NWIndex:
         name = None if itemClass is None else itemClass.name
         return self._tagsIndex.filterTagNames(name)
 
+    def matchClassTags(self, itemClass: nwItemClass | None, lookup: str, count: int) -> list[str]:
+        """Return up to count tags based on itemClass that match a lookup
+        string, with prefix matches first.
+        """
+        name = None if itemClass is None else itemClass.name
+        return self._tagsIndex.matchTagNames(name, lookup, count)
+
     def getTagsData(
         self, activeOnly: bool = True
     ) -> Iterable[tuple[str, str, str, IndexItem | None, IndexHeading | None]]:
@@ -712,20 +847,24 @@ class TagsIndex:
 
     A wrapper class that holds the reverse lookup tags index. This is
     just a simple wrapper around a single dictionary to keep tighter
-    control of the keys.
+    control of the keys. The keys are also kept in sorted lists, one
+    per class and one for all classes, for fast lookup by prefix.
     """
 
-    __slots__ = ("_tags")
+    __slots__ = ("_tags", "_sorted")
 
     def __init__(self) -> None:
         self._tags: dict[str, dict[str, str]] = {}
+        self._sorted: dict[str | None, list[str]] = {None: []}
         return
 
     def __contains__(self, tagKey: str) -> bool:
         return tagKey.lower() in self._tags
 
     def __delitem__(self, tagKey: str) -> None:
-        self._tags.pop(tagKey.lower(), None)
+        key = tagKey.lower()
+        if (entry := self._tags.pop(key, None)) is not None:
+            self._removeSorted(key, entry["class"])
         return
 
     def __getitem__(self, tagKey: str) -> dict | None:
@@ -738,6 +877,7 @@ class TagsIndex:
     def clear(self) -> None:
         """Clear the index."""
         self._tags = {}
+        self._sorted = {None: []}
         return
 
     def items(self) -> ItemsView:
@@ -747,7 +887,13 @@ class TagsIndex:
     def add(self, tagKey: str, displayName: str, tHandle: str,
             sTitle: str, className: str) -> None:
         """Add a key to the index and set all values."""
-        self._tags[tagKey.lower()] = {
+        key = tagKey.lower()
+        if (entry := self._tags.get(key)) is None:
+            self._insertSorted(key, className)
+        elif entry["class"] != className:
+            self._removeSorted(key, entry["class"])
+            self._insertSorted(key, className)
+        self._tags[key] = {
             "name": tagKey,
             "display": displayName or tagKey,
             "handle": tHandle,
@@ -777,15 +923,29 @@ class TagsIndex:
         return self._tags.get(tagKey.lower(), {}).get("class", None)
 
     def filterTagNames(self, className: str | None) -> list[str]:
-        """Get a list of tag names for a given class."""
-        if className is None:
-            return [
-                x.get("name", "") for x in self._tags.values()
-            ]
-        else:
-            return [
-                x.get("name", "") for x in self._tags.values() if x.get("class", "") == className
-            ]
+        """Get a sorted list of tag names for a given class."""
+        return [self._tags[x]["name"] for x in self._sorted.get(className, [])]
+
+    def matchTagNames(self, className: str | None, lookup: str, count: int) -> list[str]:
+        """Get up to count tag names for a given class matching a lookup
+        string, ignoring case. Tags starting with the lookup string are
+        ranked first, followed by tags containing it elsewhere.
+        """
+        keys = self._sorted.get(className, [])
+        lookup = lookup.lower()
+        idx = bisect.bisect_left(keys, lookup)
+        result = []
+        for key in keys[idx:idx+count]:
+            if not key.startswith(lookup):
+                break
+            result.append(key)
+        if lookup and len(result) < count:
+            for key in keys:
+                if lookup in key and not key.startswith(lookup):
+                    result.append(key)
+                    if len(result) >= count:
+                        break
+        return [self._tags[x]["name"] for x in result]
 
     ##
     #  Pack/Unpack
@@ -795,11 +955,29 @@ class TagsIndex:
         """Pack all the data of the tags into a single dictionary."""
         return self._tags
 
+    ##
+    #  Internal Functions
+    ##
+
+    def _insertSorted(self, key: str, className: str) -> None:
+        """Insert a key in the sorted lists."""
+        bisect.insort(self._sorted[None], key)
+        bisect.insort(self._sorted.setdefault(className, []), key)
+        return
+
+    def _removeSorted(self, key: str, className: str) -> None:
+        """Remove a key from the sorted lists."""
+        for keys in (self._sorted[None], self._sorted.get(className, [])):
+            idx = bisect.bisect_left(keys, key)
+            if idx < len(keys) and keys[idx] == key:
+                del keys[idx]
+        return
+
     def unpackData(self, data: dict) -> None:
         """Iterate through the tagsIndex loaded from cache and check
         that it's valid.
         """
-        self._tags = {}
+        self.clear()
         if not isinstance(data, dict):
             raise ValueError("tagsIndex is not a dict")
 
@@ -1345,6 +1523,307 @@ class IndexHeading:
         return
 
 
+# The Text Index Object
+# =====================
+
+class TextIndex:
+    """Core: Text Index Wrapper Class
+
+    A word level reverse lookup index of the text of all documents, used
+    by the project search. The words are the runs of word characters in
+    the text, case folded. For each document, the positions where each
+    word starts are kept in a single array, grouped by word, with the
+    words mapping to their slots in an array of offsets. The hash of the
+    text of each document is recorded when it is scanned, and the size
+    and modification time of its file when it is saved, so that stale
+    entries can be detected when the index is loaded from cache.
+    """
+
+    __slots__ = ("_items", "_vocab", "_hashes", "_stamps", "_changed")
+
+    def __init__(self) -> None:
+        self._items: dict[str, tuple[dict[str, int], array[int], array[int]]] = {}
+        self._vocab: dict[str, int] = {}
+        self._hashes: dict[str, str] = {}
+        self._stamps: dict[str, list[int]] = {}
+        self._changed = False
+        return
+
+    def __contains__(self, tHandle: str) -> bool:
+        return tHandle in self._items
+
+    def __delitem__(self, tHandle: str) -> None:
+        if (entry := self._items.pop(tHandle, None)) is not None:
+            for word in entry[0]:
+                if self._vocab[word] > 1:
+                    self._vocab[word] -= 1
+                else:
+                    del self._vocab[word]
+            self._hashes.pop(tHandle, None)
+            self._stamps.pop(tHandle, None)
+            self._changed = True
+        return
+
+    ##
+    #  Properties
+    ##
+
+    @property
+    def changed(self) -> bool:
+        """The changed status of the index."""
+        return self._changed
+
+    ##
+    #  Methods
+    ##
+
+    def clear(self) -> None:
+        """Clear the index."""
+        self._items = {}
+        self._vocab = {}
+        self._hashes = {}
+        self._stamps = {}
+        self._changed = False
+        return
+
+    def resetChangedState(self) -> None:
+        """Reset the changed status of the index. This must be called
+        when the index has been saved.
+        """
+        self._changed = False
+        return
+
+    def handles(self) -> list[str]:
+        """Return the handles of all indexed documents."""
+        return list(self._items)
+
+    def unstamped(self) -> list[str]:
+        """Return the handles of the documents without a file stamp."""
+        return [tHandle for tHandle in self._items if tHandle not in self._stamps]
+
+    def isStamped(self, tHandle: str, stamp: list[int]) -> bool:
+        """Check if a document is indexed from a file with the stamp."""
+        return bool(stamp) and self._stamps.get(tHandle) == stamp
+
+    def setStamp(self, tHandle: str, stamp: list[int]) -> None:
+        """Set the size and modification time of the file a document
+        was indexed from.
+        """
+        if tHandle in self._items and stamp:
+            self._stamps[tHandle] = stamp
+            self._changed = True
+        return
+
+    def scanText(self, tHandle: str, text: str) -> None:
+        """Replace the words of a document in the index. If case folding
+        doesn't change the length of the text, the words are found in
+        the folded text, which is faster than folding each word.
+        """
+        words: dict[str, list[int]] = {}
+        if len(folded := self.foldWord(text)) == len(text):
+            for match in RX_WORD.finditer(folded):
+                words.setdefault(match.group(), []).append(match.start())
+        else:
+            for match in RX_WORD.finditer(text):
+                words.setdefault(self.foldWord(match.group()), []).append(match.start())
+        self._addItem(
+            tHandle, NWDocument.textHash(text), list(words),
+            [len(p) for p in words.values()], chain.from_iterable(words.values())
+        )
+        return
+
+    @staticmethod
+    def foldWord(word: str) -> str:
+        """Return the case folded form of a word. The Turkish dotted and
+        dotless i are folded to i, as RegEx case insensitive matching
+        treats them as the same letter.
+        """
+        return word.translate(FOLD_TURKISH).casefold()
+
+    def isCurrent(self, tHandle: str, text: str) -> bool:
+        """Check if a document is indexed with its current text."""
+        return self._hashes.get(tHandle) == NWDocument.textHash(text)
+
+    def matchWords(self, word: str, whole: bool = False) -> list[str]:
+        """Return the indexed words that are equal to, or contain, a
+        case folded word.
+        """
+        if whole:
+            return [word] if word in self._vocab else []
+        return [key for key in self._vocab if word in key]
+
+    def findHandles(self, words: list[str]) -> set[str]:
+        """Find the documents where any of the words are indexed."""
+        return {
+            tHandle for tHandle, (slots, _, _) in self._items.items()
+            if any(word in slots for word in words)
+        } if words else set()
+
+    def findPositions(self, words: list[str]) -> dict[str, list[int]]:
+        """Find the start positions of the words in each document where
+        any of them are indexed. The positions are sorted.
+        """
+        result: dict[str, list[int]] = {}
+        for tHandle, (slots, offsets, positions) in self._items.items():
+            for word in words:
+                if (slot := slots.get(word)) is not None:
+                    result.setdefault(tHandle, []).extend(
+                        positions[offsets[slot]:offsets[slot+1]]
+                    )
+        if len(words) > 1:
+            for found in result.values():
+                found.sort()
+        return result
+
+    ##
+    #  Pack/Unpack
+    ##
+
+    def packData(self) -> dict:
+        """Pack the index into a dictionary. For each document, the
+        positions are stored with the number of positions of each word.
+        """
+        data = {}
+        for tHandle, (slots, offsets, positions) in self._items.items():
+            data[tHandle] = {
+                "hash": self._hashes[tHandle],
+                "stamp": self._stamps.get(tHandle, []),
+                "words": list(slots),
+                "sizes": [b - a for a, b in zip(offsets, offsets[1:])],
+                "positions": positions.tolist(),
+            }
+        return data
+
+    def unpackData(self, data: dict) -> None:
+        """Iterate through the text index loaded from cache and check
+        that it's valid.
+        """
+        self.clear()
+        if not isinstance(data, dict):
+            raise ValueError("textIndex is not a dict")
+
+        for tHandle, entry in data.items():
+            if not isHandle(tHandle):
+                raise ValueError("textIndex keys must be handles")
+            if not isinstance(entry, dict):
+                raise ValueError("textIndex entry is not a dict")
+
+            textHash = entry.get("hash")
+            stamp = entry.get("stamp", [])
+            words = entry.get("words")
+            sizes = entry.get("sizes")
+            positions = entry.get("positions")
+            if not isinstance(textHash, str):
+                raise ValueError("textIndex hash must be a string")
+            if not isListInstance(stamp, int):
+                raise ValueError("textIndex stamp must be a list of integers")
+            if not isListInstance(words, str):
+                raise ValueError("textIndex words must be a list of strings")
+            if not (isListInstance(sizes, int) and len(sizes) == len(words)):
+                raise ValueError("textIndex sizes must be an integer per word")
+            if not (isListInstance(positions, int) and len(positions) == sum(sizes)):
+                raise ValueError("textIndex positions must be a list of integers")
+
+            self._addItem(tHandle, textHash, words, sizes, positions)
+            if stamp:
+                self._stamps[tHandle] = stamp
+
+        self._changed = False
+
+        return
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _addItem(
+        self, tHandle: str, textHash: str, words: list[str],
+        sizes: list[int], positions: Iterable[int]
+    ) -> None:
+        """Replace the entry of a document with new words, and their
+        number of positions and grouped positions.
+        """
+        del self[tHandle]
+        slots = {sys.intern(word): slot for slot, word in enumerate(words)}
+        for word in slots:
+            self._vocab[word] = self._vocab.get(word, 0) + 1
+        self._items[tHandle] = (
+            slots, array("I", accumulate(sizes, initial=0)), array("I", positions)
+        )
+        self._hashes[tHandle] = textHash
+        self._changed = True
+        return
+
+
+class TextIndexLoader:
+    """Core: Text Index Loader Class
+
+    Loads the text index from the cache file, and brings it up to date
+    with the documents. A document is only read if its file doesn't
+    match the stamp in the cache, and only scanned if its text has
+    changed. The documents are listed when the loader is made, so that
+    running it doesn't touch the project tree, and it can be run in
+    another thread. The result is handed to the project index with
+    NWIndex.setTextIndex.
+    """
+
+    __slots__ = ("_project", "_handles", "_generation", "_textIndex")
+
+    def __init__(self, project: NWProject, handles: list[str], generation: int) -> None:
+        self._project = project
+        self._handles = handles
+        self._generation = generation
+        self._textIndex: TextIndex | None = None
+        return
+
+    @property
+    def generation(self) -> int:
+        """The index generation the loader was made for."""
+        return self._generation
+
+    @property
+    def textIndex(self) -> TextIndex | None:
+        """The loaded text index, if the loader has run."""
+        return self._textIndex
+
+    def run(self) -> None:
+        """Load and update the text index."""
+        tStart = time()
+        storage = self._project.storage
+        textIndex = TextIndex()
+        textFile = storage.getMetaFile(nwFiles.TEXT_INDEX)
+        if isinstance(textFile, Path) and textFile.exists():
+            logger.debug("Loading text index file")
+            try:
+                with open(textFile, mode="r", encoding="utf-8") as inFile:
+                    textIndex.unpackData(json.load(inFile))
+            except Exception:
+                logger.error("Failed to load text index file")
+                logException()
+                textIndex.clear()
+
+        handles = set(self._handles)
+        for tHandle in self._handles:
+            # The stamp is taken before the text is read, so a file that
+            # is saved in between is read again next time
+            stamp = storage.getDocumentStamp(tHandle)
+            if textIndex.isStamped(tHandle, stamp):
+                continue
+            text = storage.getDocumentText(tHandle)
+            if not textIndex.isCurrent(tHandle, text):
+                textIndex.scanText(tHandle, text)
+            textIndex.setStamp(tHandle, stamp)
+
+        for tHandle in textIndex.handles():
+            if tHandle not in handles:
+                del textIndex[tHandle]
+
+        self._textIndex = textIndex
+        logger.debug("Text index loaded in %.3f ms", (time() - tStart)*1000)
+
+        return
+
+
 # Text Processing Functions
 # =========================
 
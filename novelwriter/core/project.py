@@ -52,6 +52,7 @@ from novelwriter.error import logException
 
 if TYPE_CHECKING:  # pragma: no cover
     # Requires Python 3.10
+    from novelwriter.core.docbuild import BuildProfile
     from novelwriter.core.status import T_StatusKind, T_UpdateEntry
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,7 @@ class NWProject:
 
     __slots__ = (
         "_options", "_storage", "_data", "_tree", "_index", "_session",
-        "_langData", "_changed", "_valid", "_state", "tr",
+        "_langData", "_changed", "_valid", "_state", "_profiles", "tr",
     )
 
     def __init__(self) -> None:
@@ -88,6 +89,9 @@ class NWProject:
         self._valid    = False  # The project was successfully loaded
         self._state    = NWProjectState.UNKNOWN
 
+        # Build Cache
+        self._profiles: dict[str, BuildProfile] = {}  # Compiled build profiles
+
         # Internal Mapping
         self.tr = partial(QCoreApplication.translate, "NWProject")
 
@@ -133,6 +137,11 @@ class NWProject:
     def session(self) -> NWSessionLog:
         return self._session
 
+    @property
+    def buildProfiles(self) -> dict[str, BuildProfile]:
+        """Return the compiled build profiles, by build ID."""
+        return self._profiles
+
     @property
     def projOpened(self) -> float:
         return self._session.start
@@ -416,7 +425,7 @@ class NWProject:
 
         # Save other project data
         self._options.saveSettings()
-        self._index.saveIndex()
+        self._index.saveIndex(autoSave=autoSave)
         self._storage.runPostSaveTasks(autoSave=autoSave)
 
         # Update recent projects
@@ -434,6 +443,7 @@ class NWProject:
         """Close the project."""
         logger.info("Closing project")
         self._index.clear()  # Triggers clear signal, see #1718
+        self._profiles.clear()
         self._options.saveSettings()
         self._tree.writeToCFile()
         self._session.appendSession(idleTime)
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 
 from collections.abc import Iterator
 from pathlib import Path
@@ -47,14 +48,30 @@ class NWSpellEnchant:
 
     This is a rapper class for Enchant to keep the API consistent
     between spell check tools.
+
+    Lookups are cached since the same words are checked over and over
+    again when text is highlighted. The caches are bounded, and the
+    oldest entries are dropped first. They are cleared when the
+    language changes or a word is added.
+
+    Words may be checked from a worker thread, so lookups in the
+    dictionary and changes to the caches are serialised by a lock.
     """
 
+    CHECK_CACHE = 50000
+    SUGGEST_CACHE = 500
+
     def __init__(self, project: NWProject) -> None:
         self._project = project
         self._enchant = FakeEnchant()
         self._userDict = UserDictionary(project)
         self._language = None
         self._broker = None
+        self._lock = threading.Lock()
+        self._checked: dict[str, bool] = {}
+        self._suggested: dict[str, list[str]] = {}
+        self._hits = 0
+        self._misses = 0
         logger.debug("Ready: NWSpellEnchant")
         return
 
@@ -70,6 +87,14 @@ class NWSpellEnchant:
     def spellLanguage(self) -> str | None:
         return self._language
 
+    @property
+    def cacheStats(self) -> tuple[int, int, float]:
+        """Return the number of word check cache hits and misses, and
+        the hit rate.
+        """
+        total = self._hits + self._misses
+        return self._hits, self._misses, self._hits/total if total else 0.0
+
     ##
     #  Setters
     ##
@@ -79,18 +104,22 @@ class NWSpellEnchant:
         If that fails, we load a mock dictionary so that lookups don't
         crash. Note that enchant will allow loading an empty string as
         a tag, but this will fail later on. See issue #1096.
+
+        The new dictionary is loaded and primed with the user words
+        before it replaces the current one, since the current one may
+        be in use by a worker thread.
         """
-        self._enchant = FakeEnchant()
-        self._broker = None
-        self._language = None
+        checker = FakeEnchant()
+        broker = None
+        loaded = None
 
         try:
             import enchant
 
             if language and enchant.dict_exists(language):
-                self._broker = enchant.Broker()
-                self._enchant = self._broker.request_dict(language)
-                self._language = language
+                broker = enchant.Broker()
+                checker = broker.request_dict(language)
+                loaded = language
                 logger.debug("Enchant spell checking for language '%s' loaded", language)
             else:
                 logger.warning("Enchant found no dictionary for language '%s'", language)
@@ -98,12 +127,18 @@ class NWSpellEnchant:
         except Exception:
             logger.error("Failed to load enchant spell checking for language '%s'", language)
 
-        if self._enchant is None:
-            self._enchant = FakeEnchant()
+        if checker is None:
+            checker = FakeEnchant()
         else:
             self._userDict.load()
             for word in self._userDict:
-                self._enchant.add_to_session(word)
+                checker.add_to_session(word)
+
+        with self._lock:
+            self._enchant = checker
+            self._broker = broker
+            self._language = loaded
+            self._resetCache()
 
         return
 
@@ -113,29 +148,62 @@ class NWSpellEnchant:
 
     def checkWord(self, word: str) -> bool:
         """Wrapper function for pyenchant."""
-        try:
-            return bool(self._enchant.check(word))
-        except Exception:
-            return True
+        with self._lock:
+            if (result := self._checked.get(word)) is not None:
+                self._hits += 1
+                return result
+            self._misses += 1
+            try:
+                result = bool(self._enchant.check(word))
+            except Exception:
+                return True
+            if len(self._checked) >= self.CHECK_CACHE:
+                del self._checked[next(iter(self._checked))]
+            self._checked[word] = result
+        return result
+
+    def lookupWord(self, word: str) -> bool | None:
+        """Look up a word in the cache only, and return None if it has
+        not been checked.
+        """
+        with self._lock:
+            if (result := self._checked.get(word)) is not None:
+                self._hits += 1
+        return result
 
     def suggestWords(self, word: str) -> list[str]:
         """Wrapper function for pyenchant."""
-        try:
-            return self._enchant.suggest(word)
-        except Exception:
-            return []
+        with self._lock:
+            if (result := self._suggested.get(word)) is not None:
+                return list(result)
+            try:
+                result = list(self._enchant.suggest(word))
+            except Exception:
+                return []
+            if len(self._suggested) >= self.SUGGEST_CACHE:
+                del self._suggested[next(iter(self._suggested))]
+            self._suggested[word] = result
+        return list(result)
 
     def addWord(self, word: str, save: bool = True) -> None:
         """Add a word to the project dictionary."""
         if word := word.strip():
             try:
-                self._enchant.add_to_session(word)
+                with self._lock:
+                    self._enchant.add_to_session(word)
             except Exception:
                 return
+            self.clearCache()
             if save and self._userDict.add(word):
                 self._userDict.save()
         return
 
+    def clearCache(self) -> None:
+        """Clear the lookup caches and their stats."""
+        with self._lock:
+            self._resetCache()
+        return
+
     def listDictionaries(self) -> list[tuple[str, str]]:
         """List available dictionaries."""
         lang = []
@@ -159,6 +227,26 @@ class NWSpellEnchant:
             name = ""
         return tag, name
 
+    ##
+    #  Internal Functions
+    ##
+
+    def _resetCache(self) -> None:
+        """Clear the lookup caches and their stats. The caller must
+        hold the lock.
+        """
+        if self._hits or self._misses:
+            hits, misses, rate = self.cacheStats
+            logger.debug(
+                "Spell check cache cleared after %d hits and %d misses (%.1f %%)",
+                hits, misses, 100.0*rate
+            )
+        self._checked.clear()
+        self._suggested.clear()
+        self._hits = 0
+        self._misses = 0
+        return
+
 
 class FakeEnchant:
     """Fallback for when Enchant is selected, but not installed."""
@@ -294,6 +294,18 @@ class NWStorage:
             return NWDocument.quickReadText(self._runtimePath / "content", tHandle)
         return ""
 
+    def getDocumentStamp(self, tHandle: str) -> list[int]:
+        """Return the size and modification time of a document file, or
+        an empty list if it doesn't exist.
+        """
+        if isinstance(self._runtimePath, Path):
+            try:
+                stat = (self._runtimePath / "content" / f"{tHandle}.nwd").stat()
+                return [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                pass
+        return []
+
     def scanContent(self) -> list[str]:
         """Scan the content folder and return the handle of all files
         found in it. Files that do not match the pattern are ignored.
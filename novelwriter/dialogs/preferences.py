@@ -301,6 +301,14 @@ class GuiPreferences(NDialog):
             self.tr("How often the project is automatically saved."), unit=self.tr("seconds")
         )
 
+        # Search Index
+        self.searchIndex = NSwitch(self)
+        self.searchIndex.setChecked(CONFIG.searchIndex)
+        self.mainForm.addRow(
+            self.tr("Save a search index with the project"), self.searchIndex,
+            self.tr("Makes project search faster, but uses more memory and disk space.")
+        )
+
         # Project Backup
         # ==============
 
@@ -489,6 +497,18 @@ class GuiPreferences(NDialog):
             self.tr("Show line endings"), self.showLineEndings
         )
 
+        # Large Document Limit
+        self.largeDocLimit = NSpinBox(self)
+        self.largeDocLimit.setMinimum(10000)
+        self.largeDocLimit.setMaximum(10000000)
+        self.largeDocLimit.setSingleStep(10000)
+        self.largeDocLimit.setValue(CONFIG.largeDocLimit)
+        self.mainForm.addRow(
+            self.tr("Large document size"), self.largeDocLimit,
+            self.tr("Larger documents are highlighted and counted in the background."),
+            unit=self.tr("characters")
+        )
+
         # Editor Scrolling
         # ================
 
@@ -930,6 +950,7 @@ class GuiPreferences(NDialog):
         # Auto Save
         CONFIG.autoSaveDoc  = self.autoSaveDoc.value()
         CONFIG.autoSaveProj = self.autoSaveProj.value()
+        CONFIG.searchIndex  = self.searchIndex.isChecked()
 
         # Project Backup
         CONFIG.setBackupPath(self.backupPath)
@@ -953,6 +974,7 @@ class GuiPreferences(NDialog):
         CONFIG.autoSelect      = self.autoSelect.isChecked()
         CONFIG.showTabsNSpaces = self.showTabsNSpaces.isChecked()
         CONFIG.showLineEndings = self.showLineEndings.isChecked()
+        CONFIG.largeDocLimit   = self.largeDocLimit.value()
 
         # Editor Scrolling
         CONFIG.autoScroll    = self.autoScroll.isChecked()
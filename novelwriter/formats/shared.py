@@ -25,6 +25,8 @@ from __future__ import annotations
 
 import re
 
+from array import array
+from collections.abc import Iterable, Iterator
 from enum import Flag, IntEnum
 
 from PyQt5.QtGui import QColor
@@ -153,3 +155,124 @@ T_Note = tuple[str, T_Formats]
 # A tokenized text block, consisting of:
 # type, header number, text, text formats, and block format
 T_Block = tuple[BlockTyp, str, str, T_Formats, BlockFmt]
+
+
+# Block Storage
+# =============
+
+class BlockList:
+    """Compact storage of tokenized text blocks.
+
+    The blocks are stored in parallel arrays of integers, with all text
+    in a single string buffer and all text formats in a packed format
+    table. Key and meta data strings are stored once in a string table.
+    Reading a block returns it as a regular T_Block tuple, so the class
+    can be used as a drop-in replacement for a list of blocks.
+    """
+
+    __slots__ = (
+        "_types", "_styles", "_keys", "_offsets", "_chunks", "_text",
+        "_fmtIdx", "_fmtPos", "_fmtType", "_fmtMeta", "_strings", "_strMap",
+    )
+
+    _typeMap = {t.value: t for t in BlockTyp}
+    _fmtMap = {f.value: f for f in TextFmt}
+    _styleMap: dict[int, BlockFmt] = {}
+
+    def __init__(self, blocks: Iterable[T_Block] = ()) -> None:
+        self._types = array("B")
+        self._styles = array("I")
+        self._keys = array("I")
+        self._offsets = array("Q", [0])
+        self._chunks: list[str] = []
+        self._text = ""
+        self._fmtIdx = array("I", [0])
+        self._fmtPos = array("I")
+        self._fmtType = array("B")
+        self._fmtMeta = array("I")
+        self._strings: list[str] = [""]
+        self._strMap: dict[str, int] = {"": 0}
+        for block in blocks:
+            self.append(block)
+        return
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __iter__(self) -> Iterator[T_Block]:
+        for n in range(len(self._types)):
+            yield self._block(n)
+
+    def __getitem__(self, index: int) -> T_Block:
+        if index < 0:
+            index += len(self._types)
+        if not 0 <= index < len(self._types):
+            raise IndexError("block index out of range")
+        return self._block(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BlockList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<BlockList blocks={len(self._types)}>"
+
+    ##
+    #  Methods
+    ##
+
+    def append(self, block: T_Block) -> None:
+        """Add a block to the end of the list."""
+        tType, tKey, tText, tFormat, tStyle = block
+        self._types.append(tType)
+        self._styles.append(tStyle.value)
+        self._keys.append(self._string(tKey))
+        self._chunks.append(tText)
+        self._offsets.append(self._offsets[-1] + len(tText))
+        for pos, fmt, meta in tFormat:
+            self._fmtPos.append(pos)
+            self._fmtType.append(fmt)
+            self._fmtMeta.append(self._string(meta))
+        self._fmtIdx.append(len(self._fmtPos))
+        return
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _string(self, value: str) -> int:
+        """Look up or add a string to the string table."""
+        if (idx := self._strMap.get(value)) is None:
+            idx = len(self._strings)
+            self._strings.append(value)
+            self._strMap[value] = idx
+        return idx
+
+    def _block(self, n: int) -> T_Block:
+        """Unpack a single block."""
+        if self._chunks:
+            self._text += "".join(self._chunks)
+            self._chunks = []
+
+        strings = self._strings
+        tFormat = []
+        if (start := self._fmtIdx[n]) < (end := self._fmtIdx[n+1]):
+            fmtMap = self._fmtMap
+            tFormat = [
+                (pos, fmtMap[fmt], strings[meta]) for pos, fmt, meta in zip(
+                    self._fmtPos[start:end], self._fmtType[start:end], self._fmtMeta[start:end]
+                )
+            ]
+
+        style = self._styles[n]
+        if (tStyle := self._styleMap.get(style)) is None:
+            tStyle = self._styleMap[style] = BlockFmt(style)
+
+        return (
+            self._typeMap[self._types[n]],
+            strings[self._keys[n]],
+            self._text[self._offsets[n]:self._offsets[n+1]],
+            tFormat,
+            tStyle,
+        )
@@ -26,11 +26,13 @@ from __future__ import annotations
 
 import logging
 import re
+import shutil
 import xml.etree.ElementTree as ET
 
 from datetime import datetime
 from pathlib import Path
-from typing import NamedTuple
+from tempfile import TemporaryFile
+from typing import IO, NamedTuple
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from PyQt5.QtCore import QMargins, QSize
@@ -88,7 +90,11 @@ def _docXCol(color: QColor) -> str:
 
 
 def _wText(parent: ET.Element, text: str) -> ET.Element:
-    """Create a text element and add the preserve flag if necessary."""
+    """Create a text element and add the preserve flag if necessary.
+    NUL characters are not valid in XML, and are used as placeholders
+    when streaming, so they are removed.
+    """
+    text = text.replace("\x00", "")
     attrib = {}
     if len(text) > len(text.strip()):
         attrib[_mkTag("xml", "space")] = "preserve"
@@ -100,9 +106,23 @@ def _mmToSz(value: float) -> int:
     return int(value*20.0*72.0/25.4)
 
 
+def _xmlChildren(parent: ET.Element) -> bytes:
+    """Serialise the child elements of a parent element. The namespace
+    declarations end up on the parent tag, which is dropped.
+    """
+    if len(parent) == 0:
+        return b""
+    data = ET.tostring(parent, encoding="utf-8", xml_declaration=False)
+    return data[data.find(b">")+1:data.rfind(b"<")]
+
+
 # Cached
 W_VAL = _wTag("val")
 
+# Streaming
+S_FIELD = "\x00"  # Placeholder for field values in the spool file
+S_CHUNK = 1 << 20  # Chunk size when copying the spool file
+
 # Formatting Codes
 X_BLD = 0x001  # Bold format
 X_ITA = 0x002  # Italic format
@@ -147,7 +167,7 @@ class DocXXmlRel(NamedTuple):
 
 class DocXXmlFile(NamedTuple):
 
-    xml: ET.Element
+    xml: ET.Element | None
     path: str
     contentType: str
 
@@ -198,6 +218,11 @@ class ToDocX(Tokenizer):
         self._usedNotes: dict[str, int] = {}
         self._usedFields: list[tuple[ET.Element, str]] = []
 
+        # Streaming
+        self._stream = False
+        self._spool: IO[bytes] | None = None
+        self._spoolFields: list[tuple[int, str]] = []
+
         return
 
     ##
@@ -218,6 +243,14 @@ class ToDocX(Tokenizer):
         self._pageOffset = offset
         return
 
+    def setStreamMode(self, state: bool) -> None:
+        """Write paragraphs to a spool file as they are converted,
+        instead of keeping them in memory until the document is closed.
+        This must be set before the document is initialised.
+        """
+        self._stream = state
+        return
+
     ##
     #  Class Methods
     ##
@@ -228,6 +261,13 @@ class ToDocX(Tokenizer):
         self._fontFamily = self._textFont.family()
         self._fontSize = self._textFont.pointSizeF()
         self._generateStyles()
+        if self._stream:
+            self._spool = TemporaryFile()
+            self._spool.write((
+                "<?xml version='1.0' encoding='utf-8'?>\n"
+                f"<w:document xmlns:r=\"{XML_NS['r']}\" xmlns:w=\"{XML_NS['w']}\">"
+                "<w:body>"
+            ).encode("utf-8"))
         return
 
     def doConvert(self) -> None:
@@ -298,6 +338,9 @@ class ToDocX(Tokenizer):
             elif tType == BlockTyp.KEYWORD:
                 self._processFragments(par, S_META, tText, tFormat)
 
+        if self._spool:
+            self._flushParagraphs(False)
+
         return
 
     def closeDocument(self) -> None:
@@ -366,9 +409,16 @@ class ToDocX(Tokenizer):
             xmlToZip("_rels/.rels", rRels, outZip)
             xmlToZip("word/_rels/document.xml.rels", wRels, outZip)
             for name, rel in self._files.items():
-                xmlToZip(f"{rel.path}/{name}", rel.xml, outZip)
+                if rel.xml is None:
+                    self._spoolToZip(f"{rel.path}/{name}", outZip)
+                else:
+                    xmlToZip(f"{rel.path}/{name}", rel.xml, outZip)
             xmlToZip("[Content_Types].xml", dTypes, outZip)
 
+        if self._spool:
+            self._spool.close()
+            self._spool = None
+
         return
 
     ##
@@ -494,6 +544,67 @@ class ToDocX(Tokenizer):
 
         return xR
 
+    def _flushParagraphs(self, final: bool) -> None:
+        """Write converted paragraphs to the spool file. The last
+        paragraph is held back until the final flush, since a page break
+        on the paragraph following it is moved onto it.
+        """
+        if not (spool := self._spool):
+            return
+
+        pars = self._pars
+        for i in range(1, len(pars)):
+            if pars[i].pageBreakBefore:
+                pars[i].setPageBreakBefore(False)
+                pars[i-1].setPageBreakAfter(True)
+
+        write = pars if final else pars[:-1]
+        if write:
+            # Fields are written as placeholders, and their positions in
+            # the spool file recorded, so that the values can be filled
+            # in when the file is copied into the document.
+            for xField, _ in self._usedFields:
+                xField.text = S_FIELD
+
+            xBody = ET.Element(_wTag("body"))
+            for par in write:
+                par.toXml(xBody)
+
+            parts = _xmlChildren(xBody).split(S_FIELD.encode("utf-8"))
+            spool.write(parts[0])
+            for part, (_, field) in zip(parts[1:], self._usedFields):
+                self._spoolFields.append((spool.tell(), field))
+                spool.write(part)
+
+            self._usedFields = self._usedFields[len(parts)-1:]
+
+        self._pars = [] if final else pars[-1:]
+
+        return
+
+    def _spoolToZip(self, name: str, zipObj: ZipFile) -> None:
+        """Copy the spool file into the zip file, and insert the field
+        values at the recorded positions.
+        """
+        if not (spool := self._spool):
+            return
+
+        spool.seek(0)
+        with zipObj.open(name, mode="w") as fObj:
+            pos = 0
+            for offset, field in self._spoolFields:
+                while pos < offset:
+                    chunk = spool.read(min(S_CHUNK, offset - pos))
+                    fObj.write(chunk)
+                    pos += len(chunk)
+                if (value := self._counts.get(field)) is not None:
+                    fObj.write(self._formatInt(value).encode("utf-8"))
+                else:
+                    fObj.write(b"0")
+            shutil.copyfileobj(spool, fObj, S_CHUNK)
+
+        return
+
     ##
     #  DocX Content
     ##
@@ -906,30 +1017,34 @@ class ToDocX(Tokenizer):
             relType=f"{RELS_BASE}/officeDocument",
         )
         self._files["document.xml"] = DocXXmlFile(
-            xml=xRoot,
+            xml=None if self._spool else xRoot,
             path="word",
             contentType=f"{WORD_BASE}.document.main+xml",
         )
 
-        # Map all Page Break Before to After where possible
-        pars: list[DocXParagraph] = []
-        for i, par in enumerate(self._pars):
-            if i > 0 and par.pageBreakBefore:
-                prev = self._pars[i-1]
-                par.setPageBreakBefore(False)
-                prev.setPageBreakAfter(True)
-
-            pars.append(par)
-
-        # Replace fields if there are stats available
-        if self._usedFields and self._counts:
-            for xField, field in self._usedFields:
-                if (value := self._counts.get(field)) is not None:
-                    xField.text = self._formatInt(value)
-
-        # Write Paragraphs
-        for par in pars:
-            par.toXml(xBody)
+        if self._spool:
+            # Paragraphs and fields are handled by the spool file
+            self._flushParagraphs(True)
+        else:
+            # Map all Page Break Before to After where possible
+            pars: list[DocXParagraph] = []
+            for i, par in enumerate(self._pars):
+                if i > 0 and par.pageBreakBefore:
+                    prev = self._pars[i-1]
+                    par.setPageBreakBefore(False)
+                    prev.setPageBreakAfter(True)
+
+                pars.append(par)
+
+            # Replace fields if there are stats available
+            if self._usedFields and self._counts:
+                for xField, field in self._usedFields:
+                    if (value := self._counts.get(field)) is not None:
+                        xField.text = self._formatInt(value)
+
+            # Write Paragraphs
+            for par in pars:
+                par.toXml(xBody)
 
         # Write Settings
         xSect = xmlSubElem(xBody, _wTag("sectPr"))
@@ -966,6 +1081,10 @@ class ToDocX(Tokenizer):
         })
         xmlSubElem(xSect, _wTag("titlePg"))
 
+        if self._spool:
+            self._spool.write(_xmlChildren(xBody))
+            self._spool.write(b"</w:body></w:document>")
+
         return rId
 
     def _footnotesXml(self) -> str:
@@ -25,9 +25,9 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
 import logging
-import re
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import NamedTuple
 
@@ -41,12 +41,14 @@ from novelwriter.constants import (
     trConst
 )
 from novelwriter.core.index import processComment
+from novelwriter.core.item import NWItem
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwComment, nwItemLayout
 from novelwriter.formats.shared import (
-    BlockFmt, BlockTyp, T_Block, T_Formats, T_Note, TextDocumentTheme, TextFmt
+    BlockFmt, BlockList, BlockTyp, T_Block, T_Formats, T_Note,
+    TextDocumentTheme, TextFmt
 )
-from novelwriter.text.patterns import REGEX_PATTERNS, DialogParser
+from novelwriter.text.patterns import REGEX_PATTERNS, DialogParser, compileAutoReplace
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +76,15 @@ SKIP_INDENT = [
     BlockTyp.HEAD4, BlockTyp.SEP, BlockTyp.SKIP,
 ]
 B_EMPTY: T_Block = (BlockTyp.EMPTY, "", "", [], BlockFmt.NONE)
+DASH_MAP = str.maketrans({nwUnicode.U_ENDASH: " ", nwUnicode.U_EMDASH: " "})
+DOC_STATS = [  # The order is preserved in the stats fields of some formats
+    nwStats.TITLES, nwStats.PARAGRAPHS,
+    nwStats.WORDS_ALL, nwStats.WORDS_TEXT, nwStats.WORDS_TITLE,
+    nwStats.CHARS_ALL, nwStats.CHARS_TEXT, nwStats.CHARS_TITLE,
+    nwStats.WCHARS_ALL, nwStats.WCHARS_TEXT, nwStats.WCHARS_TITLE,
+]
+TEXT_STATS = (nwStats.PARAGRAPHS, nwStats.WORDS_TEXT, nwStats.CHARS_TEXT, nwStats.WCHARS_TEXT)
+TITLE_STATS = (nwStats.TITLES, nwStats.WORDS_TITLE, nwStats.CHARS_TITLE, nwStats.WCHARS_TITLE)
 
 
 class Tokenizer(ABC):
@@ -94,15 +105,17 @@ class Tokenizer(ABC):
         self._handle   = None   # The item handle currently being processed
         self._keepRaw  = False  # Whether to keep the raw text, used by ToRaw
         self._noTokens = False  # Disable tokenization if they're not needed
+        self._counting = True   # Count the text stats while tokenizing
 
         # Blocks and Meta Data (Per Document)
-        self._blocks: list[T_Block] = []
+        self._blocks = BlockList()
         self._footnotes: dict[str, T_Note] = {}
 
         # Blocks and Meta Data (Per Instance)
         self._raw: list[str] = []
         self._pages: list[str] = []
         self._counts: dict[str, int] = {}
+        self._docCounts = dict.fromkeys(DOC_STATS, 0)
         self._outline: dict[str, str] = {}
 
         # User Settings
@@ -126,6 +139,10 @@ class Tokenizer(ABC):
 
         self._skipKeywords: set[str] = set()  # Keywords to ignore
 
+        # Auto-Replace
+        self._autoReplace: Callable[[str], str] | None = None
+        self._autoReplaceSet = False
+
         # Other Setting
         self._theme = TextDocumentTheme()
         self._classes: dict[str, QColor] = {}
@@ -176,14 +193,19 @@ class Tokenizer(ABC):
         # Error Handling
         self._errData = []
 
+        # Linked Tokenizers
+        self._linked: list[Tokenizer] = []
+
         # Function Mapping
         self._localLookup = self._project.localLookup
 
         # Format RegEx
+        # Each pattern is paired with a string that must be present in
+        # the text for the pattern to possibly match
         self._rxMarkdown = [
-            (REGEX_PATTERNS.markdownItalic, [0, TextFmt.I_B, 0, TextFmt.I_E]),
-            (REGEX_PATTERNS.markdownBold,   [0, TextFmt.B_B, 0, TextFmt.B_E]),
-            (REGEX_PATTERNS.markdownStrike, [0, TextFmt.D_B, 0, TextFmt.D_E]),
+            (REGEX_PATTERNS.markdownItalic, "_",  [0, TextFmt.I_B, 0, TextFmt.I_E]),
+            (REGEX_PATTERNS.markdownBold,   "**", [0, TextFmt.B_B, 0, TextFmt.B_E]),
+            (REGEX_PATTERNS.markdownStrike, "~~", [0, TextFmt.D_B, 0, TextFmt.D_E]),
         ]
 
         self._shortCodeFmt = {
@@ -413,11 +435,49 @@ class Tokenizer(ABC):
         self._skipKeywords = set(x.lower().strip() for x in keywords.split(","))
         return
 
+    def setAutoReplace(self, replace: Callable[[str], str] | None) -> None:
+        """Set the function that applies the project's auto-replace list
+        during pre-processing. If it isn't set, it is compiled from the
+        project data when the first document is processed.
+        """
+        self._autoReplace = replace
+        self._autoReplaceSet = True
+        return
+
+    def setReferences(self, refs: dict[tuple[str, int, str], list[str]] | None) -> None:
+        """Set the references shown in headings, keyed by handle,
+        heading number and keyword. If not set, they are looked up in
+        the project index.
+        """
+        self._hFormatter.setReferences(refs)
+        return
+
+    def setCounting(self, state: bool) -> None:
+        """Set whether the text stats are counted while the text is
+        tokenized. If not, countStats adds nothing.
+        """
+        self._counting = state
+        return
+
     def setKeepLineBreaks(self, state: bool) -> None:
         """Keep line breaks in paragraphs."""
         self._keepBreaks = state
         return
 
+    def linkTokenizer(self, other: Tokenizer) -> None:
+        """Link another tokenizer to receive the tokens of each document
+        processed by this one. This allows building multiple formats
+        while only tokenizing the text once. Footnotes, stats and raw
+        text are shared with the linked tokenizer.
+        """
+        self._linked.append(other)
+        other._footnotes = self._footnotes
+        other._counts = self._counts
+        if other._keepRaw:
+            self._keepRaw = True
+            other._raw = self._raw
+        return
+
     ##
     #  Class Methods
     ##
@@ -451,12 +511,15 @@ class Tokenizer(ABC):
         self._breakNext = True
         return
 
-    def addRootHeading(self, tHandle: str) -> None:
-        """Add a heading at the start of a new root folder."""
+    def addRootHeading(self, tHandle: str, item: NWItem | None = None) -> None:
+        """Add a heading at the start of a new root folder. If the item
+        is not set, it is looked up in the project tree.
+        """
         self._text = ""
         self._handle = None
 
-        if (item := self._project.tree[tHandle]) and item.isRootType():
+        item = item or self._project.tree[tHandle]
+        if item and item.isRootType():
             self._handle = tHandle
             style = BlockFmt.CENTRE
             if self._isFirst:
@@ -469,21 +532,29 @@ class Tokenizer(ABC):
                 notes = self._localLookup("Notes")
                 title = f"{notes}: {title}"
 
-            self._blocks = [(
+            self._blocks = BlockList([(
                 BlockTyp.TITLE, f"{self._handle}:T0001", title, [], style
-            )]
+            )])
+            self._docCounts = dict.fromkeys(DOC_STATS, 0)
+            if self._counting:
+                self._countBlock(BlockTyp.TITLE, title)
             if self._keepRaw:
                 self._raw.append(f"#! {title}\n\n")
 
+        self._shareTokens()
+
         return
 
-    def setText(self, tHandle: str, text: str | None = None) -> None:
+    def setText(
+        self, tHandle: str, text: str | None = None, item: NWItem | None = None
+    ) -> None:
         """Set the text for the tokenizer from a handle. If text is not
-        set, it's is loaded from the file.
+        set, it's is loaded from the file. If the item is not set, it is
+        looked up in the project tree.
         """
         self._text = ""
         self._handle = None
-        if nwItem := self._project.tree[tHandle]:
+        if nwItem := item or self._project.tree[tHandle]:
             self._text = text or self._project.storage.getDocumentText(tHandle)
             self._handle = tHandle
             self._isNovel = nwItem.itemLayout == nwItemLayout.DOCUMENT
@@ -492,12 +563,10 @@ class Tokenizer(ABC):
     def doPreProcessing(self) -> None:
         """Run pre-processing jobs before the text is tokenized."""
         # Process the user's auto-replace dictionary
-        if autoReplace := self._project.data.autoReplace:
-            repDict = {}
-            for aKey, aVal in autoReplace.items():
-                repDict[f"<{aKey}>"] = aVal
-            xRep = re.compile("|".join([re.escape(k) for k in repDict.keys()]), flags=re.DOTALL)
-            self._text = xRep.sub(lambda x: repDict[x.group(0)], self._text)
+        if not self._autoReplaceSet:
+            self.setAutoReplace(compileAutoReplace(self._project.data.autoReplace))
+        if self._autoReplace:
+            self._text = self._autoReplace(self._text)
         return
 
     def tokenizeText(self) -> None:
@@ -839,8 +908,13 @@ class Tokenizer(ABC):
 
         lineSep = "\n" if keepBreaks else " "
 
+        # The text stats are counted here as the final blocks are added
+        # so that countStats doesn't need another pass over the blocks
+        self._docCounts = dict.fromkeys(DOC_STATS, 0)
+        countBlock = self._countBlock if self._counting else self._skipCount
+
         pLines: list[T_Block] = []
-        sBlocks: list[T_Block] = []
+        sBlocks = BlockList()
         for n, cBlock in enumerate(tBlocks[1:-1], 1):
 
             pBlock = tBlocks[n-1]  # Look behind
@@ -866,6 +940,7 @@ class Tokenizer(ABC):
                 sBlocks.append((
                     cBlock[0], cBlock[1], cBlock[2], cBlock[3], aStyle
                 ))
+                countBlock(cBlock[0], cBlock[2])
 
             elif cBlock[0] == BlockTyp.TEXT:
                 # Combine lines from the same paragraph
@@ -892,6 +967,7 @@ class Tokenizer(ABC):
                         sBlocks.append((
                             BlockTyp.TEXT, pLines[0][1], pTxt, pLines[0][3], cStyle
                         ))
+                        countBlock(BlockTyp.TEXT, pTxt)
 
                     elif nLines > 1:
                         # The paragraph contains multiple lines, so we need to
@@ -909,6 +985,7 @@ class Tokenizer(ABC):
                         sBlocks.append((
                             BlockTyp.TEXT, pLines[0][1], pTxt, tFmt, cStyle
                         ))
+                        countBlock(BlockTyp.TEXT, pTxt)
 
                     # Reset buffer and make sure text indent is on for next pass
                     pLines = []
@@ -916,8 +993,10 @@ class Tokenizer(ABC):
 
             else:
                 sBlocks.append(cBlock)
+                countBlock(cBlock[0], cBlock[2])
 
         self._blocks = sBlocks
+        self._shareTokens()
 
         return
 
@@ -942,86 +1021,61 @@ class Tokenizer(ABC):
         return
 
     def countStats(self) -> None:
-        """Count stats on the tokenized text."""
-        titleCount = self._counts.get(nwStats.TITLES, 0)
-        paragraphCount = self._counts.get(nwStats.PARAGRAPHS, 0)
-
-        allWords = self._counts.get(nwStats.WORDS_ALL, 0)
-        textWords = self._counts.get(nwStats.WORDS_TEXT, 0)
-        titleWords = self._counts.get(nwStats.WORDS_TITLE, 0)
-
-        allChars = self._counts.get(nwStats.CHARS_ALL, 0)
-        textChars = self._counts.get(nwStats.CHARS_TEXT, 0)
-        titleChars = self._counts.get(nwStats.CHARS_TITLE, 0)
-
-        allWordChars = self._counts.get(nwStats.WCHARS_ALL, 0)
-        textWordChars = self._counts.get(nwStats.WCHARS_TEXT, 0)
-        titleWordChars = self._counts.get(nwStats.WCHARS_TITLE, 0)
-
-        for tType, _, tText, _, _ in self._blocks:
-            tText = tText.replace(nwUnicode.U_ENDASH, " ")
-            tText = tText.replace(nwUnicode.U_EMDASH, " ")
-
-            tWords = tText.split()
-            nWords = len(tWords)
-            nChars = len(tText)
-            nWChars = len("".join(tWords))
-
-            if tType == BlockTyp.TEXT:
-                tPWords = tText.split()
-                nPWords = len(tPWords)
-                nPChars = len(tText)
-                nPWChars = len("".join(tPWords))
-
-                paragraphCount += 1
-                allWords += nPWords
-                textWords += nPWords
-                allChars += nPChars
-                textChars += nPChars
-                allWordChars += nPWChars
-                textWordChars += nPWChars
-
-            elif tType in HEADINGS:
-                titleCount += 1
-                allWords += nWords
-                titleWords += nWords
-                allChars += nChars
-                allWordChars += nWChars
-                titleChars += nChars
-                titleWordChars += nWChars
-
-            elif tType == BlockTyp.SEP:
-                allWords += nWords
-                allChars += nChars
-                allWordChars += nWChars
-
-            elif tType in (BlockTyp.COMMENT, BlockTyp.KEYWORD):
-                words = tText.split()
-                allWords += len(words)
-                allChars += len(tText)
-                allWordChars += len("".join(words))
-
-        self._counts[nwStats.TITLES] = titleCount
-        self._counts[nwStats.PARAGRAPHS] = paragraphCount
-
-        self._counts[nwStats.WORDS_ALL] = allWords
-        self._counts[nwStats.WORDS_TEXT] = textWords
-        self._counts[nwStats.WORDS_TITLE] = titleWords
-
-        self._counts[nwStats.CHARS_ALL] = allChars
-        self._counts[nwStats.CHARS_TEXT] = textChars
-        self._counts[nwStats.CHARS_TITLE] = titleChars
-
-        self._counts[nwStats.WCHARS_ALL] = allWordChars
-        self._counts[nwStats.WCHARS_TEXT] = textWordChars
-        self._counts[nwStats.WCHARS_TITLE] = titleWordChars
-
+        """Add the stats of the current document to the text stats. The
+        stats are counted while the text is tokenized.
+        """
+        counts = self._counts
+        for key, value in self._docCounts.items():
+            counts[key] = counts.get(key, 0) + value
         return
 
     ##
     #  Internal Functions
     ##
 
+    def _shareTokens(self) -> None:
+        """Pass the current document tokens on to linked tokenizers."""
+        for other in self._linked:
+            other._handle = self._handle
+            other._isNovel = self._isNovel
+            other._blocks = self._blocks
+        return
+
+    def _skipCount(self, tType: BlockTyp, tText: str) -> None:
+        """Replaces _countBlock when the text stats are not counted."""
+        return
+
+    def _countBlock(self, tType: BlockTyp, tText: str) -> None:
+        """Add the stats of a single block to the document stats."""
+        if tType == BlockTyp.TEXT:
+            stats = TEXT_STATS
+        elif tType in HEADINGS:
+            stats = TITLE_STATS
+        elif tType in (BlockTyp.SEP, BlockTyp.COMMENT, BlockTyp.KEYWORD):
+            stats = None
+        else:
+            return
+
+        if nwUnicode.U_ENDASH in tText or nwUnicode.U_EMDASH in tText:
+            tText = tText.translate(DASH_MAP)
+
+        tWords = tText.split()
+        nWords = len(tWords)
+        nChars = len(tText)
+        nWChars = len("".join(tWords))
+
+        counts = self._docCounts
+        counts[nwStats.WORDS_ALL] += nWords
+        counts[nwStats.CHARS_ALL] += nChars
+        counts[nwStats.WCHARS_ALL] += nWChars
+        if stats:
+            counts[stats[0]] += 1
+            counts[stats[1]] += nWords
+            counts[stats[2]] += nChars
+            counts[stats[3]] += nWChars
+
+        return
+
     def _formatInt(self, value: int) -> str:
         """Return a localised integer."""
         return self._dLocale.toString(value)
@@ -1104,35 +1158,38 @@ class Tokenizer(ABC):
         temp: list[tuple[int, int, int, str]] = []
 
         # Match Markdown
-        for regEx, fmts in self._rxMarkdown:
-            for res in regEx.finditer(text):
-                temp.extend(
-                    (res.start(n), res.end(n), fmt, "")
-                    for n, fmt in enumerate(fmts) if fmt > 0
-                )
+        for regEx, sentinel, fmts in self._rxMarkdown:
+            if sentinel in text:
+                for res in regEx.finditer(text):
+                    temp.extend(
+                        (res.start(n), res.end(n), fmt, "")
+                        for n, fmt in enumerate(fmts) if fmt > 0
+                    )
 
         # Match URLs
-        for res in REGEX_PATTERNS.url.finditer(text):
-            temp.append((res.start(0), 0, TextFmt.HRF_B, res.group(0)))
-            temp.append((res.end(0), 0, TextFmt.HRF_E, ""))
-
-        # Match Shortcodes
-        for res in REGEX_PATTERNS.shortcodePlain.finditer(text):
-            temp.append((
-                res.start(1), res.end(1),
-                self._shortCodeFmt.get(res.group(1).lower(), 0),
-                "",
-            ))
-
-        # Match Shortcode w/Values
-        tHandle = self._handle or ""
-        for res in REGEX_PATTERNS.shortcodeValue.finditer(text):
-            kind = self._shortCodeVals.get(res.group(1).lower(), 0)
-            temp.append((
-                res.start(0), res.end(0),
-                TextFmt.STRIP if kind == skip else kind,
-                f"{tHandle}:{res.group(2)}",
-            ))
+        if "http" in text:
+            for res in REGEX_PATTERNS.url.finditer(text):
+                temp.append((res.start(0), 0, TextFmt.HRF_B, res.group(0)))
+                temp.append((res.end(0), 0, TextFmt.HRF_E, ""))
+
+        if "[" in text:
+            # Match Shortcodes
+            for res in REGEX_PATTERNS.shortcodePlain.finditer(text):
+                temp.append((
+                    res.start(1), res.end(1),
+                    self._shortCodeFmt.get(res.group(1).lower(), 0),
+                    "",
+                ))
+
+            # Match Shortcode w/Values
+            tHandle = self._handle or ""
+            for res in REGEX_PATTERNS.shortcodeValue.finditer(text):
+                kind = self._shortCodeVals.get(res.group(1).lower(), 0)
+                temp.append((
+                    res.start(0), res.end(0),
+                    TextFmt.STRIP if kind == skip else kind,
+                    f"{tHandle}:{res.group(2)}",
+                ))
 
         # Match Dialogue
         if self._hlightDialog and hDialog:
@@ -1145,15 +1202,32 @@ class Tokenizer(ABC):
                     temp.append((res.start(0), 0, TextFmt.COL_B, "altdialog"))
                     temp.append((res.end(0), 0, TextFmt.COL_E, ""))
 
+        if not temp:
+            return text, []
+
         # Post-process text and format
-        result = text
+        # The markers are removed in a single pass over the sorted list.
+        # A format is shifted by the length of all markers removed before
+        # its position, but not by markers removed at the same position.
+        parts = []
         formats = []
-        for pos, end, fmt, meta in reversed(sorted(temp, key=lambda x: x[0])):
+        cursor = 0
+        shift = 0
+        pending = 0
+        last = -1
+        for pos, end, fmt, meta in sorted(temp, key=lambda x: x[0]):
             if fmt > 0:
-                if end > pos:
-                    result = result[:pos] + result[end:]
-                    formats = [(p+pos-end if p > pos else p, f, m) for p, f, m in formats]
-                formats.insert(0, (pos, fmt, meta))
+                if pos != last:
+                    shift += pending
+                    pending = 0
+                    last = pos
+                formats.append((pos - shift, fmt, meta))
+                if end > (start := max(pos, cursor)):
+                    parts.append(text[cursor:start])
+                    pending += end - start
+                    cursor = end
+        parts.append(text[cursor:])
+        result = "".join(parts)
 
         return result, formats
 
@@ -1163,6 +1237,7 @@ class HeadingFormatter:
     def __init__(self, project: NWProject) -> None:
         self._project = project
         self._handle = None
+        self._refs = None
         self._chCount = 0
         self._scChCount = 0
         self._scAbsCount = 0
@@ -1173,6 +1248,13 @@ class HeadingFormatter:
         self._handle = tHandle
         return
 
+    def setReferences(self, refs: dict[tuple[str, int, str], list[str]] | None) -> None:
+        """Set the references of the headings. If not set, they are
+        looked up in the project index.
+        """
+        self._refs = refs
+        return
+
     def incChapter(self) -> None:
         """Increment the chapter counter."""
         self._chCount += 1
@@ -1215,9 +1297,13 @@ class HeadingFormatter:
 
         if nwHeadFmt.CHAR_POV in hFormat or nwHeadFmt.CHAR_FOCUS in hFormat:
             if self._handle and nHead > 0:
-                index = self._project.index
-                pList = index.getReferenceForHeader(self._handle, nHead, nwKeyWords.POV_KEY)
-                fList = index.getReferenceForHeader(self._handle, nHead, nwKeyWords.FOCUS_KEY)
+                if self._refs is not None:
+                    pList = self._refs.get((self._handle, nHead, nwKeyWords.POV_KEY))
+                    fList = self._refs.get((self._handle, nHead, nwKeyWords.FOCUS_KEY))
+                else:
+                    index = self._project.index
+                    pList = index.getReferenceForHeader(self._handle, nHead, nwKeyWords.POV_KEY)
+                    fList = index.getReferenceForHeader(self._handle, nHead, nwKeyWords.FOCUS_KEY)
                 pText = pList[0] if pList else nwUnicode.U_ENDASH
                 fText = fList[0] if fList else nwUnicode.U_ENDASH
             else:
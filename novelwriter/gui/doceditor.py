@@ -12,6 +12,7 @@ Created:   2020-06-27 [0.10]  GuiDocEditFooter
 Rewritten: 2020-10-07 [1.0b3] BackgroundWordCounter
 Created:   2023-11-06 [2.2b1] MetaCompleter
 Created:   2023-11-07 [2.2b1] GuiDocToolBar
+Created:   2026-10-19 [2.6b2] BackgroundDocumentWriter
 
 This file is a part of novelWriter
 Copyright (C) 2018 Veronica Berglyd Olsen and novelWriter contributors
@@ -33,6 +34,7 @@ from __future__ import annotations
 
 import bisect
 import logging
+import threading
 
 from enum import Enum
 from time import time
@@ -44,7 +46,7 @@ from PyQt5.QtCore import (
 from PyQt5.QtGui import (
     QColor, QCursor, QDragEnterEvent, QDragMoveEvent, QDropEvent, QKeyEvent,
     QKeySequence, QMouseEvent, QPalette, QPixmap, QResizeEvent, QTextBlock,
-    QTextCursor, QTextDocument, QTextOption
+    QTextCursor, QTextOption
 )
 from PyQt5.QtWidgets import (
     QAction, QApplication, QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -91,7 +93,7 @@ class GuiDocEditor(QPlainTextEdit):
         "_nwDocument", "_nwItem", "_docChanged", "_docHandle", "_vpMargin",
         "_lastEdit", "_lastActive", "_lastFind", "_doReplace", "_autoReplace",
         "_completer", "_qDocument", "_keyContext", "_followTag1", "_followTag2",
-        "_timerDoc", "_wCounterDoc", "_timerSel", "_wCounterSel",
+        "_timerDoc", "_timerSel", "_wCounterSel", "_docWriter", "_saveJob", "_autoSaves",
     )
 
     MOVE_KEYS = (
@@ -108,6 +110,7 @@ class GuiDocEditor(QPlainTextEdit):
     novelItemMetaChanged = pyqtSignal(str)
     novelStructureChanged = pyqtSignal()
     openDocumentRequest = pyqtSignal(str, Enum, str, bool)
+    preparingStatusChanged = pyqtSignal(bool)
     requestNewNoteCreation = pyqtSignal(str, nwItemClass)
     requestNextDocument = pyqtSignal(str, bool)
     requestProjectItemRenamed = pyqtSignal(str, str)
@@ -148,9 +151,11 @@ class GuiDocEditor(QPlainTextEdit):
 
         # Connect Editor and Document Signals
         self._qDocument.contentsChange.connect(self._docChange)
+        self._qDocument.documentPrepared.connect(self._documentPrepared)
         self.selectionChanged.connect(self._updateSelectedStatus)
         self.cursorPositionChanged.connect(self._cursorMoved)
         self.spellCheckStateChanged.connect(self._qDocument.setSpellCheckState)
+        self.verticalScrollBar().valueChanged.connect(self._highlightViewport)
 
         # Document Title
         self.docHeader = GuiDocEditHeader(self)
@@ -189,24 +194,27 @@ class GuiDocEditor(QPlainTextEdit):
         self._followTag2.setContext(Qt.ShortcutContext.WidgetShortcut)
         self._followTag2.activated.connect(self._processTag)
 
-        # Set Up Document Word Counter
+        # Set Up Document Tasks Timer
         self._timerDoc = QTimer(self)
         self._timerDoc.timeout.connect(self._runDocumentTasks)
         self._timerDoc.setInterval(5000)
 
-        self._wCounterDoc = BackgroundWordCounter(self)
-        self._wCounterDoc.setAutoDelete(False)
-        self._wCounterDoc.signals.countsReady.connect(self._updateDocCounts)
-
         # Set Up Selection Word Counter
         self._timerSel = QTimer(self)
         self._timerSel.timeout.connect(self._runSelCounter)
         self._timerSel.setInterval(500)
 
-        self._wCounterSel = BackgroundWordCounter(self, forSelection=True)
+        self._wCounterSel = BackgroundWordCounter(self)
         self._wCounterSel.setAutoDelete(False)
         self._wCounterSel.signals.countsReady.connect(self._updateSelCounts)
 
+        # Set Up Document Writer
+        self._saveJob = None
+        self._autoSaves = [0, 0]  # Background saves done and skipped
+        self._docWriter = BackgroundDocumentWriter()
+        self._docWriter.setAutoDelete(False)
+        self._docWriter.signals.writeDone.connect(self._documentWritten)
+
         # Install Event Filter for Mouse Wheel
         self.wheelEventFilter = WheelEventFilter(self)
         self.installEventFilter(self.wheelEventFilter)
@@ -256,6 +264,7 @@ class GuiDocEditor(QPlainTextEdit):
         """Clear the current document and reset all document-related
         flags and counters.
         """
+        self._waitForWriter()
         self._nwDocument = None
         self.setReadOnly(True)
         self.clear()
@@ -269,6 +278,7 @@ class GuiDocEditor(QPlainTextEdit):
         self._doReplace  = False
 
         self.setDocumentChanged(False)
+        self.preparingStatusChanged.emit(False)
         self.docHeader.clearHeader()
         self.docFooter.setHandle(self._docHandle)
         self.docToolBar.setVisible(False)
@@ -404,7 +414,10 @@ class GuiDocEditor(QPlainTextEdit):
         self._runDocumentTasks()
         self._timerDoc.start()
 
-        self.setReadOnly(False)
+        # Large documents are read only until they are fully counted
+        preparing = self._qDocument.isPreparing
+        self.setReadOnly(preparing)
+        self.preparingStatusChanged.emit(preparing)
         self.updateDocMargins()
 
         if isinstance(tLine, int):
@@ -414,6 +427,7 @@ class GuiDocEditor(QPlainTextEdit):
 
         self.docHeader.setHandle(tHandle)
         self.docFooter.setHandle(tHandle)
+        self._highlightViewport()
 
         # This is a hack to fix invisible cursor on an empty document
         if self._qDocument.characterCount() <= 1:
@@ -449,9 +463,13 @@ class GuiDocEditor(QPlainTextEdit):
         QApplication.restoreOverrideCursor()
         return
 
-    def saveText(self) -> bool:
+    def saveText(self, background: bool = False) -> bool:
         """Save the text currently in the editor to the NWDocument
-        object, and update the NWItem meta data.
+        object, and update the NWItem meta data. In background mode, the
+        file is written in the thread pool, and the rest of the save is
+        done when the writer is finished. The return value is then only
+        whether the save was started. Background saves are skipped if
+        the text is the same as the last saved text.
         """
         if self._nwItem is None or self._nwDocument is None:
             logger.error("Cannot save text as no document is open")
@@ -464,50 +482,33 @@ class GuiDocEditor(QPlainTextEdit):
             )
             return False
 
-        docText = self.getText()
-        cC, wC, pC = standardCounter(docText)
-        self._updateDocCounts(cC, wC, pC)
-
-        if not self._nwDocument.writeDocument(docText):
-            saveOk = False
-            if self._nwDocument.hashError:
-                msgYes = SHARED.question(self.tr(
-                    "This document has been changed outside of novelWriter "
-                    "while it was open. Overwrite the file on disk?"
-                ))
-                if msgYes:
-                    saveOk = self._nwDocument.writeDocument(docText, forceWrite=True)
-
-            if not saveOk:
-                SHARED.error(
-                    self.tr("Could not save document."),
-                    info=self._nwDocument.getError()
-                )
-
+        if background and self._docWriter.isRunning():
+            logger.debug("Document writer is busy")
             return False
 
-        self.setDocumentChanged(False)
-        self.docTextChanged.emit(self._docHandle, self._lastEdit)
-
-        oldHeader = self._nwItem.mainHeading
-        oldCount = SHARED.project.index.getHandleHeaderCount(tHandle)
-        SHARED.project.index.scanText(tHandle, docText)
-        newHeader = self._nwItem.mainHeading
-        newCount = SHARED.project.index.getHandleHeaderCount(tHandle)
+        self._waitForWriter()
 
-        if self._nwItem.itemClass == nwItemClass.NOVEL:
-            if oldCount == newCount:
-                self.novelItemMetaChanged.emit(tHandle)
-            else:
-                self.novelStructureChanged.emit()
+        docText = self.getText()
+        if background and NWDocument.textHash(docText) == self._nwDocument.lastHash:
+            self._autoSaves[1] += 1
+            logger.debug(
+                "Skipped saving unchanged document (%d saved, %d skipped)", *self._autoSaves
+            )
+            self.setDocumentChanged(False)
+            return False
 
-        if oldHeader != newHeader:
-            self.docFooter.updateInfo()
+        self._qDocument.finishPreparing()
+        counts = self._qDocument.counts
+        self._updateDocCounts(*counts)
+        self._saveJob = (tHandle, self._nwItem, self._nwDocument, docText, counts, self._lastEdit)
 
-        # Update the status bar
-        self.updateStatusMessage.emit(self.tr("Saved Document: {0}").format(self._nwItem.itemName))
+        if background:
+            self._autoSaves[0] += 1
+            self._docWriter.setJob(self._nwDocument, docText)
+            SHARED.runInThreadPool(self._docWriter)
+            return True
 
-        return True
+        return self._finishSave(self._nwDocument.writeDocument(docText))
 
     def cursorIsVisible(self) -> bool:
         """Check if the cursor is visible in the editor."""
@@ -1111,6 +1112,27 @@ class GuiDocEditor(QPlainTextEdit):
 
         return
 
+    @pyqtSlot()
+    def _highlightViewport(self) -> None:
+        """Make sure the text in the viewport, and a viewport height
+        below it, is highlighted while the document is being highlighted
+        in the background.
+        """
+        syntax = self._qDocument.syntaxHighlighter
+        if syntax.lazyPending:
+            first = self.firstVisibleBlock()
+            offset = self.contentOffset()
+            limit = 2*self.viewport().height()
+            count = 0
+            block = first
+            while block.isValid():
+                if self.blockBoundingGeometry(block).translated(offset).top() > limit:
+                    break
+                block = block.next()
+                count += 1
+            syntax.ensureHighlighted(first, count)
+        return
+
     @pyqtSlot()
     def _cursorMoved(self) -> None:
         """Triggered when the cursor moved in the editor."""
@@ -1229,22 +1251,41 @@ class GuiDocEditor(QPlainTextEdit):
 
         if time() - self._lastEdit < 25.0:
             logger.debug("Running document tasks")
-            if not self._wCounterDoc.isRunning():
-                SHARED.runInThreadPool(self._wCounterDoc)
+            if not self._qDocument.isPreparing:
+                self._updateDocCounts(*self._qDocument.counts)
 
-            self.docHeader.setOutline({
-                block.blockNumber(): block.text()
-                for block in self._qDocument.iterBlockByType(BLOCK_TITLE, maxCount=30)
-            })
+            if (outline := self._qDocument.takeOutline()) is not None:
+                self.docHeader.setOutline(outline)
 
             if self._docChanged:
                 self.docTextChanged.emit(self._docHandle, self._lastEdit)
 
         return
 
+    @pyqtSlot()
+    def _documentPrepared(self) -> None:
+        """Process the document's prepared signal, which means a large
+        document has been fully counted and can be edited.
+        """
+        if self._nwDocument is not None:
+            self.setReadOnly(False)
+            self._runDocumentTasks()
+        self.preparingStatusChanged.emit(False)
+        return
+
+    @pyqtSlot()
+    def _documentWritten(self) -> None:
+        """Process the document writer's finished signal. The save may
+        already have been completed by a blocking save, and the writer
+        may have started on the next one.
+        """
+        if not self._docWriter.isRunning():
+            self._finishSave(self._docWriter.result)
+        return
+
     @pyqtSlot(int, int, int)
     def _updateDocCounts(self, cCount: int, wCount: int, pCount: int) -> None:
-        """Process the word counter's finished signal."""
+        """Update the document's counts."""
         if self._docHandle and self._nwItem:
             logger.debug("Updating word count")
             needsRefresh = wCount != self._nwItem.wordCount
@@ -1384,48 +1425,34 @@ class GuiDocEditor(QPlainTextEdit):
 
     def findAllOccurences(self) -> tuple[list[int], list[int]]:
         """Create a list of all search results of the current search
-        text in the document.
+        text in the document. The search runs over the text of each
+        paragraph, and doesn't move the cursor. Like the editor's own
+        find, matches don't span paragraphs.
         """
         resS = []
         resE = []
-        cursor = self.textCursor()
-        hasSelection = cursor.hasSelection()
-        if hasSelection:
-            origA = cursor.selectionStart()
-            origB = cursor.selectionEnd()
-        else:
-            origA = cursor.position()
-            origB = cursor.position()
-
-        findOpt = QTextDocument.FindFlag(0)
-        if CONFIG.searchCase:
-            findOpt |= QTextDocument.FindFlag.FindCaseSensitively
-        if CONFIG.searchWord:
-            findOpt |= QTextDocument.FindFlag.FindWholeWords
-
-        searchFor = self.docSearch.getSearchObject()
-        cursor.setPosition(0)
-        self.setTextCursor(cursor)
-
-        # Search up to a maximum of MAX_SEARCH_RESULT, and make sure
-        # certain special searches like a regex search for .* don't loop
-        # infinitely
-        while self.find(searchFor, findOpt) and len(resE) <= nwConst.MAX_SEARCH_RESULT:
-            cursor = self.textCursor()
-            if cursor.hasSelection():
-                resS.append(cursor.selectionStart())
-                resE.append(cursor.selectionEnd())
-            else:
-                logger.warning("The search returned an empty result")
-                break
-
-        if hasSelection:
-            cursor.setPosition(origA, QtMoveAnchor)
-            cursor.setPosition(origB, QtKeepAnchor)
-        else:
-            cursor.setPosition(origA)
-
-        self.setTextCursor(cursor)
+        regEx = self.docSearch.getSearchObject()
+        if not self.docSearch.searchText or not regEx.isValid():
+            return resS, resE
+
+        # Special searches like a regex search for .* can match empty
+        # text at every position, so empty matches are skipped by the
+        # regex engine rather than here
+        regEx.setPattern(f"(*NOTEMPTY){regEx.pattern()}")
+
+        # Search up to a maximum of MAX_SEARCH_RESULT
+        block = self._qDocument.firstBlock()
+        while block.isValid():
+            if text := block.text():
+                offset = block.position()
+                matches = regEx.globalMatch(text)
+                while matches.hasNext():
+                    match = matches.next()
+                    resS.append(offset + match.capturedStart())
+                    resE.append(offset + match.capturedEnd())
+                    if len(resE) > nwConst.MAX_SEARCH_RESULT:
+                        return resS, resE
+            block = block.next()
 
         return resS, resE
 
@@ -1903,6 +1930,69 @@ class GuiDocEditor(QPlainTextEdit):
     #  Internal Functions
     ##
 
+    def _finishSave(self, writeOk: bool) -> bool:
+        """Complete a save after the document has been written. The
+        document is only marked as unchanged if it hasn't been edited
+        since the save started.
+        """
+        if self._saveJob is None:
+            return False
+
+        tHandle, nwItem, nwDocument, docText, counts, lastEdit = self._saveJob
+        self._saveJob = None
+
+        if not writeOk:
+            saveOk = False
+            if nwDocument.hashError:
+                msgYes = SHARED.question(self.tr(
+                    "This document has been changed outside of novelWriter "
+                    "while it was open. Overwrite the file on disk?"
+                ))
+                if msgYes:
+                    saveOk = nwDocument.writeDocument(docText, forceWrite=True)
+
+            if not saveOk:
+                SHARED.error(
+                    self.tr("Could not save document."),
+                    info=nwDocument.getError()
+                )
+
+            return False
+
+        isOpen = tHandle == self._docHandle
+        if isOpen and lastEdit == self._lastEdit:
+            self.setDocumentChanged(False)
+        self.docTextChanged.emit(tHandle, lastEdit)
+
+        oldHeader = nwItem.mainHeading
+        oldCount = SHARED.project.index.getHandleHeaderCount(tHandle)
+        SHARED.project.index.scanText(tHandle, docText, counts=counts)
+        newHeader = nwItem.mainHeading
+        newCount = SHARED.project.index.getHandleHeaderCount(tHandle)
+
+        if nwItem.itemClass == nwItemClass.NOVEL:
+            if oldCount == newCount:
+                self.novelItemMetaChanged.emit(tHandle)
+            else:
+                self.novelStructureChanged.emit()
+
+        if isOpen and oldHeader != newHeader:
+            self.docFooter.updateInfo()
+
+        # Update the status bar
+        self.updateStatusMessage.emit(self.tr("Saved Document: {0}").format(nwItem.itemName))
+
+        return True
+
+    def _waitForWriter(self) -> None:
+        """Wait for a background save to finish, and complete it."""
+        if self._docWriter.isRunning():
+            logger.debug("Waiting for document writer")
+            self._docWriter.wait()
+        if self._saveJob is not None:
+            self._finishSave(self._docWriter.result)
+        return
+
     def _correctWord(self, cursor: QTextCursor, word: str) -> None:
         """Slot for the spell check context menu triggering the
         replacement of a word with the word from the dictionary.
@@ -2096,7 +2186,7 @@ class MetaCompleter(QMenu):
             offset = 0
             length = len(kw.rstrip())
             suffix = "" if sep else ":"
-            options = list(filter(
+            options = sorted(filter(
                 lambda x: x.startswith(kw.rstrip()), nwKeyWords.VALID_KEYS
             ))
         else:
@@ -2108,16 +2198,14 @@ class MetaCompleter(QMenu):
             offset = tPos[index] if lookup else pos
             length = len(lookup)
             suffix = ""
-            options = list(filter(
-                lambda x: lookup in x.lower(), SHARED.project.index.getClassTags(
-                    nwKeyWords.KEY_CLASS.get(kw.strip())
-                )
-            ))[:15]
+            options = SHARED.project.index.matchClassTags(
+                nwKeyWords.KEY_CLASS.get(kw.strip()), lookup, 15
+            )
 
         if not options:
             return False
 
-        for value in sorted(options):
+        for value in options:
             rep = value + suffix
             action = self.addAction(value)
             action.triggered.connect(qtLambda(self._emitComplete, offset, length, rep))
@@ -2153,15 +2241,15 @@ class MetaCompleter(QMenu):
 class BackgroundWordCounter(QRunnable):
     """The Off-GUI Thread Word Counter
 
-    A runnable for the word counter to be run in the thread pool off the
-    main GUI thread.
+    A runnable for the selection word counter to be run in the thread
+    pool off the main GUI thread. The document counts are kept up to
+    date by the document itself.
     """
 
-    def __init__(self, docEditor: GuiDocEditor, forSelection: bool = False) -> None:
+    def __init__(self, docEditor: GuiDocEditor) -> None:
         super().__init__()
 
         self._docEditor = docEditor
-        self._forSelection = forSelection
         self._isRunning = False
 
         self.signals = BackgroundWordCounterSignals()
@@ -2177,12 +2265,7 @@ class BackgroundWordCounter(QRunnable):
         call to the function that does the actual counting.
         """
         self._isRunning = True
-        if self._forSelection:
-            text = self._docEditor.getSelectedText()
-        else:
-            text = self._docEditor.getText()
-
-        cC, wC, pC = standardCounter(text)
+        cC, wC, pC = standardCounter(self._docEditor.getSelectedText())
         self.signals.countsReady.emit(cC, wC, pC)
         self._isRunning = False
 
@@ -2196,6 +2279,69 @@ class BackgroundWordCounterSignals(QObject):
     countsReady = pyqtSignal(int, int, int)
 
 
+class BackgroundDocumentWriter(QRunnable):
+    """The Off-GUI Thread Document Writer
+
+    A runnable that writes a document file in the thread pool off the
+    main GUI thread. The rest of the save is done by the editor when the
+    writer is finished.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._document = None
+        self._text = ""
+        self._result = False
+        self._done = threading.Event()
+        self._done.set()
+
+        self.signals = BackgroundDocumentWriterSignals()
+
+        return
+
+    @property
+    def result(self) -> bool:
+        """Return the result of the last write."""
+        return self._result
+
+    def isRunning(self) -> bool:
+        return not self._done.is_set()
+
+    def setJob(self, document: NWDocument, text: str) -> None:
+        """Set the document and text to write. The writer counts as
+        running from this point.
+        """
+        self._document = document
+        self._text = text
+        self._result = False
+        self._done.clear()
+        return
+
+    def wait(self) -> None:
+        """Block until the current write is finished."""
+        self._done.wait()
+        return
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Overloaded run function for the writer."""
+        if self._document:
+            self._result = self._document.writeDocument(self._text)
+        self._document = None
+        self._text = ""
+        self._done.set()
+        self.signals.writeDone.emit()
+        return
+
+
+class BackgroundDocumentWriterSignals(QObject):
+    """The QRunnable cannot emit a signal, so we need a simple QObject
+    to hold the document writer signal.
+    """
+    writeDone = pyqtSignal()
+
+
 class TextAutoReplace:
 
     __slots__ = (
@@ -2605,19 +2751,26 @@ class GuiDocEditSearch(QFrame):
     #  Getters
     ##
 
-    def getSearchObject(self) -> str | QRegularExpression:
-        """Return the current search text either as text or as a regular
-        expression object.
+    def getSearchObject(self) -> QRegularExpression:
+        """Return the current search text as a regular expression
+        object. Plain text is escaped, and for whole word searches, the
+        match can't have a letter or number on either side.
         """
         text = self.searchBox.text()
+        rxOpt = QRegularExpression.PatternOption.UseUnicodePropertiesOption
+        rxOpt |= QRegularExpression.PatternOption.MultilineOption
+        if not CONFIG.searchCase:
+            rxOpt |= QRegularExpression.PatternOption.CaseInsensitiveOption
         if CONFIG.searchRegEx:
-            rxOpt = QRegularExpression.PatternOption.UseUnicodePropertiesOption
-            if not CONFIG.searchCase:
-                rxOpt |= QRegularExpression.PatternOption.CaseInsensitiveOption
             regEx = QRegularExpression(text, rxOpt)
             self._alertSearchValid(regEx.isValid())
-            return regEx
-        return text
+            if not regEx.isValid():
+                return regEx
+        else:
+            text = QRegularExpression.escape(text)
+        if CONFIG.searchWord:
+            text = rf"(?<![\p{{L}}\p{{N}}])(?:{text})(?![\p{{L}}\p{{N}}])"
+        return QRegularExpression(text, rxOpt)
 
     ##
     #  Setters
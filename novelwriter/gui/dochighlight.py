@@ -29,9 +29,9 @@ import re
 
 from time import time
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QObject, QRunnable, Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import (
-    QBrush, QColor, QFont, QSyntaxHighlighter, QTextBlockUserData,
+    QBrush, QColor, QFont, QSyntaxHighlighter, QTextBlock, QTextBlockUserData,
     QTextCharFormat, QTextDocument
 )
 
@@ -54,14 +54,25 @@ BLOCK_TEXT  = 1
 BLOCK_META  = 2
 BLOCK_TITLE = 4
 
+HEADINGS = ("# ", "#! ", "## ", "##! ", "### ", "###! ", "#### ")
+
+# Format Operations
+FMT_SET   = 0
+FMT_MERGE = 1
+FMT_SPELL = 2
+
 
 class GuiDocHighlighter(QSyntaxHighlighter):
 
     __slots__ = (
         "_tHandle", "_isNovel", "_isInactive", "_spellCheck", "_spellErr",
         "_hStyles", "_minRules", "_txtRules", "_cmnRules", "_dialogParser",
+        "_fmtCache", "_lazyTimer", "_lazyNext", "_spellWorker", "_spellBusy",
+        "_spellWords", "_spellBlocks", "_spellCount", "_spellBatch",
     )
 
+    LAZY_SLICE = 0.02  # Seconds of background highlighting per timer event
+
     def __init__(self, document: QTextDocument) -> None:
         super().__init__(document)
 
@@ -74,12 +85,27 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         self._spellErr = QTextCharFormat()
 
         self._hStyles: dict[str, QTextCharFormat] = {}
-        self._minRules: list[tuple[re.Pattern, dict[int, QTextCharFormat]]] = []
-        self._txtRules: list[tuple[re.Pattern, dict[int, QTextCharFormat]]] = []
-        self._cmnRules: list[tuple[re.Pattern, dict[int, QTextCharFormat]]] = []
+        self._minRules: list[tuple[re.Pattern, dict[int, str]]] = []
+        self._txtRules: list[tuple[re.Pattern, dict[int, str]]] = []
+        self._cmnRules: list[tuple[re.Pattern, dict[int, str]]] = []
+        self._fmtCache: dict[tuple[str, ...], QTextCharFormat] = {}
 
         self._dialogParser = DialogParser()
 
+        self._lazyNext = 0
+        self._lazyTimer = QTimer(self)
+        self._lazyTimer.setInterval(0)
+        self._lazyTimer.timeout.connect(self._processLazyBlocks)
+
+        self._spellWorker = BackgroundSpellChecker()
+        self._spellWorker.setAutoDelete(False)
+        self._spellWorker.signals.wordsChecked.connect(self._spellCheckDone)
+        self._spellBusy = False
+        self._spellWords: set[str] = set()
+        self._spellBlocks: set[int] = set()
+        self._spellCount = 0
+        self._spellBatch: tuple[set[int], int] = (set(), 0)
+
         self.initHighlighter()
 
         logger.debug("Ready: GuiDocHighlighter")
@@ -131,8 +157,10 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         self._spellErr.setUnderlineColor(SHARED.theme.colSpell)
         self._spellErr.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
 
+        self._minRules.clear()
         self._txtRules.clear()
         self._cmnRules.clear()
+        self._fmtCache.clear()
 
         self._dialogParser.initParser()
 
@@ -140,7 +168,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         if CONFIG.showMultiSpaces:
             rxRule = re.compile(r"[ ]{2,}|[ ]*$", re.UNICODE)
             hlRule = {
-                0: self._hStyles["mspaces"],
+                0: "mspaces",
             }
             self._minRules.append((rxRule, hlRule))
             self._txtRules.append((rxRule, hlRule))
@@ -149,7 +177,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Non-Breaking Spaces
         rxRule = re.compile(f"[{nwUnicode.U_NBSP}{nwUnicode.U_THNBSP}]+", re.UNICODE)
         hlRule = {
-            0: self._hStyles["nobreak"],
+            0: "nobreak",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -158,16 +186,16 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Alt Dialogue
         if rxRule := REGEX_PATTERNS.altDialogStyle:
             hlRule = {
-                0: self._hStyles["altdialog"],
+                0: "altdialog",
             }
             self._txtRules.append((rxRule, hlRule))
 
         # Markdown Italic
         rxRule = REGEX_PATTERNS.markdownItalic
         hlRule = {
-            1: self._hStyles["markup"],
-            2: self._hStyles["italic"],
-            3: self._hStyles["markup"],
+            1: "markup",
+            2: "italic",
+            3: "markup",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -176,9 +204,9 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Markdown Bold
         rxRule = REGEX_PATTERNS.markdownBold
         hlRule = {
-            1: self._hStyles["markup"],
-            2: self._hStyles["bold"],
-            3: self._hStyles["markup"],
+            1: "markup",
+            2: "bold",
+            3: "markup",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -187,9 +215,9 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Markdown Strikethrough
         rxRule = REGEX_PATTERNS.markdownStrike
         hlRule = {
-            1: self._hStyles["markup"],
-            2: self._hStyles["strike"],
-            3: self._hStyles["markup"],
+            1: "markup",
+            2: "strike",
+            3: "markup",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -198,7 +226,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Shortcodes
         rxRule = REGEX_PATTERNS.shortcodePlain
         hlRule = {
-            1: self._hStyles["code"],
+            1: "code",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -207,9 +235,9 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Shortcodes w/Value
         rxRule = REGEX_PATTERNS.shortcodeValue
         hlRule = {
-            1: self._hStyles["code"],
-            2: self._hStyles["value"],
-            3: self._hStyles["code"],
+            1: "code",
+            2: "value",
+            3: "code",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -218,7 +246,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # URLs
         rxRule = REGEX_PATTERNS.url
         hlRule = {
-            0: self._hStyles["link"],
+            0: "link",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -227,7 +255,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Alignment Tags
         rxRule = re.compile(r"(^>{1,2}|<{1,2}$)", re.UNICODE)
         hlRule = {
-            1: self._hStyles["markup"],
+            1: "markup",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -235,7 +263,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         # Auto-Replace Tags
         rxRule = re.compile(r"<(\S+?)>", re.UNICODE)
         hlRule = {
-            0: self._hStyles["replace"],
+            0: "replace",
         }
         self._minRules.append((rxRule, hlRule))
         self._txtRules.append((rxRule, hlRule))
@@ -243,6 +271,15 @@ class GuiDocHighlighter(QSyntaxHighlighter):
 
         return
 
+    ##
+    #  Properties
+    ##
+
+    @property
+    def lazyPending(self) -> bool:
+        """Check if there are blocks left for the lazy highlighter."""
+        return self._lazyTimer.isActive()
+
     ##
     #  Setters
     ##
@@ -281,6 +318,37 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         logger.debug("Document highlighted in %.3f ms" % (1000*(time() - tStart)))
         return
 
+    def rehighlightLazy(self) -> None:
+        """Highlight a freshly loaded document in the background. The
+        block states only depend on the first characters of each block,
+        so they are set up front to keep lookups by block type working.
+        Since they are already correct, highlighting a block will not
+        cascade into the next block. The text itself is highlighted in
+        short slices on an idle timer, or on demand by calling the
+        ensureHighlighted method.
+        """
+        qDoc = self.document()
+        block = qDoc.begin()
+        while block.isValid():
+            block.setUserState(self._blockState(block.text()))
+            block = block.next()
+        self._lazyNext = 0
+        self._lazyTimer.start()
+        logger.debug("Lazy highlighting of %d blocks started", qDoc.blockCount())
+        return
+
+    def ensureHighlighted(self, block: QTextBlock, count: int = 1) -> None:
+        """Make sure a number of blocks, starting at a given block, have
+        been highlighted.
+        """
+        if self._lazyTimer.isActive():
+            while block.isValid() and count > 0:
+                if self._isPending(block):
+                    self.rehighlightBlock(block)
+                block = block.next()
+                count -= 1
+        return
+
     ##
     #  Highlight Block
     ##
@@ -295,8 +363,16 @@ class GuiDocHighlighter(QSyntaxHighlighter):
         if self._tHandle is None or not text:
             return
 
+        # All non-empty blocks have data, which marks them as done for
+        # the lazy highlighter
+        data = self.currentBlockUserData()
+        if not isinstance(data, TextBlockData):
+            data = TextBlockData()
+            self.setCurrentBlockUserData(data)
+
         xOff = 0
         hRules = None
+        fmtOps: list[tuple[int, int, int, str]] = []
         if text.startswith("@"):  # Keywords and commands
             self.setCurrentBlockState(BLOCK_META)
             index = SHARED.project.index
@@ -321,36 +397,36 @@ class GuiDocHighlighter(QSyntaxHighlighter):
             # so we force a return here
             return
 
-        elif text.startswith(("# ", "#! ", "## ", "##! ", "### ", "###! ", "#### ")):
+        elif text.startswith(HEADINGS):
             self.setCurrentBlockState(BLOCK_TITLE)
 
             if text.startswith("# "):  # Heading 1
-                self.setFormat(0, 1, self._hStyles["head1h"])
-                self.setFormat(1, len(text), self._hStyles["header1"])
+                fmtOps.append((0, 1, FMT_SET, "head1h"))
+                fmtOps.append((1, len(text), FMT_SET, "header1"))
 
             elif text.startswith("## "):  # Heading 2
-                self.setFormat(0, 2, self._hStyles["head2h"])
-                self.setFormat(2, len(text), self._hStyles["header2"])
+                fmtOps.append((0, 2, FMT_SET, "head2h"))
+                fmtOps.append((2, len(text), FMT_SET, "header2"))
 
             elif text.startswith("### "):  # Heading 3
-                self.setFormat(0, 3, self._hStyles["head3h"])
-                self.setFormat(3, len(text), self._hStyles["header3"])
+                fmtOps.append((0, 3, FMT_SET, "head3h"))
+                fmtOps.append((3, len(text), FMT_SET, "header3"))
 
             elif text.startswith("#### "):  # Heading 4
-                self.setFormat(0, 4, self._hStyles["head4h"])
-                self.setFormat(4, len(text), self._hStyles["header4"])
+                fmtOps.append((0, 4, FMT_SET, "head4h"))
+                fmtOps.append((4, len(text), FMT_SET, "header4"))
 
             elif text.startswith("#! "):  # Title
-                self.setFormat(0, 2, self._hStyles["head1h"])
-                self.setFormat(2, len(text), self._hStyles["header1"])
+                fmtOps.append((0, 2, FMT_SET, "head1h"))
+                fmtOps.append((2, len(text), FMT_SET, "header1"))
 
             elif text.startswith("##! "):  # Unnumbered
-                self.setFormat(0, 3, self._hStyles["head2h"])
-                self.setFormat(3, len(text), self._hStyles["header2"])
+                fmtOps.append((0, 3, FMT_SET, "head2h"))
+                fmtOps.append((3, len(text), FMT_SET, "header2"))
 
             elif text.startswith("###! "):  # Alternative Scene
-                self.setFormat(0, 4, self._hStyles["head3h"])
-                self.setFormat(4, len(text), self._hStyles["header3"])
+                fmtOps.append((0, 4, FMT_SET, "head3h"))
+                fmtOps.append((4, len(text), FMT_SET, "header3"))
 
         elif text.startswith("%"):  # Comments
             self.setCurrentBlockState(BLOCK_TEXT)
@@ -360,17 +436,17 @@ class GuiDocHighlighter(QSyntaxHighlighter):
             cLen = len(text) - cPos
             xOff = cPos
             if cStyle == nwComment.PLAIN:
-                self.setFormat(0, cLen, self._hStyles["hidden"])
+                fmtOps.append((0, cLen, FMT_SET, "hidden"))
             elif cStyle == nwComment.IGNORE:
                 self.setFormat(0, cLen, self._hStyles["strike"])
                 return  # No more processing for these
             elif cMod:
-                self.setFormat(0, cDot, self._hStyles["modifier"])
-                self.setFormat(cDot, cPos - cDot, self._hStyles["value"])
-                self.setFormat(cPos, cLen, self._hStyles["note"])
+                fmtOps.append((0, cDot, FMT_SET, "modifier"))
+                fmtOps.append((cDot, cPos, FMT_SET, "value"))
+                fmtOps.append((cPos, cPos + cLen, FMT_SET, "note"))
             else:
-                self.setFormat(0, cPos, self._hStyles["modifier"])
-                self.setFormat(cPos, cLen, self._hStyles["note"])
+                fmtOps.append((0, cPos, FMT_SET, "modifier"))
+                fmtOps.append((cPos, cPos + cLen, FMT_SET, "note"))
 
         elif text.startswith("["):  # Special Command
             self.setCurrentBlockState(BLOCK_TEXT)
@@ -394,40 +470,198 @@ class GuiDocHighlighter(QSyntaxHighlighter):
             hRules = self._txtRules if self._isNovel else self._minRules
             if self._dialogParser.enabled:
                 for pos, end in self._dialogParser(text):
-                    length = end - pos
-                    self.setFormat(pos, length, self._hStyles["dialog"])
+                    fmtOps.append((pos, end, FMT_SET, "dialog"))
 
         if hRules:
             for rX, hRule in hRules:
                 for res in re.finditer(rX, text[xOff:]):
-                    for xM, hFmt in hRule.items():
-                        xPos = res.start(xM) + xOff
-                        xEnd = res.end(xM) + xOff
-                        for x in range(xPos, xEnd):
-                            cFmt = self.format(x)
-                            if cFmt.fontStyleName() != "markup":
-                                cFmt.merge(hFmt)
-                                self.setFormat(x, 1, cFmt)
-
-        data = self.currentBlockUserData()
-        if not isinstance(data, TextBlockData):
-            data = TextBlockData()
-            self.setCurrentBlockUserData(data)
+                    for xM, hName in hRule.items():
+                        xPos = res.start(xM)
+                        xEnd = res.end(xM)
+                        if xEnd > xPos:
+                            fmtOps.append((xPos + xOff, xEnd + xOff, FMT_MERGE, hName))
 
         data.processText(text, xOff)
         if self._spellCheck:
             for xPos, xEnd in data.spellCheck():
-                for x in range(xPos, xEnd):
-                    cFmt = self.format(x)
-                    cFmt.merge(self._spellErr)
-                    self.setFormat(x, 1, cFmt)
+                fmtOps.append((xPos, xEnd, FMT_SPELL, ""))
+            if data.unchecked:
+                self._queueSpellCheck(data.unchecked)
+
+        if fmtOps:
+            self._applyFormats(fmtOps, len(text))
 
         return
 
+    ##
+    #  Private Slots
+    ##
+
+    @pyqtSlot()
+    def _spellCheckDone(self) -> None:
+        """Process the result of the background spell checker. Only the
+        blocks that were waiting for it, and where the list of spelling
+        errors changed, are highlighted again. If the number of blocks
+        changed in the meantime, all blocks are checked.
+        """
+        self._spellBusy = False
+        if not self._spellCheck:
+            self._spellBlocks.clear()
+            self._spellWords.clear()
+            return
+
+        qDoc = self.document()
+        numbers, count = self._spellBatch
+        if count == qDoc.blockCount():
+            blocks = [qDoc.findBlockByNumber(n) for n in sorted(numbers)]
+        else:
+            blocks = []
+            block = qDoc.begin()
+            while block.isValid():
+                blocks.append(block)
+                block = block.next()
+
+        count = 0
+        for block in blocks:
+            data = block.userData()
+            if isinstance(data, TextBlockData) and data.unchecked:
+                errors = data.spellErrors
+                if data.spellCheck() != errors:
+                    self.rehighlightBlock(block)
+                    count += 1
+        logger.debug("Spell check updated %d block(s)", count)
+
+        if self._spellWords:
+            self._startSpellWorker()
+
+        return
+
+    @pyqtSlot()
+    def _processLazyBlocks(self) -> None:
+        """Highlight the next slice of blocks in the background. Edits
+        can shift the block numbers, so when the end of the document is
+        reached, it is checked once more from the top before stopping.
+        """
+        tEnd = time() + self.LAZY_SLICE
+        qDoc = self.document()
+        block = qDoc.findBlockByNumber(self._lazyNext)
+        while True:
+            if not block.isValid():
+                block = qDoc.begin()
+                while block.isValid() and not self._isPending(block):
+                    block = block.next()
+                if not block.isValid():
+                    self._lazyTimer.stop()
+                    logger.debug("Lazy highlighting done")
+                    return
+            if self._isPending(block):
+                self.rehighlightBlock(block)
+            block = block.next()
+            if time() > tEnd:
+                break
+        self._lazyNext = block.blockNumber() if block.isValid() else qDoc.blockCount()
+        return
+
     ##
     #  Internal Functions
     ##
 
+    def _queueSpellCheck(self, words: set[str]) -> None:
+        """Queue words of the current block for the background spell
+        checker, and start it unless it is already running.
+        """
+        count = self.document().blockCount()
+        if not self._spellBlocks:
+            self._spellCount = count
+        elif self._spellCount != count:
+            self._spellCount = -1
+        self._spellBlocks.add(self.currentBlock().blockNumber())
+        self._spellWords.update(words)
+        if not self._spellBusy:
+            self._startSpellWorker()
+        return
+
+    def _startSpellWorker(self) -> None:
+        """Start the background spell checker on the queued words."""
+        self._spellBusy = True
+        self._spellBatch = (self._spellBlocks, self._spellCount)
+        self._spellWorker.setWords(self._spellWords)
+        self._spellBlocks = set()
+        self._spellWords = set()
+        SHARED.runInThreadPool(self._spellWorker)
+        return
+
+    def _blockState(self, text: str) -> int:
+        """Return the block state the highlighter will assign to a block
+        of text.
+        """
+        if self._tHandle is None or not text:
+            return BLOCK_NONE
+        elif text.startswith("@"):
+            return BLOCK_META
+        elif text.startswith(HEADINGS):
+            return BLOCK_TITLE
+        return BLOCK_TEXT
+
+    def _isPending(self, block: QTextBlock) -> bool:
+        """Check if a block has not yet been highlighted."""
+        return (
+            self._tHandle is not None and block.length() > 1
+            and not isinstance(block.userData(), TextBlockData)
+        )
+
+    def _applyFormats(self, fmtOps: list[tuple[int, int, int, str]], length: int) -> None:
+        """Apply a list of format operations to the block as runs of
+        equal format. The operations are applied in order to each span
+        of text between operation boundaries. A set operation replaces
+        the format, while a merge operation merges a style into it,
+        unless the text is already styled as markup. The spell check
+        underline is merged into any style.
+        """
+        starts: dict[int, list[int]] = {}
+        ends: dict[int, list[int]] = {}
+        for i, (xPos, xEnd, _, _) in enumerate(fmtOps):
+            xEnd = min(xEnd, length)
+            if xEnd > xPos >= 0:
+                starts.setdefault(xPos, []).append(i)
+                ends.setdefault(xEnd, []).append(i)
+
+        active: set[int] = set()
+        runs: list[list] = []
+        points = sorted(starts.keys() | ends.keys())
+        for xPos, xEnd in zip(points, points[1:]):
+            active.difference_update(ends.get(xPos, ()))
+            active.update(starts.get(xPos, ()))
+            key: tuple[str, ...] = ()
+            if active:
+                name = ""
+                for i in sorted(active):
+                    _, _, op, hName = fmtOps[i]
+                    if op == FMT_SET:
+                        key = (hName,)
+                        name = hName
+                    elif op == FMT_MERGE:
+                        if name != "markup":
+                            key += (hName,)
+                            name = hName
+                    else:
+                        key += (hName,)
+            if runs and runs[-1][1] == xPos and runs[-1][2] == key:
+                runs[-1][1] = xEnd
+            else:
+                runs.append([xPos, xEnd, key])
+
+        for xPos, xEnd, key in runs:
+            if key:
+                if (cFmt := self._fmtCache.get(key)) is None:
+                    cFmt = QTextCharFormat()
+                    for hName in key:
+                        cFmt.merge(self._hStyles[hName] if hName else self._spellErr)
+                    self._fmtCache[key] = cFmt
+                self.setFormat(xPos, xEnd - xPos, cFmt)
+
+        return
+
     def _addCharFormat(
         self, name: str, color: QColor | None = None,
         style: str | None = None, size: float | None = None
@@ -465,7 +699,7 @@ class GuiDocHighlighter(QSyntaxHighlighter):
 
 class TextBlockData(QTextBlockUserData):
 
-    __slots__ = ("_text", "_offset", "_metaData", "_spellErrors")
+    __slots__ = ("_text", "_offset", "_metaData", "_spellErrors", "_unchecked")
 
     def __init__(self) -> None:
         super().__init__()
@@ -473,6 +707,7 @@ class TextBlockData(QTextBlockUserData):
         self._offset = 0
         self._metaData: list[tuple[int, int, str, str]] = []
         self._spellErrors: list[tuple[int, int,]] = []
+        self._unchecked: set[str] = set()
         return
 
     @property
@@ -485,6 +720,13 @@ class TextBlockData(QTextBlockUserData):
         """Return spell error data from last check."""
         return self._spellErrors
 
+    @property
+    def unchecked(self) -> set[str]:
+        """Return the words the spell checker had no result for in the
+        last check.
+        """
+        return self._unchecked
+
     def processText(self, text: str, offset: int) -> None:
         """Extract meta data from the text."""
         self._metaData = []
@@ -510,16 +752,54 @@ class TextBlockData(QTextBlockUserData):
         return
 
     def spellCheck(self) -> list[tuple[int, int]]:
-        """Run the spell checker and cache the result, and return the
-        list of spell check errors.
+        """Look up the words in the spell check cache, and return the
+        list of spell check errors. Words that have not been checked
+        yet are collected and treated as correct, and can be passed on
+        to the background spell checker.
         """
         self._spellErrors = []
+        self._unchecked = set()
         checker = SHARED.spelling
         for res in RX_WORDS.finditer(self._text.replace("_", " "), self._offset):
-            if (
-                (word := res.group(0))
-                and not (word.isnumeric() or word.isupper() or checker.checkWord(word))
-            ):
-                self._spellErrors.append((res.start(0), res.end(0)))
+            if (word := res.group(0)) and not (word.isnumeric() or word.isupper()):
+                if (result := checker.lookupWord(word)) is None:
+                    self._unchecked.add(word)
+                elif not result:
+                    self._spellErrors.append((res.start(0), res.end(0)))
 
         return self._spellErrors
+
+
+class BackgroundSpellChecker(QRunnable):
+    """The Off-GUI Thread Spell Checker
+
+    A runnable that checks a set of words in the thread pool, which
+    fills the spell checker's cache.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._words: set[str] = set()
+        self.signals = BackgroundSpellCheckerSignals()
+        return
+
+    def setWords(self, words: set[str]) -> None:
+        """Set the words to check on the next run."""
+        self._words = words
+        return
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Check all the words, and emit a signal when done."""
+        checker = SHARED.spelling
+        for word in self._words:
+            checker.checkWord(word)
+        self.signals.wordsChecked.emit()
+        return
+
+
+class BackgroundSpellCheckerSignals(QObject):
+    """The QRunnable cannot emit a signal, so we need a simple QObject
+    to hold the spell checker signal.
+    """
+    wordsChecked = pyqtSignal()
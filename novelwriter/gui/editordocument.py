@@ -23,30 +23,54 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import bisect
 import logging
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from time import time
 
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QTextBlock, QTextCursor, QTextDocument
 from PyQt5.QtWidgets import QApplication, QPlainTextDocumentLayout
 
-from novelwriter import SHARED
-from novelwriter.gui.dochighlight import GuiDocHighlighter, TextBlockData
+from novelwriter import CONFIG, SHARED
+from novelwriter.gui.dochighlight import BLOCK_TITLE, GuiDocHighlighter, TextBlockData
+from novelwriter.text.counting import IncrementalCounter
 
 logger = logging.getLogger(__name__)
 
 
 class GuiTextDocument(QTextDocument):
+    """GUI: Editor Text Document
+
+    Documents larger than the large document limit are prepared in the
+    background after loading. They are highlighted lazily, and their
+    blocks are counted in short slices on an idle timer. The counts are
+    not complete until the documentPrepared signal is emitted.
+    """
+
+    PREP_SLICE = 0.02  # Seconds of background counting per timer event
+
+    documentPrepared = pyqtSignal()
 
     def __init__(self, parent: QObject) -> None:
         super().__init__(parent=parent)
 
         self._handle = None
         self._syntax = GuiDocHighlighter(self)
+        self._counter = IncrementalCounter()
+        self._counter.setText([""])
+        self._titles: list[int] = []  # Block numbers of title blocks
+        self._outlineChanged = False
         self.setDocumentLayout(QPlainTextDocumentLayout(self))
 
+        self._prepTimer = QTimer(self)
+        self._prepTimer.setInterval(0)
+        self._prepTimer.timeout.connect(self._prepareBlocks)
+
+        # Signals
+        self.contentsChange.connect(self._updateBlocks)
+
         logger.debug("Ready: GuiTextDocument")
 
         return
@@ -64,6 +88,16 @@ class GuiTextDocument(QTextDocument):
         """Return the document's syntax highlighter object."""
         return self._syntax
 
+    @property
+    def counts(self) -> tuple[int, int, int]:
+        """Return the character, word and paragraph counts."""
+        return self._counter.counts
+
+    @property
+    def isPreparing(self) -> bool:
+        """Check if a large document is still being prepared."""
+        return self._prepTimer.isActive()
+
     ##
     #  Methods
     ##
@@ -71,6 +105,8 @@ class GuiTextDocument(QTextDocument):
     def setTextContent(self, text: str, tHandle: str) -> None:
         """Set the text content of the document."""
         self._syntax.setHandle(tHandle)
+        self._prepTimer.stop()
+        isLarge = len(text) > CONFIG.largeDocLimit
 
         self.blockSignals(True)
         self.setUndoRedoEnabled(False)
@@ -79,14 +115,24 @@ class GuiTextDocument(QTextDocument):
         tStart = time()
 
         self.setPlainText(text)
+        if isLarge:
+            self._counter.setText([])
+        else:
+            self._counter.setText(self._iterBlockText(self.firstBlock(), self.lastBlock()))
         count = self.lineCount()
 
         tMid = time()
 
         self.setUndoRedoEnabled(True)
         self.blockSignals(False)
-        self._syntax.rehighlight()
+        if isLarge:
+            self._syntax.rehighlightLazy()
+            self._prepTimer.start()
+        else:
+            self._syntax.rehighlight()
         QApplication.processEvents()
+        self._titles = self._findTitles(self.firstBlock(), self.blockCount())
+        self._outlineChanged = True
 
         tEnd = time()
 
@@ -95,6 +141,12 @@ class GuiTextDocument(QTextDocument):
 
         return
 
+    def finishPreparing(self) -> None:
+        """Count the remaining blocks of a large document right away."""
+        while self._prepTimer.isActive():
+            self._prepareBlocks()
+        return
+
     def metaDataAtPos(self, pos: int) -> tuple[str, str]:
         """Check if there is meta data available at a given position in
         the document, and if so, return it.
@@ -102,6 +154,7 @@ class GuiTextDocument(QTextDocument):
         cursor = QTextCursor(self)
         cursor.setPosition(pos)
         block = cursor.block()
+        self._syntax.ensureHighlighted(block)
         data = block.userData()
         if block.isValid() and isinstance(data, TextBlockData):
             if (check := pos - block.position()) >= 0:
@@ -117,6 +170,7 @@ class GuiTextDocument(QTextDocument):
         cursor = QTextCursor(self)
         cursor.setPosition(pos)
         block = cursor.block()
+        self._syntax.ensureHighlighted(block)
         data = block.userData()
         if block.isValid() and isinstance(data, TextBlockData):
             text = block.text()
@@ -129,6 +183,15 @@ class GuiTextDocument(QTextDocument):
                         return word, cPos, cLen, SHARED.spelling.suggestWords(word)
         return "", -1, -1, []
 
+    def takeOutline(self) -> dict[int, str] | None:
+        """Return the block number and text of all title blocks if they
+        have changed since the last call, otherwise None.
+        """
+        if not self._outlineChanged:
+            return None
+        self._outlineChanged = False
+        return {n: self.findBlockByNumber(n).text() for n in self._titles}
+
     def iterBlockByType(self, cType: int, maxCount: int = 1000) -> Iterable[QTextBlock]:
         """Iterate over all text blocks of a given type."""
         count = 0
@@ -148,3 +211,108 @@ class GuiTextDocument(QTextDocument):
         """Set the spell check state of the syntax highlighter."""
         self._syntax.setSpellCheck(state)
         return
+
+    ##
+    #  Private Slots
+    ##
+
+    @pyqtSlot(int, int, int)
+    def _updateBlocks(self, pos: int, removed: int, added: int) -> None:
+        """Update the counts and the outline for the blocks affected by
+        a change to the document. The blocks covering the change are the
+        ones that replaced the removed blocks. The syntax highlighter
+        has already set their block states when this slot is called.
+        """
+        if self._prepTimer.isActive():
+            # The document was changed before it was fully counted
+            self._countAll()
+            return
+
+        first = self.findBlock(pos)
+        last = self.findBlock(pos + added)
+        if not first.isValid():
+            first = self.firstBlock()
+        if not last.isValid():
+            last = self.lastBlock()
+
+        number = first.blockNumber()
+        count = last.blockNumber() - number + 1
+        replaced = count - self.blockCount() + len(self._counter)
+        if replaced < 0 or number + replaced > len(self._counter):  # pragma: no cover
+            logger.warning("Block counts out of sync, counting all blocks")
+            self._countAll()
+            return
+
+        self._counter.update(number, replaced, self._iterBlockText(first, last))
+
+        # Replace the title blocks in the changed range, and move the
+        # ones after it if blocks were added or removed
+        lower = bisect.bisect_left(self._titles, number)
+        upper = bisect.bisect_left(self._titles, number + replaced)
+        titles = self._findTitles(first, count)
+        if upper > lower or titles:
+            self._outlineChanged = True
+        if (shift := count - replaced) != 0 and upper < len(self._titles):
+            self._outlineChanged = True
+            for i in range(upper, len(self._titles)):
+                self._titles[i] += shift
+        self._titles[lower:upper] = titles
+
+        return
+
+    @pyqtSlot()
+    def _prepareBlocks(self) -> None:
+        """Count the next slice of blocks of a large document. The
+        blocks are appended to the counter in batches.
+        """
+        tEnd = time() + self.PREP_SLICE
+        block = self.findBlockByNumber(len(self._counter))
+        while block.isValid():
+            lines = []
+            while block.isValid() and len(lines) < 100:
+                lines.append(block.text())
+                block = block.next()
+            self._counter.update(len(self._counter), 0, lines)
+            if time() > tEnd:
+                break
+        if not block.isValid():
+            self._prepTimer.stop()
+            logger.debug("Document prepared")
+            self.documentPrepared.emit()
+        return
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _countAll(self) -> None:
+        """Count all blocks and find all title blocks. This also ends
+        the preparation of a large document.
+        """
+        self._counter.setText(self._iterBlockText(self.firstBlock(), self.lastBlock()))
+        titles = self._findTitles(self.firstBlock(), self.blockCount())
+        self._outlineChanged |= titles != self._titles
+        self._titles = titles
+        if self._prepTimer.isActive():
+            self._prepTimer.stop()
+            self.documentPrepared.emit()
+        return
+
+    def _findTitles(self, first: QTextBlock, count: int) -> list[int]:
+        """Find the block numbers of the title blocks in a range."""
+        titles = []
+        block = first
+        for n in range(first.blockNumber(), first.blockNumber() + count):
+            if block.userState() == BLOCK_TITLE:
+                titles.append(n)
+            block = block.next()
+        return titles
+
+    def _iterBlockText(self, first: QTextBlock, last: QTextBlock) -> Iterator[str]:
+        """Iterate over the text of a range of blocks."""
+        block = first
+        end = last.blockNumber()
+        while block.isValid() and block.blockNumber() <= end:
+            yield block.text()
+            block = block.next()
+        return
@@ -24,20 +24,24 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 
 import logging
+import threading
 
 from time import time
 
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QCursor, QKeyEvent
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QKeyEvent
 from PyQt5.QtWidgets import (
-    QApplication, QFrame, QHBoxLayout, QLabel, QLineEdit, QToolBar,
-    QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+    QFrame, QHBoxLayout, QLabel, QLineEdit, QToolBar, QTreeWidget,
+    QTreeWidgetItem, QVBoxLayout, QWidget
 )
 
 from novelwriter import CONFIG, SHARED
 from novelwriter.common import checkInt, cssCol
+from novelwriter.constants import nwConst
 from novelwriter.core.coretools import DocSearch
+from novelwriter.core.index import TextIndexLoader
 from novelwriter.core.item import NWItem
+from novelwriter.core.project import NWProject
 from novelwriter.types import (
     QtAlignMiddle, QtAlignRight, QtHeaderStretch, QtHeaderToContents,
     QtUserRole
@@ -56,7 +60,7 @@ class GuiProjectSearch(QWidget):
     D_RESULT = QtUserRole + 1
 
     selectedItemChanged = pyqtSignal(str)
-    openDocumentSelectRequest = pyqtSignal(str, int, int, bool)
+    openDocumentSelectRequest = pyqtSignal(str, int, int, int, bool)
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent=parent)
@@ -70,9 +74,21 @@ class GuiProjectSearch(QWidget):
 
         self._time = time()
         self._search = DocSearch()
-        self._blocked = False
         self._map: dict[str, tuple[int, float]] = {}
 
+        # Search State
+        # The search has its own thread pool, so that a long search
+        # doesn't hold up the editor's workers in the global pool
+        self._pool = QThreadPool(self)
+        self._loading = False
+        self._runId = 0
+        self._cancel = threading.Event()
+        self._start = 0.0
+        self._jobs: list[NWItem] = []
+        self._pending: dict[int, tuple[list[tuple[int, int, str, int]], bool]] = {}
+        self._next = 0
+        self._limit = 0
+
         # Header
         self.viewLabel = QLabel(self.tr("Project Search"), self)
         self.viewLabel.setFont(SHARED.theme.guiFontB)
@@ -180,6 +196,10 @@ class GuiProjectSearch(QWidget):
 
         return
 
+    def isSearching(self) -> bool:
+        """Check if a search is running."""
+        return self._next < len(self._jobs)
+
     def processReturn(self) -> None:
         """Process a return keypress forwarded from the main GUI."""
         if self.searchText.hasFocus():
@@ -188,10 +208,11 @@ class GuiProjectSearch(QWidget):
             self.searchResult.hasFocus()
             and (items := self.searchResult.selectedItems())
             and (data := items[0].data(0, self.D_RESULT))
-            and len(data) == 3
+            and len(data) == 4
         ):
             self.openDocumentSelectRequest.emit(
-                str(data[0]), checkInt(data[1], -1), checkInt(data[2], -1), False
+                str(data[0]), checkInt(data[1], -1), checkInt(data[2], -1),
+                checkInt(data[3], 0), False
             )
         return
 
@@ -206,6 +227,7 @@ class GuiProjectSearch(QWidget):
 
     def closeProjectTasks(self) -> None:
         """Run close project tasks."""
+        self._cancelSearch()
         self._map = {}
         self.searchText.clear()
         self.searchResult.clear()
@@ -213,7 +235,7 @@ class GuiProjectSearch(QWidget):
 
     def refreshCurrentSearch(self) -> None:
         """Refresh the search if there is one."""
-        if self.searchResult.topLevelItemCount() > 0:
+        if self.searchResult.topLevelItemCount() > 0 or self.isSearching():
             self._processSearch()
         return
 
@@ -264,31 +286,93 @@ class GuiProjectSearch(QWidget):
 
     @pyqtSlot()
     def _processSearch(self) -> None:
-        """Perform a search."""
-        if not self._blocked:
-            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
-            start = time()
-            SHARED.saveEditor()
-            self._blocked = True
-            self._map = {}
-            self.searchResult.clear()
-            if text := self.searchText.text():
-                self._search.setUserRegEx(self.toggleRegEx.isChecked())
-                self._search.setCaseSensitive(self.toggleCase.isChecked())
-                self._search.setWholeWords(self.toggleWord.isChecked())
-                for item, results, capped in self._search.iterSearch(SHARED.project, text):
-                    self._displayResultSet(item, results, capped)
-            logger.debug("Search took %.3f ms", 1000*(time() - start))
-            self._time = time()
-            QApplication.restoreOverrideCursor()
-        self._blocked = False
+        """Perform a search. A search that is still running is cancelled
+        first. Searches that can use the text index are run directly.
+        Otherwise, the documents are split into shards that are searched
+        in the search thread pool. If the text index isn't loaded yet,
+        it is loaded in the pool after the search, for the next one.
+        """
+        self._cancelSearch()
+        self._start = time()
+        SHARED.saveEditor()
+        self._map = {}
+        self.searchResult.clear()
+        if text := self.searchText.text():
+            search = DocSearch()
+            search.setUserRegEx(self.toggleRegEx.isChecked())
+            search.setCaseSensitive(self.toggleCase.isChecked())
+            search.setWholeWords(self.toggleWord.isChecked())
+            jobs = [
+                (item, positions) for item, positions
+                in search.prepareSearch(SHARED.project, text) if positions is not None
+            ]
+            self._search = search
+            self._jobs = [item for item, _ in jobs]
+            self._limit = nwConst.MAX_SEARCH_RESULT
+            if search.indexed:
+                for order, (item, positions) in enumerate(jobs):
+                    if not self.isSearching():
+                        break
+                    results, capped = search.searchDocument(
+                        SHARED.project, item.itemHandle, positions
+                    )
+                    self._searchResultReady(self._runId, order, results, capped)
+            elif jobs:
+                shards = [
+                    (order, item.itemHandle, positions)
+                    for order, (item, positions) in enumerate(jobs)
+                ]
+                count = min(len(shards), self._pool.maxThreadCount())
+                for shard in range(count):
+                    worker = BackgroundSearch(
+                        SHARED.project, search, shards[shard::count], self._runId, self._cancel
+                    )
+                    worker.signals.resultReady.connect(self._searchResultReady)
+                    self._pool.start(worker)
+            if not jobs:
+                self._finishSearch()
+            if not self._loading and (loader := SHARED.project.index.textIndexLoader()):
+                worker = BackgroundTextIndex(loader)
+                worker.signals.indexLoaded.connect(self._textIndexLoaded)
+                self._loading = True
+                self._pool.start(worker)
+        return
+
+    @pyqtSlot(object)
+    def _textIndexLoaded(self, loader: TextIndexLoader) -> None:
+        """Hand a loaded text index over to the project index."""
+        self._loading = False
+        SHARED.project.index.setTextIndex(loader)
+        return
+
+    @pyqtSlot(int, int, object, bool)
+    def _searchResultReady(
+        self, runId: int, order: int, results: list[tuple[int, int, str, int]], capped: bool
+    ) -> None:
+        """Process the result of a document. The results are displayed
+        in tree order, until the max number of results is reached.
+        """
+        if runId == self._runId and self.isSearching():
+            self._pending[order] = (results, capped)
+            while self._next in self._pending:
+                results, capped = self._pending.pop(self._next)
+                item = self._jobs[self._next]
+                self._next += 1
+                if len(results) >= self._limit:
+                    results = results[:self._limit]
+                    capped = True
+                self._limit -= len(results)
+                self._displayResultSet(item, results, capped)
+                if capped or not self.isSearching():
+                    self._finishSearch()
+                    break
         return
 
     @pyqtSlot()
     def _searchResultSelected(self) -> None:
         """Process search result selection."""
         if items := self.searchResult.selectedItems():
-            if (data := items[0].data(0, self.D_RESULT)) and len(data) == 3:
+            if (data := items[0].data(0, self.D_RESULT)) and len(data) == 4:
                 self.selectedItemChanged.emit(str(data[0]))
             elif data := items[0].data(0, self.D_HANDLE):
                 self.selectedItemChanged.emit(str(data))
@@ -297,9 +381,10 @@ class GuiProjectSearch(QWidget):
     @pyqtSlot("QTreeWidgetItem*", int)
     def _searchResultDoubleClicked(self, item: QTreeWidgetItem, column: int) -> None:
         """Process search result double click."""
-        if (data := item.data(0, self.D_RESULT)) and len(data) == 3:
+        if (data := item.data(0, self.D_RESULT)) and len(data) == 4:
             self.openDocumentSelectRequest.emit(
-                str(data[0]), checkInt(data[1], -1), checkInt(data[2], -1), True
+                str(data[0]), checkInt(data[1], -1), checkInt(data[2], -1),
+                checkInt(data[3], 0), True
             )
         return
 
@@ -329,7 +414,7 @@ class GuiProjectSearch(QWidget):
     ##
 
     def _displayResultSet(
-        self, nwItem: NWItem | None, results: list[tuple[int, int, str]], capped: bool
+        self, nwItem: NWItem | None, results: list[tuple[int, int, str, int]], capped: bool
     ) -> None:
         """Populate the result tree."""
         if results and nwItem:
@@ -350,10 +435,10 @@ class GuiProjectSearch(QWidget):
             self._map[tHandle] = (index, time())
 
             rItems = []
-            for start, length, context in results:
+            for start, length, context, line in results:
                 rItem = QTreeWidgetItem()
                 rItem.setText(0, context)
-                rItem.setData(0, self.D_RESULT, (tHandle, start, length))
+                rItem.setData(0, self.D_RESULT, (tHandle, start, length, line))
                 rItems.append(rItem)
 
             tItem.addChildren(rItems)
@@ -363,6 +448,99 @@ class GuiProjectSearch(QWidget):
             for i in range(tItem.childCount()):
                 self.searchResult.setFirstColumnSpanned(i, parent, True)
 
-            QApplication.processEvents()
+        return
+
+    def _cancelSearch(self) -> None:
+        """Cancel the current search, if it is running. Results that are
+        still on their way are ignored.
+        """
+        self._cancel.set()
+        self._cancel = threading.Event()
+        self._runId += 1
+        self._jobs = []
+        self._pending = {}
+        self._next = 0
+        return
+
+    def _finishSearch(self) -> None:
+        """Wrap up a search that is done, or has reached the max number
+        of results.
+        """
+        self._cancel.set()
+        self._jobs = []
+        self._pending = {}
+        self._next = 0
+        self._time = time()
+        logger.debug("Search took %.3f ms", 1000*(self._time - self._start))
+        return
+
+
+class BackgroundSearch(QRunnable):
+    """The Off-GUI Thread Project Search
+
+    A runnable that searches a shard of the documents of a prepared
+    search in the thread pool. The result of each document is emitted
+    when it is ready, and the remaining documents are skipped if the
+    search is cancelled.
+    """
+
+    def __init__(
+        self, project: NWProject, search: DocSearch, jobs: list[tuple[int, str, list[int]]],
+        runId: int, cancel: threading.Event
+    ) -> None:
+        super().__init__()
+
+        self._project = project
+        self._search = search
+        self._jobs = jobs
+        self._runId = runId
+        self._cancel = cancel
+
+        self.signals = BackgroundSearchSignals()
 
         return
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Overloaded run function for the search."""
+        for order, tHandle, positions in self._jobs:
+            if self._cancel.is_set():
+                break
+            results, capped = self._search.searchDocument(self._project, tHandle, positions)
+            self.signals.resultReady.emit(self._runId, order, results, capped)
+        return
+
+
+class BackgroundSearchSignals(QObject):
+    """The QRunnable cannot emit a signal, so we need a simple QObject
+    to hold the search result signal.
+    """
+    resultReady = pyqtSignal(int, int, object, bool)
+
+
+class BackgroundTextIndex(QRunnable):
+    """The Off-GUI Thread Text Index Loader
+
+    A runnable that loads the text index of the project in the thread
+    pool, so that reading the documents doesn't hold up the GUI.
+    """
+
+    def __init__(self, loader: TextIndexLoader) -> None:
+        super().__init__()
+        self._loader = loader
+        self.signals = BackgroundTextIndexSignals()
+        return
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """Overloaded run function for the loader."""
+        self._loader.run()
+        self.signals.indexLoaded.emit(self._loader)
+        return
+
+
+class BackgroundTextIndexSignals(QObject):
+    """The QRunnable cannot emit a signal, so we need a simple QObject
+    to hold the loaded signal.
+    """
+    indexLoaded = pyqtSignal(object)
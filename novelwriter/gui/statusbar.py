@@ -59,6 +59,13 @@ class GuiMainStatus(QStatusBar):
 
         xM = CONFIG.pxInt(8)
 
+        # The Document Preparation Status
+        self.prepText = QLabel(self.tr("Preparing document ..."), self)
+        self.prepText.setToolTip(self.tr("The document is read only until it is ready"))
+        self.prepText.setContentsMargins(0, 0, xM, 0)
+        self.prepText.setVisible(False)
+        self.addPermanentWidget(self.prepText)
+
         # The Spell Checker Language
         self.langIcon = QLabel("", self)
         self.langText = QLabel(self.tr("None"), self)
@@ -123,6 +130,7 @@ class GuiMainStatus(QStatusBar):
         self.setProjectStats(0, 0)
         self.setProjectStatus(nwTrinary.NEUTRAL)
         self.setDocumentStatus(nwTrinary.NEUTRAL)
+        self.updatePreparingStatus(False)
         self.updateTime()
         return
 
@@ -229,6 +237,12 @@ class GuiMainStatus(QStatusBar):
         self.setDocumentStatus(nwTrinary.NEGATIVE if status else nwTrinary.POSITIVE)
         return
 
+    @pyqtSlot(bool)
+    def updatePreparingStatus(self, status: bool) -> None:
+        """Show or hide the document preparation status."""
+        self.prepText.setVisible(status)
+        return
+
     ##
     #  Private Slots
     ##
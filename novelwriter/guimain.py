@@ -255,6 +255,7 @@ class GuiMain(QMainWindow):
         self.docEditor.novelItemMetaChanged.connect(self.novelView.updateNovelItemMeta)
         self.docEditor.novelStructureChanged.connect(self.novelView.refreshTree)
         self.docEditor.openDocumentRequest.connect(self._openDocument)
+        self.docEditor.preparingStatusChanged.connect(self.mainStatus.updatePreparingStatus)
         self.docEditor.requestNewNoteCreation.connect(SHARED.createNewNote)
         self.docEditor.requestNextDocument.connect(self.openNextDocument)
         self.docEditor.requestProjectItemRenamed.connect(self.projView.renameTreeItem)
@@ -584,12 +585,14 @@ class GuiMain(QMainWindow):
                 self.openDocument(fHandle, tLine=1, doScroll=True)
         return
 
-    def saveDocument(self, force: bool = False) -> None:
-        """Save the current documents."""
+    def saveDocument(self, force: bool = False, background: bool = False) -> None:
+        """Save the current documents. In background mode, the file is
+        written off the GUI thread.
+        """
         if SHARED.hasProject:
             self.docEditor.saveCursorPosition()
             if force or self.docEditor.docChanged:
-                self.docEditor.saveText()
+                self.docEditor.saveText(background=background)
         return
 
     @pyqtSlot()
@@ -1141,12 +1144,15 @@ class GuiMain(QMainWindow):
                 self.viewDocument(tHandle=tHandle, sTitle=sTitle)
         return
 
-    @pyqtSlot(str, int, int, bool)
+    @pyqtSlot(str, int, int, int, bool)
     def _openDocumentSelection(
-        self, tHandle: str, selStart: int, selLength: int, changeFocus: bool
+        self, tHandle: str, selStart: int, selLength: int, selLine: int, changeFocus: bool
     ) -> None:
-        """Open a document and select a section of the text."""
+        """Open a document, centre it on a line, and select a section of
+        the text on that line.
+        """
         if self.openDocument(tHandle, changeFocus=changeFocus):
+            self.docEditor.setCursorLine(selLine)
             self.docEditor.setCursorSelection(selStart, selLength)
         return
 
@@ -1241,7 +1247,7 @@ class GuiMain(QMainWindow):
         """Autosave of the document. This is a timer-activated slot."""
         if SHARED.hasProject and self.docEditor.docChanged:
             logger.debug("Auto-saving document")
-            self.saveDocument()
+            self.saveDocument(background=True)
         return
 
     @pyqtSlot()
@@ -0,0 +1,226 @@
+"""
+novelWriter – Headless Build
+============================
+
+File History:
+Created: 2026-10-19 [2.6b2] runHeadlessBuild
+
+This file is a part of novelWriter
+Copyright (C) 2026 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import getopt
+import logging
+import sys
+
+from pathlib import Path
+from time import time
+
+from PyQt5.QtWidgets import QApplication
+
+from novelwriter import CONFIG, SHARED
+from novelwriter.common import makeFileNameSafe
+from novelwriter.constants import nwLabels
+from novelwriter.core.buildreport import BuildReport
+from novelwriter.core.buildsettings import BuildCollection, BuildSettings
+from novelwriter.core.docbuild import NWBuildDocument
+from novelwriter.enum import nwBuildFmt
+from novelwriter.gui.theme import GuiTheme
+
+logger = logging.getLogger(__name__)
+
+# Exit Codes
+EXIT_OK    = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+
+# Number of slow documents to print with a report
+REPORT_TOP = 5
+
+HELP_MSG = (
+    "Usage: novelwriter --headless <project> --build=<id|name> --format=<fmt> --out=<path>\n"
+    "\n"
+    "Build a manuscript without opening the main GUI.\n"
+    "\n"
+    "Options:\n"
+    " -h, --help     Print this message.\n"
+    "     --build=   The build definition to use, by ID or name.\n"
+    "     --format=  The output format. Can be repeated to build multiple\n"
+    "                formats in a single pass. Valid formats are:\n"
+    "                {formats}.\n"
+    "     --out=     The output file or folder. If a folder is given, the\n"
+    "                file name is the build name. If multiple formats are\n"
+    "                given, the file extension is set per format.\n"
+    "     --force    Build even if nothing has changed since the last build\n"
+    "                of the same output file.\n"
+    "     --report=  Save a report of the time spent in each build stage\n"
+    "                per document. The report is saved as CSV if the file\n"
+    "                extension is .csv, otherwise as JSON. The slowest\n"
+    "                documents are also printed.\n"
+    "\n"
+    "Exit codes: 0 on success, 1 on build errors, 2 on invalid options.\n"
+)
+
+
+def runHeadlessBuild(args: list[str]) -> int:
+    """Run a manuscript build from the command line, and return an
+    exit code. Per-stage timing is printed to stdout, and errors are
+    printed to stderr.
+    """
+    formats = {fmt.name.lower(): fmt for fmt in nwBuildFmt}
+    helpMsg = HELP_MSG.format(formats=", ".join(formats))
+
+    try:
+        inOpts, inRemain = getopt.gnu_getopt(
+            args, "h", ["help", "build=", "format=", "out=", "force", "report="]
+        )
+    except getopt.GetoptError as exc:
+        print(helpMsg)
+        print(f"ERROR: {str(exc)}", file=sys.stderr)
+        return EXIT_USAGE
+
+    buildKey = ""
+    outPath = None
+    force = False
+    reportPath = None
+    bFormats: list[nwBuildFmt] = []
+    for inOpt, inArg in inOpts:
+        if inOpt in ("-h", "--help"):
+            print(helpMsg)
+            return EXIT_OK
+        elif inOpt == "--build":
+            buildKey = inArg.strip()
+        elif inOpt == "--format":
+            if (bFormat := formats.get(inArg.strip().lower())) is None:
+                print(f"ERROR: Unknown format '{inArg}'", file=sys.stderr)
+                return EXIT_USAGE
+            if bFormat not in bFormats:
+                bFormats.append(bFormat)
+        elif inOpt == "--out":
+            outPath = Path(inArg).expanduser().resolve()
+        elif inOpt == "--force":
+            force = True
+        elif inOpt == "--report":
+            reportPath = Path(inArg).expanduser().resolve()
+
+    if len(inRemain) != 1 or not buildKey or not bFormats or outPath is None:
+        print(helpMsg)
+        print("ERROR: A project, a build, a format and an output path are required",
+              file=sys.stderr)
+        return EXIT_USAGE
+
+    # Fonts, text documents and the project item model require a GUI
+    # application, but nothing is ever shown, so the offscreen platform
+    # is used
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([CONFIG.appName, "-platform", "offscreen"])
+        app.setApplicationName(CONFIG.appName)
+
+    CONFIG.loadConfig()
+    CONFIG.initLocalisation(app)
+    SHARED.initHeadless(GuiTheme())
+
+    tStart = time()
+    project = SHARED.project
+    if not project.openProject(inRemain[0]):
+        if project.lockStatus:
+            print("ERROR: The project is locked by another instance of novelWriter",
+                  file=sys.stderr)
+        else:
+            print(f"ERROR: Could not open project: {SHARED.lastAlert}", file=sys.stderr)
+        return EXIT_ERROR
+
+    tOpen = time()
+    _printStage("open", tOpen - tStart, project.data.name)
+
+    try:
+        if project.index.indexBroken:
+            project.index.rebuild()
+            _printStage("index", time() - tOpen, "rebuilt")
+
+        if not (build := _lookupBuild(BuildCollection(project), buildKey)):
+            print(f"ERROR: No build found matching '{buildKey}'", file=sys.stderr)
+            return EXIT_ERROR
+
+        if outPath.is_dir():
+            outPath = outPath / makeFileNameSafe(build.name)
+        elif not outPath.parent.is_dir():
+            print(f"ERROR: Output folder does not exist: {outPath.parent}", file=sys.stderr)
+            return EXIT_ERROR
+
+        targets = []
+        for bFormat in bFormats:
+            path = outPath
+            if len(bFormats) > 1 or not path.suffix:
+                path = path.with_suffix(nwLabels.BUILD_EXT[bFormat])
+            targets.append((path, bFormat))
+
+        docBuild = NWBuildDocument(project, build)
+        docBuild.queueAll()
+        report = BuildReport(build.name) if reportPath else None
+        docBuild.setReport(report)
+
+        errors = []
+        tBuild = time()
+        tLast = tBuild
+        for _ in docBuild.iterBuildDocuments(targets, force=force):
+            if docBuild.error:
+                errors.append(docBuild.error)
+            tLast = time()
+
+        tSave = time()
+        if skipped := docBuild.skipped:
+            _printStage("skip", 0.0, ", ".join(str(p) for p in skipped))
+        if written := docBuild.written:
+            _printStage("build", tLast - tBuild, f"{len(docBuild)} documents")
+            _printStage("write", tSave - tLast, ", ".join(str(p) for p in written))
+        if report is not None and reportPath:
+            for _, title, elapsed in report.slowest(REPORT_TOP):
+                _printStage("slow", elapsed, title)
+            if not report.saveReport(reportPath):
+                errors.append(f"Could not save report: {reportPath}")
+        _printStage("total", tSave - tStart, build.name)
+
+        if docBuild.error:
+            errors.append(docBuild.error)
+
+    finally:
+        # The build doesn't change the project, so only the lock is
+        # released here, and nothing but the build manifest is written
+        project.storage.closeSession()
+
+    for error in errors:
+        print(f"ERROR: {error}", file=sys.stderr)
+
+    return EXIT_ERROR if errors else EXIT_OK
+
+
+def _lookupBuild(builds: BuildCollection, key: str) -> BuildSettings | None:
+    """Look up a build by its ID, or else by its name."""
+    if build := builds.getBuild(key):
+        return build
+    for buildID, name in builds.builds():
+        if name == key:
+            return builds.getBuild(buildID)
+    return None
+
+
+def _printStage(stage: str, elapsed: float, info: str) -> None:
+    """Print the timing of a build stage."""
+    print(f"{stage:<8}{elapsed*1000.0:10.1f} ms  {info}")
+    return
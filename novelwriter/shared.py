@@ -55,7 +55,7 @@ class SharedData(QObject):
 
     __slots__ = (
         "_gui", "_theme", "_project", "_spelling", "_lockedBy", "_lastAlert",
-        "_idleTime", "_idleRefTime",
+        "_idleTime", "_idleRefTime", "_headless",
     )
 
     focusModeChanged = pyqtSignal(bool)
@@ -85,6 +85,7 @@ class SharedData(QObject):
         self._idleTime = 0.0
         self._idleRefTime = time()
         self._focusMode = False
+        self._headless = False
 
         self._clock = QTimer(self)
         self._clock.setInterval(1000)
@@ -149,6 +150,11 @@ class SharedData(QObject):
         """Return the last alert message."""
         return self._lastAlert
 
+    @property
+    def isHeadless(self) -> bool:
+        """Return True if running without the Main GUI."""
+        return self._headless
+
     ##
     #  Setters
     ##
@@ -172,11 +178,24 @@ class SharedData(QObject):
         self._clock.start()
         self._gui = gui
         self._theme = theme
+        self._headless = False
         self._resetProject()
         logger.debug("Ready: SharedData")
         logger.debug("Thread Pool Max Count: %d", QThreadPool.globalInstance().maxThreadCount())
         return
 
+    def initHeadless(self, theme: GuiTheme) -> None:
+        """Initialise the SharedData instance for use without the Main
+        GUI. Alerts are written to the log instead, and questions are
+        always answered with No.
+        """
+        self._gui = None
+        self._theme = theme
+        self._headless = True
+        self._resetProject()
+        logger.debug("Ready: SharedData (headless)")
+        return
+
     def closeDocument(self, tHandle: str | None = None) -> None:
         """Close the document editor, optionally a specific document."""
         if tHandle is None or tHandle == self.mainGui.docEditor.docHandle:
@@ -362,6 +381,9 @@ class SharedData(QObject):
 
     def info(self, text: str, info: str = "", details: str = "", log: bool = True) -> None:
         """Open an information alert box."""
+        if self._headless:
+            self._logAlert(logging.INFO, text, info, details)
+            return
         alert = _GuiAlert(self.mainGui, self.theme)
         alert.setMessage(text, info, details)
         alert.setAlertType(_GuiAlert.INFO, False)
@@ -373,6 +395,9 @@ class SharedData(QObject):
 
     def warn(self, text: str, info: str = "", details: str = "", log: bool = True) -> None:
         """Open a warning alert box."""
+        if self._headless:
+            self._logAlert(logging.WARNING, text, info, details)
+            return
         alert = _GuiAlert(self.mainGui, self.theme)
         alert.setMessage(text, info, details)
         alert.setAlertType(_GuiAlert.WARN, False)
@@ -385,6 +410,9 @@ class SharedData(QObject):
     def error(self, text: str, info: str = "", details: str = "", log: bool = True,
               exc: Exception | None = None) -> None:
         """Open an error alert box."""
+        if self._headless:
+            self._logAlert(logging.ERROR, text, info, details, exc)
+            return
         alert = _GuiAlert(self.mainGui, self.theme)
         alert.setMessage(text, info, details)
         alert.setAlertType(_GuiAlert.ERROR, False)
@@ -398,6 +426,9 @@ class SharedData(QObject):
 
     def question(self, text: str, info: str = "", details: str = "", warn: bool = False) -> bool:
         """Open a question box."""
+        if self._headless:
+            self._logAlert(logging.WARNING, text, info, details)
+            return False
         alert = _GuiAlert(self.mainGui, self.theme)
         alert.setMessage(text, info, details)
         alert.setAlertType(_GuiAlert.WARN if warn else _GuiAlert.ASK, True)
@@ -410,6 +441,17 @@ class SharedData(QObject):
     #  Internal Functions
     ##
 
+    def _logAlert(
+        self, level: int, text: str, info: str, details: str, exc: Exception | None = None
+    ) -> None:
+        """Write an alert to the log when there is no GUI to show it."""
+        message = " ".join(filter(None, [text, info, details]))
+        if exc:
+            message = f"{message} {type(exc).__name__}: {str(exc)}"
+        self._lastAlert = message
+        logger.log(level, message, stacklevel=3)
+        return
+
     def _resetProject(self) -> None:
         """Create a new project and spell checking instance."""
         from novelwriter.core.project import NWProject
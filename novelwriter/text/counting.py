@@ -6,6 +6,7 @@ File History:
 Created:   2019-04-22 [0.0.1] standardCounter
 Rewritten: 2024-02-27 [2.4b1] preProcessText, standardCounter
 Created:   2024-02-27 [2.4b1] bodyTextCounter
+Created:   2026-10-19 [2.6b2] IncrementalCounter
 
 This file is a part of novelWriter
 Copyright (C) 2024 Veronica Berglyd Olsen and novelWriter contributors
@@ -27,12 +28,16 @@ from __future__ import annotations
 
 import re
 
+from collections.abc import Iterable
+
 from novelwriter.constants import nwRegEx, nwUnicode
 
 RX_SC = re.compile(nwRegEx.FMT_SC)
 RX_SV = re.compile(nwRegEx.FMT_SV)
 RX_LO = re.compile(r"(?i)(?<!\\)(\[(?:vspace|newpage|new page)(:\d+)?)(?<!\\)(\])")
 
+HEADINGS = ("#### ", "### ", "## ", "# ", "#! ", "##! ", "###! ")
+
 
 def preProcessText(text: str, keepHeaders: bool = True) -> list[str]:
     """Strip formatting codes from the text and split into lines."""
@@ -138,3 +143,132 @@ def bodyTextCounter(text: str) -> tuple[int, int, int]:
         sCount += len("".join(words))
 
     return wCount, cCount, sCount
+
+
+class IncrementalCounter:
+    """Counter for Text Edited in Place
+
+    Keeps the counts of each line of a text that is edited in place, so
+    that only the changed lines need to be counted again. The totals are
+    the same as those of the standard counter for the full text.
+
+    Whether a line starts a new paragraph depends on the lines before
+    it, so each entry also records if the first counted line is
+    paragraph text, and if the last counted line ends a paragraph. The
+    latter is None if nothing in the line is counted, like for comments
+    and meta data.
+    """
+
+    __slots__ = ("_lines", "_cCount", "_wCount", "_pCount")
+
+    def __init__(self) -> None:
+        self._lines: list[list] = []
+        self._cCount = 0
+        self._wCount = 0
+        self._pCount = 0
+        return
+
+    def __len__(self) -> int:
+        """Return the number of lines."""
+        return len(self._lines)
+
+    ##
+    #  Properties
+    ##
+
+    @property
+    def counts(self) -> tuple[int, int, int]:
+        """Return the character, word and paragraph counts."""
+        return self._cCount, self._wCount, self._pCount
+
+    ##
+    #  Methods
+    ##
+
+    def setText(self, lines: Iterable[str]) -> None:
+        """Count all lines of a new text."""
+        self._lines = []
+        self._cCount = 0
+        self._wCount = 0
+        self._pCount = 0
+        self.update(0, 0, lines)
+        return
+
+    def update(self, first: int, removed: int, lines: Iterable[str]) -> None:
+        """Replace a number of lines, starting at line number 'first',
+        with new lines, and update the totals.
+        """
+        new = [self._countLine(line) for line in lines]
+        for entry in self._lines[first:first+removed]:
+            self._cCount -= entry[0]
+            self._wCount -= entry[1]
+            self._pCount -= entry[2] + entry[5]
+        for entry in new:
+            self._cCount += entry[0]
+            self._wCount += entry[1]
+            self._pCount += entry[2]
+        self._lines[first:first+removed] = new
+
+        # Paragraph starts are updated for the new lines, and for the
+        # lines after them up to the first line that is counted
+        prev = first - 1
+        while prev >= 0 and self._lines[prev][4] is None:
+            prev -= 1
+        prevEmpty = self._lines[prev][4] if prev >= 0 else True
+
+        end = first + len(new)
+        for i in range(first, len(self._lines)):
+            entry = self._lines[i]
+            start = entry[3] and prevEmpty
+            self._pCount += start - (entry[5] if i >= end else 0)
+            entry[5] = start
+            if entry[4] is not None:
+                prevEmpty = entry[4]
+                if i >= end:
+                    break
+
+        return
+
+    ##
+    #  Internal Functions
+    ##
+
+    def _countLine(self, text: str) -> list:
+        """Count a single line, which may itself contain line breaks.
+        The paragraph count only includes paragraphs that start after
+        the first counted line.
+        """
+        if not text:
+            return [0, 0, 0, False, True, False]
+
+        cCount = 0
+        wCount = 0
+        pCount = 0
+        isText = False
+        prevEmpty = None
+
+        for line in preProcessText(text):
+
+            countPara = True
+            if not line:
+                prevEmpty = True
+                continue
+
+            if line[0] == "#":
+                for prefix in HEADINGS:
+                    if line.startswith(prefix):
+                        line = line[len(prefix):]
+                        countPara = False
+                        break
+
+            wCount += len(line.split())
+            cCount += len(line)
+            if countPara:
+                if prevEmpty is None:
+                    isText = True
+                elif prevEmpty:
+                    pCount += 1
+
+            prevEmpty = not countPara
+
+        return [cCount, wCount, pCount, isText, prevEmpty, False]
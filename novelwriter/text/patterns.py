@@ -5,6 +5,7 @@ novelWriter – Text Pattern Functions
 File History:
 Created: 2024-06-01 [2.5rc1] RegExPatterns
 Created: 2024-11-04 [2.6b1]  DialogParser
+Created: 2026-10-19 [2.6b2]  AutoReplace
 
 This file is a part of novelWriter
 Copyright (C) 2024 Veronica Berglyd Olsen and novelWriter contributors
@@ -125,6 +126,84 @@ class RegExPatterns:
 REGEX_PATTERNS = RegExPatterns()
 
 
+def compileAutoReplace(autoReplace: dict[str, str]) -> AutoReplace | None:
+    """Compile a project auto-replace list into an object that applies
+    it to a text. Returns None if the list is empty.
+    """
+    return AutoReplace(autoReplace) if autoReplace else None
+
+
+class AutoReplace:
+    """Replace <key> tokens in a text from a list of replacements.
+
+    The text is scanned once from left to right. At each "<", the token
+    up to the next ">" is looked up in the replacement list, so the cost
+    doesn't grow with the number of keys. The result is the same as for
+    a regex alternation of all the keys. Keys that themselves contain a
+    ">" are matched against the following ">" characters as well, and
+    the first key in the list wins, as it would in the alternation.
+    """
+
+    __slots__ = ("_replace", "_order", "_maxLen", "_nested")
+
+    def __init__(self, autoReplace: dict[str, str]) -> None:
+        self._replace = dict(autoReplace)
+        self._order = {key: n for n, key in enumerate(autoReplace)}
+        self._maxLen = max((len(key) for key in autoReplace), default=0)
+        self._nested = any(">" in key for key in autoReplace)
+        return
+
+    def __call__(self, text: str) -> str:
+        """Apply the replacements to a text."""
+        replace = self._replace
+        maxLen = self._maxLen
+        find = text.find
+
+        result = []
+        pos = 0
+        close = -1
+        start = find("<")
+        while start >= 0:
+            if close <= start and (close := find(">", start + 1)) < 0:
+                break
+
+            key = None
+            if close - start - 1 <= maxLen:
+                if self._nested:
+                    key, end = self._lookupNested(text, start, close)
+                elif (token := text[start+1:close]) in replace:
+                    key, end = token, close
+
+            if key is None:
+                start = find("<", start + 1)
+            else:
+                result.append(text[pos:start])
+                result.append(replace[key])
+                pos = end + 1
+                start = find("<", pos)
+
+        if not result:
+            return text
+
+        result.append(text[pos:])
+        return "".join(result)
+
+    def _lookupNested(self, text: str, start: int, close: int) -> tuple[str | None, int]:
+        """Look up the first matching key for tokens ending at any of
+        the ">" characters within reach of the longest key.
+        """
+        found = None
+        end = close
+        while close >= 0 and close - start - 1 <= self._maxLen:
+            token = text[start+1:close]
+            if token in self._replace and (
+                found is None or self._order[token] < self._order[found]
+            ):
+                found, end = token, close
+            close = text.find(">", close + 1)
+        return found, end
+
+
 class DialogParser:
 
     __slots__ = (
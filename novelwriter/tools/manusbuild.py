@@ -27,7 +27,7 @@ import logging
 
 from pathlib import Path
 
-from PyQt5.QtCore import QTimer, pyqtSlot
+from PyQt5.QtCore import QEventLoop, QThreadPool, QTimer, pyqtSlot
 from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtWidgets import (
     QAbstractButton, QAbstractItemView, QDialogButtonBox, QFileDialog,
@@ -36,10 +36,11 @@ from PyQt5.QtWidgets import (
 )
 
 from novelwriter import CONFIG, SHARED
-from novelwriter.common import makeFileNameSafe, openExternalPath
+from novelwriter.common import formatFileFilter, makeFileNameSafe, openExternalPath
 from novelwriter.constants import nwLabels
+from novelwriter.core.buildreport import BuildReport
 from novelwriter.core.buildsettings import BuildSettings
-from novelwriter.core.docbuild import NWBuildDocument
+from novelwriter.core.docbuild import BackgroundBuild, NWBuildDocument
 from novelwriter.core.item import NWItem
 from novelwriter.enum import nwBuildFmt
 from novelwriter.extensions.modified import NDialog, NIconToolButton
@@ -66,6 +67,8 @@ class GuiManuscriptBuild(NDialog):
 
         self._parent = parent
         self._build = build
+        self._buildJob: BackgroundBuild | None = None
+        self._lastReport: BuildReport | None = None
 
         self.setWindowTitle(self.tr("Build Manuscript"))
         self.setMinimumWidth(CONFIG.pxInt(500))
@@ -186,6 +189,15 @@ class GuiManuscriptBuild(NDialog):
         self.btnOpen.setAutoDefault(False)
         self.buttonBox.addButton(self.btnOpen, QtRoleAction)
 
+        self.btnReport = QPushButton(
+            SHARED.theme.getIcon("document"), self.tr("Save Report"), self
+        )
+        self.btnReport.setIconSize(bSz)
+        self.btnReport.setAutoDefault(False)
+        self.btnReport.setEnabled(False)
+        self.btnReport.setToolTip(self.tr("Save the build stage timings of the last build"))
+        self.buttonBox.addButton(self.btnReport, QtRoleAction)
+
         self.btnBuild = QPushButton(SHARED.theme.getIcon("export"), self.tr("&Build"), self)
         self.btnBuild.setIconSize(bSz)
         self.btnBuild.setAutoDefault(True)
@@ -252,8 +264,11 @@ class GuiManuscriptBuild(NDialog):
 
     def closeEvent(self, event: QCloseEvent) -> None:
         """Capture the user closing the window so we can save GUI
-        settings.
+        settings. A running build is cancelled, and stops before the
+        next document.
         """
+        if self._buildJob:
+            self._buildJob.cancel()
         self._saveSettings()
         event.accept()
         self.softDelete()
@@ -272,10 +287,18 @@ class GuiManuscriptBuild(NDialog):
                 self._runBuild()
             elif button == self.btnOpen:
                 self._openOutputFolder()
+            elif button == self.btnReport:
+                self._saveReport()
         elif role == QtRoleReject:
             self.close()
         return
 
+    @pyqtSlot(object, int)
+    def _buildProgress(self, docBuild: NWBuildDocument, step: int) -> None:
+        """Update the progress bar of the running build."""
+        self.buildProgress.setValue(step)
+        return
+
     @pyqtSlot()
     def _doSelectPath(self) -> None:
         """Select a folder for output."""
@@ -337,19 +360,54 @@ class GuiManuscriptBuild(NDialog):
 
         docBuild = NWBuildDocument(SHARED.project, self._build)
         docBuild.queueAll()
+        report = BuildReport(self._build.name)
+        docBuild.setReport(report)
+
+        # The build runs in the thread pool, while a local event loop
+        # keeps the dialog responsive until it is done
+        job = BackgroundBuild(docBuild, docBuild.iterBuildDocument(buildPath, bFormat))
+        loop = QEventLoop(self)
+        job.signals.buildProgress.connect(self._buildProgress)
+        job.signals.buildDone.connect(loop.quit)
 
         self.buildProgress.setMaximum(len(docBuild))
-        for i, _ in docBuild.iterBuildDocument(buildPath, bFormat):
-            self.buildProgress.setValue(i+1)
+        self.buttonBox.setEnabled(False)
+        self._buildJob = job
+        SHARED.runInThreadPool(job)
+        loop.exec()
+        if not job.isFinished():
+            # The event loop returns early if the application is quitting
+            QThreadPool.globalInstance().waitForDone()
+        self._buildJob = None
+        self.buttonBox.setEnabled(True)
+
+        if job.isCancelled():
+            self._resetProgress()
+            return False
 
         self._build.setLastBuildPath(bPath)
         self._build.setLastBuildName(bName)
         self._build.setLastFormat(bFormat)
 
+        self._lastReport = report
+        self.btnReport.setEnabled(True)
+
         QTimer.singleShot(3000, self._resetProgress)
 
         return True
 
+    def _saveReport(self) -> None:
+        """Save the report of the last build."""
+        if (report := self._lastReport) is not None:
+            name = f"{self.buildName.text().strip()} - Report.json"
+            if path := QFileDialog.getSaveFileName(
+                self, self.tr("Save Build Report"), str(self._build.lastBuildPath / name),
+                formatFileFilter(["*.json", "*.csv"])
+            )[0]:
+                if not report.saveReport(Path(path)):
+                    SHARED.error(self.tr("Could not save the build report."))
+        return
+
     def _getSelectedFormat(self) -> nwBuildFmt | None:
         """Get the currently selected format."""
         items = self.listFormats.selectedItems()
@@ -45,7 +45,7 @@ from novelwriter import CONFIG, SHARED
 from novelwriter.common import fuzzyTime
 from novelwriter.constants import nwLabels, nwStats, trConst
 from novelwriter.core.buildsettings import BuildCollection, BuildSettings
-from novelwriter.core.docbuild import NWBuildDocument
+from novelwriter.core.docbuild import BackgroundBuild, NWBuildDocument
 from novelwriter.extensions.modified import NIconToggleButton, NIconToolButton, NToolDialog
 from novelwriter.extensions.progressbars import NProgressCircle
 from novelwriter.extensions.switch import NSwitch
@@ -83,6 +83,9 @@ class GuiManuscript(NToolDialog):
 
         self._builds = BuildCollection(SHARED.project)
         self._buildMap: dict[str, QListWidgetItem] = {}
+        self._previewJob: BackgroundBuild | None = None
+        self._previewBuild: BuildSettings | None = None
+        self._previewStart = 0.0
 
         self.setWindowTitle(self.tr("Build Manuscript"))
         self.setMinimumWidth(CONFIG.pxInt(600))
@@ -288,6 +291,7 @@ class GuiManuscript(NToolDialog):
         dialog open.
         """
         self._saveSettings()
+        self._cancelPreview()
         for obj in SHARED.mainGui.children():
             # Make sure we don't have any settings windows open
             if isinstance(obj, GuiBuildSettings) and obj.isVisible():
@@ -351,6 +355,9 @@ class GuiManuscript(NToolDialog):
         self._updateBuildItem(build)
         if (current := self.buildList.currentItem()) and current.data(self.D_KEY) == build.buildID:
             self._updateBuildDetails(current, current)
+        if self._previewJob and self._previewBuild and self._previewBuild.buildID == build.buildID:
+            # The running preview is out of date, so start over
+            self._generatePreview()
         return
 
     @pyqtSlot()
@@ -361,7 +368,8 @@ class GuiManuscript(NToolDialog):
         if not (build := self._getSelectedBuild()):
             return
 
-        start = time()
+        self._cancelPreview()
+        self._previewStart = time()
         showNewPage = self.swtNewPage.isChecked()
 
         # Make sure editor content is saved before we start
@@ -370,10 +378,36 @@ class GuiManuscript(NToolDialog):
         docBuild = NWBuildDocument(SHARED.project, build)
         docBuild.queueAll()
 
+        self._previewBuild = build
+        self._previewJob = BackgroundBuild(docBuild, docBuild.iterBuildPreview(showNewPage))
+        self._previewJob.signals.buildProgress.connect(self._previewProgress)
+        self._previewJob.signals.buildDone.connect(self._previewDone)
+
         self.docPreview.beginNewBuild(len(docBuild))
-        for step, _ in docBuild.iterBuildPreview(showNewPage):
-            self.docPreview.buildStep(step + 1)
-            QApplication.processEvents()
+        SHARED.runInThreadPool(self._previewJob)
+
+        return
+
+    @pyqtSlot(object, int)
+    def _previewProgress(self, docBuild: NWBuildDocument, step: int) -> None:
+        """Forward the progress of the current preview build."""
+        if (job := self._previewJob) and docBuild is job.docBuild:
+            self.docPreview.buildStep(step)
+        return
+
+    @pyqtSlot(object, bool)
+    def _previewDone(self, docBuild: NWBuildDocument, completed: bool) -> None:
+        """Process the result of a finished preview build."""
+        job, build = self._previewJob, self._previewBuild
+        if not (job and build and docBuild is job.docBuild):
+            # This is a left-over signal from a cancelled build
+            return
+
+        self._previewJob = None
+        self._previewBuild = None
+        if not completed:
+            self.docPreview.buildProgress.setVisible(False)
+            return
 
         buildObj = docBuild.lastBuild
         assert isinstance(buildObj, ToQTextDocument)
@@ -388,7 +422,7 @@ class GuiManuscript(NToolDialog):
         self.docStats.updateStats(buildObj.textStats)
         self.buildOutline.updateOutline(buildObj.textOutline)
 
-        logger.debug("Build completed in %.3f ms", 1000*(time()-start))
+        logger.debug("Build completed in %.3f ms", 1000*(time() - self._previewStart))
 
         return
 
@@ -429,6 +463,17 @@ class GuiManuscript(NToolDialog):
                 return build
         return None
 
+    def _cancelPreview(self) -> None:
+        """Cancel a running preview build, and discard its result. The
+        thread pool owns the build job, which stops before the next
+        document, and any late signals from it are ignored by the slots.
+        """
+        if job := self._previewJob:
+            job.cancel()
+        self._previewJob = None
+        self._previewBuild = None
+        return
+
     def _saveSettings(self) -> None:
         """Save the user GUI settings."""
         buildOrder = []
@@ -842,7 +887,6 @@ class _PreviewWidget(QTextBrowser):
     def buildStep(self, value: int) -> None:
         """Update the progress bar value."""
         self.buildProgress.setValue(value)
-        QApplication.processEvents()
         return
 
     def setContent(self, document: QTextDocument) -> None:
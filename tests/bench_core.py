@@ -0,0 +1,57 @@
+"""
+novelWriter – Core Benchmarks
+=============================
+
+This file is a part of novelWriter
+Copyright (C) 2020 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import timeit
+
+import pytest
+
+from novelwriter.core.coretools import DocSearch
+from novelwriter.core.project import NWProject
+
+REPEAT = 5
+
+
+def bestOf(func, number: int) -> float:
+    """Return the best time of a function call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+@pytest.mark.bench
+def testBenchCore_SearchText(mockGUI, ipsumText):
+    """Benchmark searching a single document with 10k hits."""
+    paras = []
+    for i in range(2000):
+        words = ipsumText[i % len(ipsumText)].split()[:60]
+        for j in range(0, 60, 12):
+            words[j] = "Jane"
+        paras.append(" ".join(words))
+    text = "\n\n".join(paras)
+
+    search = DocSearch()
+    search.setCaseSensitive(True)
+    assert search.prepareSearch(NWProject(), "Jane") == []
+    results, capped = search.searchText(text, limit=20000)
+    assert len(results) == 10000
+    assert capped is False
+
+    elapsed = bestOf(lambda: search.searchText(text, limit=20000), 1)
+    print(f"\nsearchText: {len(text)} characters, {len(results)} hits, {elapsed*1000:.1f} ms")
@@ -0,0 +1,78 @@
+"""
+novelWriter – GUI Benchmarks
+============================
+
+This file is a part of novelWriter
+Copyright (C) 2020 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import random
+import timeit
+
+import pytest
+
+from PyQt5.QtGui import QTextDocument
+
+from novelwriter import SHARED
+from novelwriter.gui.dochighlight import GuiDocHighlighter
+
+REPEAT = 5
+
+N_HANDLE = "7a992350f3eb6"  # A novel document in the lipsum project
+
+
+def bestOf(func, number: int) -> float:
+    """Return the best time of a function call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+@pytest.mark.bench
+def testBenchGui_Highlighter(nwGUI, prjLipsum):
+    """Benchmark highlighting the full text of the lipsum project, and
+    paragraphs with a lot of emphasis.
+    """
+    assert nwGUI.openProject(prjLipsum) is True
+    assert SHARED.project.tree[N_HANDLE].isDocumentLayout()  # type: ignore
+    text = "\n".join(
+        path.read_text(encoding="utf-8") for path in sorted((prjLipsum / "content").glob("*.nwd"))
+    )
+
+    rnd = random.Random(4)
+    words = text.split()
+    paras = []
+    for i in range(400):
+        para = rnd.sample(words, 120)
+        for j in range(0, 120, 15):
+            para[j] = f"_{para[j]}_" if j % 2 else f"**{para[j]} {para[j+1]}**"
+        paras.append(" ".join(para))
+    marked = "\n\n".join(paras)
+
+    qDoc = QTextDocument()
+    highlight = GuiDocHighlighter(qDoc)
+    highlight.initHighlighter()
+    highlight.setHandle(N_HANDLE)
+    highlight.setSpellCheck(False)
+
+    for label, content in (("lipsum", "\n".join([text]*4)), ("marked", marked)):
+        qDoc.setPlainText(content)
+        elapsed = bestOf(highlight.rehighlight, 1)
+        print(
+            f"\nhighlighter {label}: {qDoc.blockCount()} blocks, "
+            f"{len(content)} characters, {elapsed*1000:.1f} ms"
+        )
+
+    nwGUI.closeProject()
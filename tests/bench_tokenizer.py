@@ -0,0 +1,141 @@
+"""
+novelWriter – Tokenizer Benchmarks
+==================================
+
+This file is a part of novelWriter
+Copyright (C) 2020 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import random
+import re
+import timeit
+
+from pathlib import Path
+
+import pytest
+
+from novelwriter.core.project import NWProject
+from novelwriter.formats.tohtml import ToHtml
+from novelwriter.formats.tomarkdown import ToMarkdown
+from novelwriter.text.patterns import AutoReplace
+
+REPEAT = 5
+
+
+def lipsumParagraphs(prjPath: Path) -> list[str]:
+    """Return the text paragraphs of the lipsum project."""
+    paras = []
+    for path in sorted((prjPath / "content").glob("*.nwd")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line and not line.startswith(("#", "@", "%")):
+                paras.append(line)
+    return paras
+
+
+def bestOf(func, number: int) -> float:
+    """Return the best time of a function call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+@pytest.mark.bench
+def testBenchTokenizer_ExtractFormats(mockGUI, prjLipsum):
+    """Benchmark format extraction on the lipsum paragraphs, which are
+    mostly plain text, and on paragraphs with a lot of formatting.
+    """
+    project = NWProject()
+    tokens = ToMarkdown(project, False)
+    plain = lipsumParagraphs(prjLipsum)
+    marked = [
+        "Some **bold** and _italic_ and ~~strike~~ text with [b]codes[/b], "
+        "a [footnote:abcd] and a http://example.com link."
+    ] * 50
+
+    for label, paras in (("plain", plain), ("marked", marked)):
+        elapsed = bestOf(lambda: [tokens._extractFormats(p) for p in paras], 10)
+        print(
+            f"\nextractFormats {label}: {len(paras)} paragraphs, "
+            f"{elapsed/len(paras)*1e6:.2f} us/paragraph"
+        )
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize("counting", [True, False])
+def testBenchTokenizer_BuildThroughput(mockGUI, prjLipsum, counting):
+    """Benchmark the build throughput in words per second, with and
+    without counting the text stats.
+    """
+    sentences = " ".join(lipsumParagraphs(prjLipsum)).split(". ")
+    docs = []
+    words = 0
+    for n in range(50):
+        lines = [f"### Scene {n + 1}", "@pov: Jane", "%Synopsis: Stuff happens."]
+        for i in range(n, n + 60):
+            para = ". ".join(sentences[i % len(sentences):i % len(sentences) + 3]) + "."
+            if i % 5 == 0:
+                para = f"\u2014 {para} \u2013 _she said_."
+            if i % 7 == 0:
+                para = f"**{para}**"
+            lines.append(para)
+            words += len(para.split())
+        docs.append("\n\n".join(lines))
+
+    def build() -> None:
+        html = ToHtml(NWProject())
+        html._isNovel = True
+        if not counting:
+            html.setCounting(False)
+        for n, text in enumerate(docs):
+            html._handle = f"{n:013x}"
+            html._text = text
+            html.tokenizeText()
+            html.countStats()
+            html.doConvert()
+
+    elapsed = bestOf(build, 1)
+    print(
+        f"\nbuild counting={counting}: {len(docs)} documents, {words} words, "
+        f"{words/elapsed/1000:.0f}k words/s"
+    )
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize("keys", [10, 100, 1000])
+def testBenchTokenizer_AutoReplace(keys):
+    """Benchmark the auto-replace engine against a regex alternation
+    of all the keys, on a text of 20k words.
+    """
+    rnd = random.Random(1)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do".split()
+    autoReplace = {
+        "".join(rnd.choice(letters) for _ in range(rnd.randint(3, 12))): f"Glossary term {i}"
+        for i in range(keys)
+    }
+    tokens = list(autoReplace)
+    text = " ".join(
+        f"<{rnd.choice(tokens)}>" if rnd.random() < 0.02 else rnd.choice(words)
+        for _ in range(20000)
+    )
+
+    repDict = {f"<{key}>": value for key, value in autoReplace.items()}
+    rxReplace = re.compile("|".join(re.escape(key) for key in repDict), flags=re.DOTALL)
+    engine = AutoReplace(autoReplace)
+    assert engine(text) == rxReplace.sub(lambda x: repDict[x.group(0)], text)
+
+    tRegEx = bestOf(lambda: rxReplace.sub(lambda x: repDict[x.group(0)], text), 10)
+    tEngine = bestOf(lambda: engine(text), 10)
+    print(f"\nautoReplace {keys} keys: regex {tRegEx*1000:.2f} ms, engine {tEngine*1000:.2f} ms")
@@ -20,11 +20,14 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+from time import sleep
 from unittest.mock import MagicMock
 
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtWidgets import QWidget
 
+from novelwriter.core.docbuild import BackgroundBuild
+
 
 class MockGuiMain(QWidget):
 
@@ -88,6 +91,20 @@ class MockApp:
 # ===============
 # Mock functions that will raise errors instead.
 
+class MockSlowBuild(BackgroundBuild):
+    """A background build that doesn't start until it is cancelled,
+    while the hold flag is set.
+    """
+
+    hold = True
+
+    def run(self):
+        while self.hold and not self.isCancelled():
+            sleep(0.01)
+        super().run()
+        return
+
+
 def causeOSError(*args, **kwargs):
     raise OSError("Mock OSError")
 
@@ -0,0 +1,166 @@
+"""
+novelWriter – Headless Build Tester
+===================================
+
+This file is a part of novelWriter
+Copyright (C) 2026 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import pytest
+
+from novelwriter import SHARED, main
+from novelwriter.constants import nwFiles
+from novelwriter.core.buildsettings import BuildCollection, BuildSettings
+from novelwriter.core.project import NWProject
+
+from tests.mocked import MockTheme
+
+
+def runBuild(args: list[str], fncPath) -> int:
+    """Run the build command and return the exit code."""
+    with pytest.raises(SystemExit) as ex:
+        main([f"--config={fncPath}", f"--data={fncPath}", "--headless", *args])
+    return ex.value.code  # type: ignore
+
+
+@pytest.mark.base
+def testBaseHeadless_Alerts(monkeypatch, caplog):
+    """Check that alerts are logged when running headless."""
+    monkeypatch.setattr(SHARED, "_headless", False)
+    monkeypatch.setattr(SHARED, "_project", None)
+    monkeypatch.setattr(SHARED, "_theme", None)
+
+    SHARED.initHeadless(MockTheme())  # type: ignore
+    assert SHARED.isHeadless is True
+    assert SHARED.project.isValid is False
+
+    caplog.clear()
+    SHARED.info("Info", info="Text")
+    assert SHARED.lastAlert == "Info Text"
+    SHARED.warn("Warning")
+    assert SHARED.lastAlert == "Warning"
+    SHARED.error("Error", exc=ValueError("Bad"))
+    assert SHARED.lastAlert == "Error ValueError: Bad"
+    assert SHARED.question("Question?") is False
+    assert SHARED.lastAlert == "Question?"
+    assert caplog.messages == ["Info Text", "Warning", "Error ValueError: Bad", "Question?"]
+
+
+@pytest.mark.base
+def testBaseHeadless_Build(monkeypatch, capsys, mockGUI, prjLipsum, fncPath):
+    """Check running a build without the GUI."""
+    monkeypatch.setattr(SHARED, "_headless", False)
+    monkeypatch.setattr(SHARED, "_project", None)
+
+    project = NWProject()
+    project.openProject(prjLipsum)
+    build = BuildSettings()
+    build.setName("Nightly")
+    BuildCollection(project).setBuild(build)
+    project.closeProject()
+
+    outDir = fncPath / "out"
+    outDir.mkdir()
+    lockFile = prjLipsum / nwFiles.PROJ_LOCK
+
+    # Invalid options
+    assert runBuild(["--help"], fncPath) == 0
+    assert runBuild([str(prjLipsum), "--build=Nightly", f"--out={outDir}"], fncPath) == 2
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=foo", f"--out={outDir}"], fncPath
+    ) == 2
+    assert runBuild(["--foo"], fncPath) == 2
+    assert runBuild([], fncPath) == 2
+    assert "--build=" in capsys.readouterr().out
+    capsys.readouterr()
+
+    # Unknown build
+    assert runBuild(
+        [str(prjLipsum), "--build=Foo", "--format=fodt", f"--out={outDir}"], fncPath
+    ) == 1
+    assert "No build found matching 'Foo'" in capsys.readouterr().err
+    assert not lockFile.exists()
+
+    # Missing output folder
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=fodt", f"--out={fncPath}/a/b"], fncPath
+    ) == 1
+    assert "Output folder does not exist" in capsys.readouterr().err
+
+    # Build by name into a folder
+    assert runBuild(
+        [str(prjLipsum), "--build", "Nightly", "--format", "FODT", "--out", str(outDir)], fncPath
+    ) == 0
+    assert (outDir / "Nightly.fodt").is_file()
+    stages = [line.split()[0] for line in capsys.readouterr().out.splitlines()]
+    assert stages == ["open", "build", "write", "total"]
+    assert not lockFile.exists()
+
+    # Unchanged input is skipped, unless forced
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=fodt", f"--out={outDir}"], fncPath
+    ) == 0
+    stages = [line.split()[0] for line in capsys.readouterr().out.splitlines()]
+    assert stages == ["open", "skip", "total"]
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=fodt", "--force", f"--out={outDir}"], fncPath
+    ) == 0
+    stages = [line.split()[0] for line in capsys.readouterr().out.splitlines()]
+    assert stages == ["open", "build", "write", "total"]
+
+    # Build with a report
+    reportFile = fncPath / "report.json"
+    assert runBuild([
+        str(prjLipsum), "--build=Nightly", "--format=fodt", "--force",
+        f"--report={reportFile}", f"--out={outDir}"
+    ], fncPath) == 0
+    stages = [line.split()[0] for line in capsys.readouterr().out.splitlines()]
+    assert stages == ["open", "build", "write"] + ["slow"]*5 + ["total"]
+    assert reportFile.is_file()
+
+    # Build by ID to multiple formats
+    assert runBuild([
+        str(prjLipsum), f"--build={build.buildID}", "--format=html", "--format=ext_md",
+        f"--out={outDir}/Book"
+    ], fncPath) == 0
+    assert (outDir / "Book.html").is_file()
+    assert (outDir / "Book.md").is_file()
+    assert not lockFile.exists()
+
+    # Locked project
+    lockFile.write_text("other;linux;1;1")
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=fodt", f"--out={outDir}"], fncPath
+    ) == 1
+    assert "The project is locked" in capsys.readouterr().err
+    assert lockFile.exists()
+
+    # Build errors
+    monkeypatch.setattr("novelwriter.formats.toodt.ToOdt.saveDocument", lambda *a: 1/0)
+    lockFile.unlink()
+    assert runBuild(
+        [str(prjLipsum), "--build=Nightly", "--format=fodt", "--force", f"--out={outDir}"], fncPath
+    ) == 1
+    assert "ZeroDivisionError" in capsys.readouterr().err
+
+    # Report errors
+    monkeypatch.setattr("novelwriter.core.buildreport.BuildReport.saveReport", lambda *a: False)
+    assert runBuild([
+        str(prjLipsum), "--build=Nightly", "--format=fodt", "--force",
+        f"--report={reportFile}", f"--out={outDir}"
+    ], fncPath) == 1
+    assert "Could not save report" in capsys.readouterr().err
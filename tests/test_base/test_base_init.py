@@ -97,6 +97,13 @@ def testBaseInit_Options(monkeypatch, fncPath):
     assert logger.getEffectiveLevel() == logging.WARNING
     assert nwGUI.closeMain() == "closeMain"
 
+    # A project path named build opens the GUI
+    nwGUI = main(
+        ["--testmode", f"--config={fncPath}", f"--data={fncPath}", "build"]
+    )
+    assert nwGUI is not None
+    assert nwGUI.closeMain() == "closeMain"
+
     # Log Levels w/Color
     nwGUI = main(
         ["--testmode", "--info", "--color", f"--config={fncPath}", f"--data={fncPath}"]
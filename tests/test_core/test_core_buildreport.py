@@ -0,0 +1,146 @@
+"""
+novelWriter – BuildReport Class Tester
+======================================
+
+This file is a part of novelWriter
+Copyright (C) 2026 Veronica Berglyd Olsen and novelWriter contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+"""
+from __future__ import annotations
+
+import csv
+import json
+
+from time import sleep
+
+import pytest
+
+from novelwriter.core.buildreport import BuildReport
+from novelwriter.core.buildsettings import BuildSettings
+from novelwriter.core.docbuild import NWBuildDocument
+from novelwriter.core.project import NWProject
+from novelwriter.enum import nwBuildFmt
+
+from tests.mocked import causeOSError
+
+
+@pytest.mark.core
+def testCoreBuildReport_Measure(monkeypatch, fncPath):
+    """Test collecting and saving build stage measurements."""
+    report = BuildReport("Test")
+    report.addDocument("0000000000001", "One")
+    report.addDocument("0000000000002", "Two")
+    report.addOutput(fncPath / "Test.md")
+    assert len(report) == 2
+    assert "0000000000001" in report
+    assert str(fncPath / "Test.md") in report
+    assert "0000000000003" not in report
+
+    # Stages are accumulated per document
+    with report.measure("0000000000001", "tokenize"):
+        sleep(0.002)
+    with report.measure("0000000000002", "tokenize"):
+        sleep(0.010)
+    with report.measure("0000000000002", "convert"), report.countBlocks("0000000000002"):
+        data = [str(i) for i in range(1000)]
+    with report.measure(str(fncPath / "Test.md"), "save"):
+        pass
+    assert len(data) == 1000
+
+    # Unknown keys and stages are errors
+    with pytest.raises(KeyError):
+        with report.measure("0000000000003", "tokenize"):
+            pass
+    with pytest.raises(ValueError):
+        with report.measure("0000000000001", "foo"):
+            pass
+
+    slowest = report.slowest()
+    assert [(k, t) for k, t, _ in slowest] == [("0000000000002", "Two"), ("0000000000001", "One")]
+    assert slowest[0][2] > 0.010
+    assert report.slowest(1) == slowest[:1]
+
+    data = report.packData()
+    assert data["build"] == "Test"
+    assert data["slowest"] == ["0000000000002", "0000000000001"]
+    assert list(data["stages"]) == list(BuildReport.STAGES)
+    assert data["time"] == pytest.approx(sum(data["stages"].values()))
+    assert [d["title"] for d in data["documents"]] == ["One", "Two"]
+    assert list(data["documents"][1]["stages"]) == ["tokenize", "convert"]
+    assert data["documents"][0]["blocks"] == 0
+    assert data["documents"][1]["blocks"] >= 1000
+    assert data["outputs"][0]["path"] == str(fncPath / "Test.md")
+    assert list(data["outputs"][0]["stages"]) == ["save"]
+
+    # Save as JSON
+    jsonFile = fncPath / "report.json"
+    assert report.saveReport(jsonFile) is True
+    assert json.loads(jsonFile.read_text(encoding="utf-8"))["slowest"] == data["slowest"]
+
+    # Save as CSV
+    csvFile = fncPath / "report.csv"
+    assert report.saveReport(csvFile) is True
+    with open(csvFile, mode="r", encoding="utf-8") as fObj:
+        rows = list(csv.reader(fObj))
+    assert len(rows) == 4
+    assert rows[0][:4] == ["key", "title", "total_ms", "read_ms"]
+    assert rows[0][-2:] == ["save_ms", "blocks"]
+    assert [r[1] for r in rows[1:]] == ["One", "Two", "Test.md"]
+    assert float(rows[2][2]) > 10.0
+
+    # Save errors
+    monkeypatch.setattr("builtins.open", causeOSError)
+    assert report.saveReport(jsonFile) is False
+
+
+@pytest.mark.core
+def testCoreBuildReport_Build(mockGUI, prjLipsum, fncPath):
+    """Test collecting a report from a build."""
+    project = NWProject()
+    project.openProject(prjLipsum)
+
+    build = BuildSettings()
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+
+    report = BuildReport(build.name)
+    docBuild.setReport(report)
+    targets = [(fncPath / "Test.md", nwBuildFmt.STD_MD), (fncPath / "Test.odt", nwBuildFmt.ODT)]
+    assert list(docBuild.iterBuildDocuments(targets))
+
+    data = report.packData(count=3)
+    documents = {d["handle"]: d for d in data["documents"]}
+    assert len(documents) == len(report) > 3
+    assert len(data["slowest"]) == 3
+    for entry in documents.values():
+        assert list(entry["stages"]) == ["read", "preprocess", "tokenize", "count", "convert"]
+    assert [o["path"] for o in data["outputs"]] == [str(p) for p, _ in targets]
+    assert data["stages"]["save"] > 0.0
+    assert all(o["blocks"] != 0 for o in data["outputs"])
+
+    # The preview doesn't read in the build record, so it is measured
+    # in the build loop, and it also builds the outline
+    report = BuildReport(build.name)
+    docBuild.setReport(report)
+    assert list(docBuild.iterBuildPreview(False))
+    for entry in report.packData()["documents"]:
+        assert list(entry["stages"]) == [
+            "read", "preprocess", "tokenize", "count", "outline", "convert"
+        ]
+
+    # Without a report, nothing is measured
+    docBuild.setReport(None)
+    assert list(docBuild.iterBuildDocuments(targets))
+    assert len(report.packData()["outputs"]) == 0
@@ -214,6 +214,22 @@ def testCoreBuildSettings_BuildValues():
     assert more["settings"][boolSetting] is True
     assert more["settings"][floatSetting] == 2.5
 
+    # All values, type safe
+    values = another.getValues()
+    assert values[strSetting] == "foobar"
+    assert values[intSetting] == 42
+    assert values[boolSetting] is True
+    assert values[floatSetting] == 2.5
+    assert "foo" not in values
+
+    # Settings digest follows the values
+    digest = another.settingsDigest()
+    assert digest == build.settingsDigest()
+    another.setName("New Name")
+    assert another.settingsDigest() == digest
+    another.setValue(floatSetting, 3.5)
+    assert another.settingsDigest() != digest
+
 
 @pytest.mark.core
 def testCoreBuildSettings_Filters(mockGUI, fncPath: Path, mockRnd):
@@ -420,7 +420,7 @@ def testCoreTools_DocSearch(monkeypatch, mockGUI, fncPath, mockRnd, ipsumText):
     result = [(i.itemHandle, r, c) for i, r, c in search.iterSearch(project, "Scene")]
     assert result[0] == (C.hTitlePage, [], False)
     assert result[1] == (C.hChapterDoc, [], False)
-    assert result[2] == (C.hSceneDoc, [(8, 5, "Scene")], False)
+    assert result[2] == (C.hSceneDoc, [(8, 5, "Scene", 1)], False)
 
     # Patterns
     # ========
@@ -440,7 +440,7 @@ def testCoreTools_DocSearch(monkeypatch, mockGUI, fncPath, mockRnd, ipsumText):
 
     def pruneResult(result, index):
         temp = [(i.itemHandle, r, c) for i, r, c in result][index][1]
-        return [(s, n, c.split()[0]) for s, n, c in temp]
+        return [(s, n, c.split()[0]) for s, n, c, _ in temp]
 
     # Defaults
     assert pruneResult(search.iterSearch(project, "Lorem"), 2) == [
@@ -472,11 +472,93 @@ def testCoreTools_DocSearch(monkeypatch, mockGUI, fncPath, mockRnd, ipsumText):
             (15, 5, "Lorem"), (754, 5, "lorem"), (2056, 5, "lorem,"),
         ]
 
+        # The max is for the whole search, which stops when it's reached
+        mp.setattr(nwConst, "MAX_SEARCH_RESULT", 5)
+        result = list(search.iterSearch(project, "Lorem|dolor"))
+        assert sum(len(r) for _, r, _ in result) == 5
+        assert [c for _, _, c in result if c] == [True]
+        assert result[-1][2] is True
+
     # Case Sensitive
     search.setCaseSensitive(True)
     assert pruneResult(search.iterSearch(project, "Lorem"), 2) == [(15, 5, "Lorem")]
     search.setCaseSensitive(False)
 
+    # Context and Lines
+    # =================
+
+    search.setUserRegEx(False)
+    search.prepareSearch(project, "Jane")
+
+    # The context starts at the word of the match, and ends at the
+    # line break or after 100 characters
+    text = "Jane\n\nMet Jane and Jane.\n" + "x"*200 + " Jane " + "y"*200 + "\nJane"
+    assert search.searchText(text) == ([
+        (0, 4, "Jane", 1),
+        (10, 4, "Jane and Jane.", 3),
+        (19, 4, "Jane.", 3),
+        (226, 4, "Jane " + "y"*95, 4),
+        (432, 4, "Jane", 5),
+    ], False)
+
+    # Many results in one document
+    text = "\n".join(f"Line {i} with Jane in it" for i in range(10000))
+    results, capped = search.searchText(text, 20000)
+    assert capped is False
+    assert len(results) == 10000
+    assert [r[3] for r in results] == list(range(1, 10001))
+    assert all(text[p:p+n] == "Jane" for p, n, _, _ in results)
+    assert results[9999][2] == "Jane in it"
+    assert search.searchText(text) == (results[:1000], True)
+
+    # Text Index
+    # ==========
+
+    assert project.index.getTextIndex() is None
+    project.index.loadTextIndex()
+    index = project.index.getTextIndex()
+    assert index is not None
+
+    # Documents without the words are skipped, and single words are
+    # looked up with their positions
+    assert search._indexLookup(index, "Lorem") == {
+        C.hSceneDoc: [15, 754, 2056, 2209, 2425, 2840, 3399]
+    }
+    assert search._indexLookup(index, "sit amet") == {C.hSceneDoc: []}
+    assert search._indexLookup(index, "Lorem zebra") == {}
+    assert search._indexLookup(index, " - ") is None
+
+    # Text is added to the index when it is scanned
+    newText = "### New Scene\n\nLorem, İpsum straße Lorems DIŞ.\n\nlorem\n"
+    project.storage.getDocument(C.hChapterDoc).writeDocument(newText)
+    project.index.scanText(C.hChapterDoc, newText)
+
+    # Results are the same as without the index
+    searches = ["Lorem", "lorem", "Lor", "em", "sit amet", "Lorem,", "ipsum", "İPSUM", "ss", "ı"]
+    for words in (False, True):
+        for case in (False, True):
+            search.setWholeWords(words)
+            search.setCaseSensitive(case)
+            for text in searches:
+                project.index.loadTextIndex()
+                result = [(i.itemHandle, r, c) for i, r, c in search.iterSearch(project, text)]
+                assert search.indexed is True
+                with monkeypatch.context() as mp:
+                    mp.setattr(CONFIG, "searchIndex", False)
+                    expect = [
+                        (i.itemHandle, r, c) for i, r, c in search.iterSearch(project, text)
+                    ]
+                with monkeypatch.context() as mp:
+                    mp.setattr(DocSearch, "MAX_WORDS", 0)
+                    candidates = [
+                        (i.itemHandle, r, c) for i, r, c in search.iterSearch(project, text)
+                    ]
+                assert result == expect
+                assert candidates == expect
+
+    search.setWholeWords(False)
+    search.setCaseSensitive(False)
+
 
 @pytest.mark.core
 def testCoreTools_ProjectBuilderWrapper(monkeypatch, caplog, fncPath, mockGUI):
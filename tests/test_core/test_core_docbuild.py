@@ -28,8 +28,9 @@ from shutil import copyfile
 
 import pytest
 
-from novelwriter.core.buildsettings import BuildSettings
-from novelwriter.core.docbuild import NWBuildDocument
+from novelwriter.constants import nwFiles
+from novelwriter.core.buildsettings import BuildManifest, BuildSettings
+from novelwriter.core.docbuild import BuildProfile, NWBuildDocument
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwBuildFmt
 from novelwriter.formats.tohtml import ToHtml
@@ -651,3 +652,275 @@ def testCoreDocBuild_IterBuild(mockGUI, fncPath: Path, mockRnd):
     # Invalid Format
     assert list(docBuild.iterBuildDocument(docFile, None)) == []  # type: ignore
     assert docBuild.lastBuild is None
+
+
+@pytest.mark.core
+def testCoreDocBuild_MultiFormat(monkeypatch, mockGUI, prjLipsum, fncPath):
+    """Test building multiple formats in a single pass."""
+    project = NWProject()
+    project.openProject(prjLipsum)
+
+    build = BuildSettings()
+    build.unpack(BUILD_CONF)
+
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+
+    formats = [
+        ("Lorem Ipsum.fodt", nwBuildFmt.FODT),
+        ("Lorem Ipsum.htm", nwBuildFmt.HTML),
+        ("Lorem Ipsum.md", nwBuildFmt.EXT_MD),
+        ("Lorem Ipsum.txt", nwBuildFmt.NWD),
+        ("Lorem Ipsum.docx", nwBuildFmt.DOCX),
+    ]
+
+    # Build each format separately
+    (fncPath / "single").mkdir()
+    for name, bFormat in formats:
+        single = list(docBuild.iterBuildDocument(fncPath / "single" / name, bFormat))
+        assert docBuild.error is None
+
+    # Build all formats in one pass, while counting document reads
+    reads = []
+    getText = project.storage.getDocumentText
+    monkeypatch.setattr(
+        project.storage, "getDocumentText", lambda h: reads.append(h) or getText(h)
+    )
+
+    (fncPath / "multi").mkdir()
+    targets = [(fncPath / "multi" / name, bFormat) for name, bFormat in formats]
+    assert list(docBuild.iterBuildDocuments(targets)) == single
+    assert docBuild.error is None
+    assert isinstance(docBuild.lastBuild, ToOdt)
+    assert len(reads) == len(set(reads))
+
+    # The output should be identical
+    for name, bFormat in formats:
+        fileOne = fncPath / "single" / name
+        fileTwo = fncPath / "multi" / name
+        if bFormat == nwBuildFmt.DOCX:
+            with zipfile.ZipFile(fileOne) as zipOne, zipfile.ZipFile(fileTwo) as zipTwo:
+                assert zipOne.read("word/document.xml") == zipTwo.read("word/document.xml")
+        else:
+            assert cmpFiles(fileOne, fileTwo, ignoreStart=ODT_IGNORE)
+
+    # Unsupported formats are skipped
+    assert list(docBuild.iterBuildDocuments([(fncPath / "None", None)])) == []  # type: ignore
+    assert docBuild.lastBuild is None
+
+
+@pytest.mark.core
+def testCoreDocBuild_Snapshot(monkeypatch, mockGUI, prjLipsum, fncPath):
+    """Test building from a snapshot of the project data."""
+    project = NWProject()
+    project.openProject(prjLipsum)
+    project.index.rebuild()
+
+    build = BuildSettings()
+    build.unpack(BUILD_CONF)
+    build.setValue("headings.fmtScene", "Scene: {Title} ({Char:POV}, {Char:Focus})")
+
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+    fileOne = fncPath / "One.md"
+    assert list(docBuild.iterBuildDocument(fileOne, nwBuildFmt.EXT_MD))
+    recordOne = docBuild._buildRecord(docBuild._readDigests({}))
+
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+    docBuild.takeSnapshot()
+    assert docBuild._snapshot is not None
+    assert any(docBuild._snapshot.refs.values())
+
+    # The build doesn't touch the project tree, index or storage
+    fileTwo = fncPath / "Two.md"
+    digests = []
+    with monkeypatch.context() as mp:
+        mp.setattr("novelwriter.core.tree.NWTree.__getitem__", causeException)
+        mp.setattr("novelwriter.core.tree.NWTree.__iter__", causeException)
+        mp.setattr(project.storage, "getDocumentText", causeException)
+        mp.setattr(project.index, "getReferenceForHeader", causeException)
+        mp.setattr(project.index, "getHandleHeaderCount", causeException)
+        makeObj = docBuild._makeBuilder(nwBuildFmt.EXT_MD)
+        assert makeObj is not None
+        assert any(s for _, s in list(docBuild._iterBuild([[makeObj]], digests=digests)))
+        assert docBuild.error is None
+        docBuild._closeBuilder(makeObj, nwBuildFmt.EXT_MD)
+        makeObj.saveDocument(fileTwo)
+
+    # The snapshot is released, and the result is the same
+    assert docBuild._snapshot is None
+    assert docBuild._buildRecord(digests) == recordOne
+    assert fileOne.read_text(encoding="utf-8") == fileTwo.read_text(encoding="utf-8")
+
+    project.closeProject()
+
+
+@pytest.mark.core
+def testCoreDocBuild_Profile(mockGUI, prjLipsum, fncPath):
+    """Test the compiled build profile."""
+    project = NWProject()
+    project.openProject(prjLipsum)
+    project.data.setAutoReplace({"A": "Alpha", "B": "Beta"})
+
+    build = BuildSettings()
+    build.unpack(BUILD_CONF)
+
+    # The profile is compiled once, and reused by later builds
+    profile = BuildProfile.fromBuild(project, build)
+    assert BuildProfile.fromBuild(project, build) is profile
+    assert profile.values["format.lineHeight"] == 1.5
+    assert profile.values["headings.fmtPart"] == "Part: {Title}"
+    assert profile.textFont.family() == "Arial"
+    assert profile.language == project.data.language
+    assert profile.autoReplace is not None
+    assert profile.autoReplace("<A> and <B> and <C>") == "Alpha and Beta and <C>"
+
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+    assert list(docBuild.iterBuildDocument(fncPath / "Test.md", nwBuildFmt.STD_MD))
+    assert docBuild._profile is profile
+
+    # Changing the settings or the project compiles a new profile
+    build.setValue("format.lineHeight", 2.0)
+    another = BuildProfile.fromBuild(project, build)
+    assert another is not profile
+    assert another.values["format.lineHeight"] == 2.0
+    assert BuildProfile.fromBuild(project, build) is another
+
+    project.data.setAutoReplace({})
+    profile = BuildProfile.fromBuild(project, build)
+    assert profile is not another
+    assert profile.autoReplace is None
+
+    # The profiles are kept by the project, and dropped when it closes
+    assert project.buildProfiles == {build.buildID: profile}
+    assert NWProject().buildProfiles == {}
+    project.closeProject()
+    assert project.buildProfiles == {}
+
+
+@pytest.mark.core
+def testCoreDocBuild_Manifest(monkeypatch, mockGUI, prjLipsum, fncPath):
+    """Test skipping builds with unchanged input."""
+    project = NWProject()
+    project.openProject(prjLipsum)
+    manFile = prjLipsum / "meta" / nwFiles.BUILD_MAN
+
+    build = BuildSettings()
+    build.unpack(BUILD_CONF)
+    buildID = build.buildID
+
+    docBuild = NWBuildDocument(project, build)
+    docBuild.queueAll()
+    mdFile = fncPath / "Test.md"
+    htmlFile = fncPath / "Test.html"
+    targets = [(mdFile, nwBuildFmt.STD_MD), (htmlFile, nwBuildFmt.HTML)]
+
+    # A forced build is not recorded, and doesn't read the documents
+    # first or compute their digests
+    with monkeypatch.context() as mp:
+        mp.setattr(NWBuildDocument, "_readDigests", causeException)
+        mp.setattr(NWBuildDocument, "_itemDigest", causeException)
+        assert list(docBuild.iterBuildDocuments(targets))
+    assert docBuild.skipped == []
+    assert docBuild.written == [mdFile, htmlFile]
+    assert not manFile.exists()
+
+    # An unforced build is recorded, without reading the documents
+    # first when there is no previous record
+    with monkeypatch.context() as mp:
+        mp.setattr(NWBuildDocument, "_readDigests", causeException)
+        assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.written == [mdFile, htmlFile]
+    assert manFile.is_file()
+    manifest = BuildManifest(project)
+    assert len(manifest) == 1
+    assert manifest.hasRecord(buildID, nwBuildFmt.STD_MD) is True
+    assert manifest.hasRecord(buildID, nwBuildFmt.ODT) is False
+    record = docBuild._buildRecord(docBuild._readDigests({}))
+    assert manifest.isUnchanged(buildID, nwBuildFmt.STD_MD, mdFile, record) is True
+    assert manifest.isUnchanged(buildID, nwBuildFmt.HTML, mdFile, record) is False
+    assert manifest.isUnchanged(buildID, nwBuildFmt.STD_MD, fncPath / "Other.md", record) is False
+    assert manifest.isUnchanged(buildID, nwBuildFmt.ODT, fncPath / "Other.odt", record) is False
+
+    # Unchanged input is skipped, unless forced
+    assert list(docBuild.iterBuildDocuments(targets, force=False)) == []
+    assert docBuild.skipped == [mdFile, htmlFile]
+    assert docBuild.written == []
+    assert docBuild.lastBuild is None
+    assert list(docBuild.iterBuildDocument(mdFile, nwBuildFmt.STD_MD, force=True))
+    assert docBuild.skipped == []
+
+    # The forced build changed the output file, so it builds again
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == [htmlFile]
+    assert docBuild.written == [mdFile]
+
+    # A changed document builds again
+    assert list(docBuild.iterBuildDocuments(targets, force=False)) == []
+    document = project.storage.getDocument(record["documents"][-1][0])
+    assert document.writeDocument(f"{document.readDocument()}\nMore text.\n")
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == []
+    assert "More text." in mdFile.read_text(encoding="utf-8")
+
+    # Changed settings build again
+    assert list(docBuild.iterBuildDocuments(targets, force=False)) == []
+    build.setValue("headings.fmtScene", "Scene {Title}")
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == []
+
+    # A changed or deleted output file builds again
+    assert list(docBuild.iterBuildDocuments(targets, force=False)) == []
+    htmlFile.unlink()
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == [mdFile]
+    mdFile.write_text("Edited", encoding="utf-8")
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == [htmlFile]
+
+    # A new output path replaces the record of the format
+    otherFile = fncPath / "Other.md"
+    assert list(docBuild.iterBuildDocument(otherFile, nwBuildFmt.STD_MD, force=False))
+    assert docBuild.written == [otherFile]
+    records = json.loads(manFile.read_text(encoding="utf-8"))["novelWriter.buildManifest"]
+    assert sorted(records[buildID]) == ["HTML", "STD_MD"]
+    assert records[buildID]["STD_MD"]["path"] == str(otherFile)
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.skipped == [htmlFile]
+    assert docBuild.written == [mdFile]
+
+    # Skipped JSON output is reported with its output path
+    jsonTarget = [(fncPath / "Test.txt", nwBuildFmt.J_NWD)]
+    assert list(docBuild.iterBuildDocuments(jsonTarget, force=False))
+    assert docBuild.written == [fncPath / "Test.json"]
+    assert list(docBuild.iterBuildDocuments(jsonTarget, force=False)) == []
+    assert docBuild.skipped == [fncPath / "Test.json"]
+
+    # Failed builds are not recorded
+    monkeypatch.setattr(ToMarkdown, "saveDocument", causeOSError)
+    mdFile.unlink()
+    assert list(docBuild.iterBuildDocuments(targets, force=False))
+    assert docBuild.error is not None
+    monkeypatch.undo()
+    assert BuildManifest(project).isUnchanged(buildID, nwBuildFmt.STD_MD, mdFile, record) is False
+
+    # Invalid manifest files are ignored
+    manFile.write_text("{broken", encoding="utf-8")
+    assert len(BuildManifest(project)) == 0
+    manFile.write_text('{"novelWriter.buildManifest": {"foo": {}}}', encoding="utf-8")
+    assert len(BuildManifest(project)) == 0
+    manFile.write_text(json.dumps({"novelWriter.buildManifest": {
+        buildID: {str(mdFile): {}, "HTML": {}},
+    }}), encoding="utf-8")
+    assert BuildManifest(project).hasRecord(buildID, nwBuildFmt.HTML) is True
+    assert BuildManifest(project)._records[buildID] == {"HTML": {}}
+    manFile.unlink()
+    with monkeypatch.context() as mp:
+        mp.setattr("builtins.open", causeOSError)
+        manifest.setRecord(buildID, nwBuildFmt.HTML, htmlFile, record)
+    assert len(BuildManifest(project)) == 0
+
+    project.closeProject()
+    assert len(BuildManifest(project)) == 0
@@ -101,6 +101,8 @@ def testCoreDocument_LoadSave(monkeypatch, mockGUI, fncPath, mockRnd):
 
     # Save again to ensure temp file and previous file is handled
     assert doc.writeDocument(text) is True
+    assert doc.lastHash == NWDocument.textHash(text)
+    assert doc.lastHash == "b288c3ab03181027d9a16d7fd2291262f5de9ac8"
 
     # Check file content
     docPath = fncPath / "content" / f"{xHandle}.nwd"
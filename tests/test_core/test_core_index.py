@@ -26,9 +26,12 @@ from shutil import copyfile
 
 import pytest
 
-from novelwriter import SHARED
+from novelwriter import CONFIG, SHARED
 from novelwriter.constants import nwFiles
-from novelwriter.core.index import IndexItem, NWIndex, TagsIndex, _checkModKey, processComment
+from novelwriter.core.index import (
+    IndexItem, NWIndex, TagsIndex, TextIndex, TextIndexLoader, _checkModKey,
+    processComment
+)
 from novelwriter.core.item import NWItem
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwComment, nwItemClass, nwItemLayout
@@ -159,6 +162,144 @@ def testCoreIndex_LoadSave(qtbot, monkeypatch, prjLipsum, mockGUI, tstPaths):
         project.closeProject()
 
 
+@pytest.mark.core
+def testCoreIndex_TextIndexCache(monkeypatch, prjLipsum, mockGUI):
+    """Test building, maintaining, saving and loading the text index."""
+    textFile = prjLipsum / "meta" / nwFiles.TEXT_INDEX
+    sceneFile = prjLipsum / "content" / "4c4f28287af27.nwd"
+
+    project = NWProject()
+    assert project.openProject(prjLipsum)
+    index = project.index
+    assert index._textReady is False
+
+    # The text index is not built on request, only by a loader
+    assert index.getTextIndex() is None
+    loader = index.textIndexLoader()
+    assert isinstance(loader, TextIndexLoader)
+    assert loader.textIndex is None
+    assert index.setTextIndex(loader) is False
+    loader.run()
+    assert index.setTextIndex(loader) is True
+    assert index.textIndexLoader() is None
+    textIndex = index.getTextIndex()
+    assert isinstance(textIndex, TextIndex)
+    assert index._textReady is True
+    assert len(textIndex.handles()) == len([i for i in project.tree if i.isFileType()])
+    assert "4c4f28287af27" in textIndex.findHandles(["bod"])
+    assert textIndex.unstamped() == []
+
+    # Scanned text is updated in the text index, and loses its stamp
+    index.scanText("4c4f28287af27", "# Scene\n\nAn aardvark.\n")
+    assert textIndex.findHandles(["aardvark"]) == {"4c4f28287af27"}
+    assert "4c4f28287af27" not in textIndex.findHandles(["bod"])
+    assert textIndex.unstamped() == ["4c4f28287af27"]
+    sceneFile.write_text("# Scene\n\nAn aardvark.\n", encoding="utf-8")
+
+    # Auto save doesn't write the text index
+    assert index.saveIndex(autoSave=True) is True
+    assert not textFile.exists()
+
+    # Failing to save the text index
+    with monkeypatch.context() as mp:
+        mp.setattr(json, "dumps", causeException)
+        assert index.saveIndex() is False
+    assert not textFile.exists()
+
+    # A regular save writes it, and stamps the scanned document
+    assert index.saveIndex() is True
+    assert textFile.exists()
+    assert textIndex.changed is False
+    assert textIndex.unstamped() == []
+
+    # Loading the index doesn't load the text index
+    index.clear()
+    assert index.loadIndex() is True
+    assert index._textReady is False
+    assert len(index._textIndex.handles()) == 0
+
+    # Saving before it is used keeps the cache file
+    assert index.saveIndex() is True
+    assert textFile.exists()
+
+    # Only documents with changed files are read when it is loaded
+    sceneFile.write_text("# Scene\n\nAn anteater.\n", encoding="utf-8")
+    reads = []
+    getText = project.storage.getDocumentText
+    with monkeypatch.context() as mp:
+        mp.setattr(
+            project.storage, "getDocumentText", lambda h: reads.append(h) or getText(h)
+        )
+        index.loadTextIndex()
+    assert reads == ["4c4f28287af27"]
+    textIndex = index.getTextIndex()
+    assert index._textReady is True
+    assert textIndex is not None
+    assert textIndex.findHandles(["aardvark"]) == set()
+    assert textIndex.findHandles(["anteater"]) == {"4c4f28287af27"}
+    assert textIndex.changed is True
+
+    # Documents scanned while loading are updated after
+    index.clear()
+    loader = index.textIndexLoader()
+    assert loader is not None
+    loader.run()
+    sceneFile.write_text("# Scene\n\nAn armadillo.\n", encoding="utf-8")
+    index.scanText("4c4f28287af27", "# Scene\n\nAn armadillo.\n")
+    assert index.setTextIndex(loader) is True
+    textIndex = index.getTextIndex()
+    assert textIndex is not None
+    assert textIndex.findHandles(["anteater"]) == set()
+    assert textIndex.findHandles(["armadillo"]) == {"4c4f28287af27"}
+
+    # A loader from before the index was cleared is ignored
+    loader = index.textIndexLoader()
+    assert loader is None
+    index.clear()
+    loader = index.textIndexLoader()
+    assert loader is not None
+    loader.run()
+    index.clear()
+    assert index.setTextIndex(loader) is False
+    assert index.getTextIndex() is None
+
+    # Entries for deleted documents are removed
+    index.loadTextIndex()
+    index.deleteHandle("4c4f28287af27")
+    assert "4c4f28287af27" not in index._textIndex
+
+    # A broken cache file is ignored, and the index is built
+    textFile.write_text("{", encoding="utf-8")
+    index.clear()
+    assert index.loadIndex() is True
+    assert index._textReady is False
+    index.loadTextIndex()
+    assert index.getTextIndex() is not None
+    assert index._textReady is True
+
+    # Rebuilding the index also rebuilds the text index
+    index.rebuild()
+    assert index._textReady is True
+    assert "4c4f28287af27" in index._textIndex
+
+    # When turned off, the text index is cleared, and not loaded
+    index.saveIndex()
+    monkeypatch.setattr(CONFIG, "searchIndex", False)
+    assert index.getTextIndex() is None
+    assert index.textIndexLoader() is None
+    assert index._textIndex.handles() == []
+    index.clear()
+    assert index.loadIndex() is True
+    assert index._textReady is False
+
+    # The unused cache file is removed on save
+    assert textFile.exists()
+    assert index.saveIndex() is True
+    assert not textFile.exists()
+
+    project.closeProject()
+
+
 @pytest.mark.core
 def testCoreIndex_ScanThis(mockGUI):
     """Test the tag scanner function scanThis."""
@@ -386,6 +527,11 @@ def testCoreIndex_ScanText(monkeypatch, mockGUI, fncPath, mockRnd):
     project.tree.model.multiMove([xIndex], aIndex)
     assert index.scanText(xHandle, "### Hello World!") is True
     assert xItem.mainHeading == "H3"
+    assert xItem.wordCount == 2
+
+    # Known counts are used as is
+    assert index.scanText(xHandle, "### Hello World!", counts=(1, 2, 3)) is True
+    assert (xItem.charCount, xItem.wordCount, xItem.paraCount) == (1, 2, 3)
 
     # Make some usable items
     tHandle = project.newFile("Title", C.hNovelRoot)
@@ -766,6 +912,13 @@ def testCoreIndex_ExtractData(mockGUI, fncPath, mockRnd):
     # ============
     assert index.getClassTags(nwItemClass.CHARACTER) == ["Jane", "John"]
 
+    # matchClassTags
+    # ==============
+    assert index.matchClassTags(nwItemClass.CHARACTER, "j", 15) == ["Jane", "John"]
+    assert index.matchClassTags(nwItemClass.CHARACTER, "N", 15) == ["Jane", "John"]
+    assert index.matchClassTags(nwItemClass.CHARACTER, "jo", 15) == ["John"]
+    assert index.matchClassTags(None, "a", 1) == ["Jane"]
+
     # getTagsData
     # ===========
     assert list(index.getTagsData()) == [(
@@ -1043,6 +1196,29 @@ def testCoreIndex_TagsIndex():
     assert tagsIndex.tagClass("Tag3") == nwItemClass.PLOT.name
     assert tagsIndex.tagClass("Tag4") is None
 
+    # Filter and match names
+    tagsIndex.add("MyTag", "", "0000000000004", "T0001", "CHARACTER")
+    tagsIndex.add("tagger", "", "0000000000005", "T0001", "CHARACTER")
+    assert tagsIndex.filterTagNames(None) == ["MyTag", "Tag1", "Tag2", "Tag3", "tagger"]
+    assert tagsIndex.filterTagNames("CHARACTER") == ["MyTag", "Tag2", "tagger"]
+    assert tagsIndex.filterTagNames("WORLD") == []
+    assert tagsIndex.matchTagNames("CHARACTER", "TAG", 15) == ["Tag2", "tagger", "MyTag"]
+    assert tagsIndex.matchTagNames("CHARACTER", "tag", 2) == ["Tag2", "tagger"]
+    assert tagsIndex.matchTagNames("CHARACTER", "ytA", 15) == ["MyTag"]
+    assert tagsIndex.matchTagNames("CHARACTER", "", 15) == ["MyTag", "Tag2", "tagger"]
+    assert tagsIndex.matchTagNames(None, "tag", 3) == ["Tag1", "Tag2", "Tag3"]
+    assert tagsIndex.matchTagNames(None, "2", 15) == ["Tag2"]
+    assert tagsIndex.matchTagNames("PLOT", "foo", 15) == []
+
+    # Moving and removing tags updates the sorted lists
+    tagsIndex.add("MyTag", "", "0000000000004", "T0001", "PLOT")
+    assert tagsIndex.filterTagNames("CHARACTER") == ["Tag2", "tagger"]
+    assert tagsIndex.filterTagNames("PLOT") == ["MyTag", "Tag3"]
+    del tagsIndex["mytag"]
+    del tagsIndex["Tagger"]
+    assert tagsIndex.filterTagNames(None) == ["Tag1", "Tag2", "Tag3"]
+    assert tagsIndex.filterTagNames("PLOT") == ["Tag3"]
+
     # Pack Data
     assert tagsIndex.packData() == content
 
@@ -1062,6 +1238,7 @@ def testCoreIndex_TagsIndex():
     tagsIndex.unpackData(content)
     assert tagsIndex._tags == content
     assert tagsIndex.packData() == content
+    assert tagsIndex.filterTagNames("NOVEL") == ["Tag1"]
 
     # Unpack Errors
     # =============
@@ -1150,6 +1327,100 @@ def testCoreIndex_TagsIndex():
         })
 
 
+@pytest.mark.core
+def testCoreIndex_TextIndex():
+    """Check the TextIndex class."""
+    textIndex = TextIndex()
+    assert textIndex.changed is False
+
+    textIndex.scanText("0000000000001", "Lorem ipsum dolor, lorem DOLORE.")
+    textIndex.scanText("0000000000002", "Straße İpsum\n\nlorem")
+    assert "0000000000001" in textIndex
+    assert "0000000000003" not in textIndex
+    assert textIndex.handles() == ["0000000000001", "0000000000002"]
+    assert textIndex.changed is True
+
+    # Case folding
+    assert TextIndex.foldWord("Straße") == "strasse"
+    assert TextIndex.foldWord("İpsum") == "ipsum"
+    assert TextIndex.foldWord("Dıs") == "dis"
+
+    # Match words
+    assert textIndex.matchWords("lorem") == ["lorem"]
+    assert textIndex.matchWords("lorem", whole=True) == ["lorem"]
+    assert textIndex.matchWords("dolor") == ["dolor", "dolore"]
+    assert textIndex.matchWords("dolor", whole=True) == ["dolor"]
+    assert textIndex.matchWords("olo") == ["dolor", "dolore"]
+    assert textIndex.matchWords("olo", whole=True) == []
+
+    # Find handles
+    assert textIndex.findHandles(["lorem"]) == {"0000000000001", "0000000000002"}
+    assert textIndex.findHandles(["strasse", "dolor"]) == {"0000000000001", "0000000000002"}
+    assert textIndex.findHandles(["dolore"]) == {"0000000000001"}
+    assert textIndex.findHandles([]) == set()
+
+    # Find positions, which are the original text positions
+    assert textIndex.findPositions(["lorem"]) == {"0000000000001": [0, 19], "0000000000002": [14]}
+    assert textIndex.findPositions(["dolore", "dolor"]) == {"0000000000001": [12, 25]}
+    assert textIndex.findPositions(["ipsum"]) == {"0000000000001": [6], "0000000000002": [7]}
+    assert textIndex.findPositions(["foo"]) == {}
+
+    # Check current text
+    assert textIndex.isCurrent("0000000000001", "Lorem ipsum dolor, lorem DOLORE.") is True
+    assert textIndex.isCurrent("0000000000001", "Lorem ipsum dolor, lorem DOLOR.") is False
+    assert textIndex.isCurrent("0000000000003", "") is False
+
+    # Pack and unpack
+    data = textIndex.packData()
+    assert textIndex.changed is True
+    textIndex.resetChangedState()
+    assert textIndex.changed is False
+    assert data["0000000000002"]["words"] == ["strasse", "ipsum", "lorem"]
+    assert data["0000000000002"]["sizes"] == [1, 1, 1]
+    assert data["0000000000002"]["positions"] == [0, 7, 14]
+
+    newIndex = TextIndex()
+    newIndex.unpackData(json.loads(json.dumps(data)))
+    assert newIndex.changed is False
+    assert newIndex.packData() == data
+    assert newIndex.matchWords("dolor") == ["dolor", "dolore"]
+    assert newIndex.findPositions(["lorem"]) == textIndex.findPositions(["lorem"])
+
+    # Re-scan and delete, which also updates the vocabulary
+    textIndex.scanText("0000000000001", "Dolore")
+    assert textIndex.matchWords("dolor") == ["dolore"]
+    assert textIndex.findPositions(["lorem"]) == {"0000000000002": [14]}
+    del textIndex["0000000000002"]
+    del textIndex["0000000000003"]
+    assert textIndex.handles() == ["0000000000001"]
+    assert textIndex.matchWords("") == ["dolore"]
+
+    # Clear
+    textIndex.clear()
+    assert textIndex.handles() == []
+    assert textIndex.matchWords("") == []
+    assert textIndex.changed is False
+
+    # Invalid data
+    entry = data["0000000000001"]
+    with pytest.raises(ValueError):
+        newIndex.unpackData([])
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"stuff": entry})
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"0000000000001": []})
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"0000000000001": {**entry, "hash": None}})
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"0000000000001": {**entry, "words": [1, 2]}})
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"0000000000001": {**entry, "sizes": [1]}})
+    with pytest.raises(ValueError):
+        newIndex.unpackData({"0000000000001": {**entry, "positions": [1]}})
+    with pytest.raises(OverflowError):
+        newIndex.unpackData({"0000000000001": {**entry, "positions": [-1, 0, 0, 0, 0]}})
+
+
 @pytest.mark.core
 def testCoreIndex_ItemIndex(mockGUI, fncPath, mockRnd):
     """Check the ItemIndex class."""
@@ -192,3 +192,91 @@ def testCoreSpell_Enchant(monkeypatch, mockGUI, fncPath):
         mp.setattr("enchant.Broker.request_dict", lambda *a: None)
         spChk.setLanguage("en_US")
         assert isinstance(spChk._enchant, FakeEnchant)
+
+
+@pytest.mark.core
+def testCoreSpell_Cache(monkeypatch, mockGUI, fncPath):
+    """Test the spell check lookup caches."""
+    project = NWProject()
+    buildTestProject(project, fncPath)
+
+    class CountingEnchant(FakeEnchant):
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.checked = []
+            self.suggested = []
+            self.words = {"word"}
+
+        def check(self, word: str) -> bool:
+            self.checked.append(word)
+            return word in self.words
+
+        def suggest(self, word: str) -> list[str]:
+            self.suggested.append(word)
+            return ["word"]
+
+        def add_to_session(self, word: str) -> None:
+            self.words.add(word)
+
+    spChk = NWSpellEnchant(project)
+    spChk._enchant = fake = CountingEnchant()
+    assert spChk.cacheStats == (0, 0, 0.0)
+
+    # Repeated lookups only reach the dictionary once
+    assert spChk.checkWord("word") is True
+    assert spChk.checkWord("wrod") is False
+    assert spChk.checkWord("word") is True
+    assert spChk.checkWord("wrod") is False
+    assert fake.checked == ["word", "wrod"]
+    assert spChk.cacheStats == (2, 2, 0.5)
+
+    # Suggestions are cached, but callers get their own copy
+    suggest = spChk.suggestWords("wrod")
+    suggest.append("foo")
+    assert spChk.suggestWords("wrod") == ["word"]
+    assert fake.suggested == ["wrod"]
+
+    # Adding a word clears the caches
+    spChk.addWord("wrod", save=False)
+    assert spChk.cacheStats == (0, 0, 0.0)
+    assert spChk.checkWord("wrod") is True
+    assert spChk.suggestWords("wrod") == ["word"]
+    assert fake.checked == ["word", "wrod", "wrod"]
+    assert fake.suggested == ["wrod", "wrod"]
+
+    # The caches are bounded, and drop the oldest entries first
+    monkeypatch.setattr(NWSpellEnchant, "CHECK_CACHE", 2)
+    monkeypatch.setattr(NWSpellEnchant, "SUGGEST_CACHE", 1)
+    assert spChk.checkWord("one") is False
+    assert spChk.checkWord("two") is False
+    assert list(spChk._checked) == ["one", "two"]
+    assert spChk.suggestWords("one") == ["word"]
+    assert list(spChk._suggested) == ["one"]
+
+    # Errors are not cached
+    spChk._enchant = None  # type: ignore
+    assert spChk.checkWord("three") is True
+    assert spChk.suggestWords("three") == []
+    assert "three" not in spChk._checked
+    assert "three" not in spChk._suggested
+
+    # Cache only lookups count hits
+    spChk._enchant = fake
+    spChk.clearCache()
+    assert spChk.checkWord("word") is True
+    assert spChk.lookupWord("word") is True
+    assert spChk.lookupWord("other") is None
+    assert spChk.cacheStats == (1, 1, 0.5)
+
+    # Changing language primes the new dictionary before it replaces
+    # the old one, which is left untouched, and clears the caches
+    spChk._userDict.add("newword")
+    spChk._userDict.save()
+    spChk.setLanguage(None)
+    assert isinstance(spChk._enchant, FakeEnchant)
+    assert spChk._enchant is not fake
+    assert "newword" not in fake.words
+    assert spChk._checked == {}
+    assert spChk._suggested == {}
+    assert spChk.cacheStats == (0, 0, 0.0)
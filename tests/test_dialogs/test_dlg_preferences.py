@@ -185,9 +185,11 @@ def testDlgPreferences_Settings(qtbot, monkeypatch, nwGUI, tstPaths):
     # Auto Save
     prefs.autoSaveDoc.stepUp()
     prefs.autoSaveProj.stepUp()
+    prefs.searchIndex.setChecked(False)
 
     assert CONFIG.autoSaveDoc == 30
     assert CONFIG.autoSaveProj == 60
+    assert CONFIG.searchIndex is True
 
     # Project Backup
     with monkeypatch.context() as mp:
@@ -229,11 +231,13 @@ def testDlgPreferences_Settings(qtbot, monkeypatch, nwGUI, tstPaths):
     prefs.autoSelect.setChecked(False)
     prefs.showTabsNSpaces.setChecked(True)
     prefs.showLineEndings.setChecked(True)
+    prefs.largeDocLimit.stepUp()
 
     assert CONFIG.spellLanguage != "de"
     assert CONFIG.autoSelect is True
     assert CONFIG.showTabsNSpaces is False
     assert CONFIG.showLineEndings is False
+    assert CONFIG.largeDocLimit == 100000
 
     # Editor Scrolling
     prefs.scrollPastEnd.setChecked(False)
@@ -336,6 +340,7 @@ def testDlgPreferences_Settings(qtbot, monkeypatch, nwGUI, tstPaths):
     # Auto Save
     assert CONFIG.autoSaveDoc == 31
     assert CONFIG.autoSaveProj == 61
+    assert CONFIG.searchIndex is False
 
     # Project Backup
     assert CONFIG._backupPath == tstPaths.testDir
@@ -359,6 +364,7 @@ def testDlgPreferences_Settings(qtbot, monkeypatch, nwGUI, tstPaths):
     assert CONFIG.autoSelect is False
     assert CONFIG.showTabsNSpaces is True
     assert CONFIG.showLineEndings is True
+    assert CONFIG.largeDocLimit == 110000
 
     # Editor Scrolling
     assert CONFIG.scrollPastEnd is False
@@ -634,6 +634,48 @@ def testFmtToDocX_Fields(mockGUI):
     )
 
 
+@pytest.mark.core
+def testFmtToDocX_StreamMode(mockGUI, fncPath):
+    """Test that a streamed document is identical to one built in
+    memory.
+    """
+    project = NWProject()
+    text = (
+        "# Part One\n\n"
+        "Word Count: [field:allWords] and [field:allChickens]\n\n"
+        "A stray\x00 [field:allWords] placeholder.\n\n"
+        "### Scene\n\n"
+        "Text with a footnote[footnote:fa] and a link: http://example.com\n\n"
+        "%footnote.fa: Footnote text.\n\n"
+        "[newpage]\n\n"
+        "Text on a new page with **bold** text.\n\n"
+    )
+
+    for stream in (False, True):
+        doc = ToDocX(project)
+        doc.setStreamMode(stream)
+        doc.setHeaderFormat(nwHeadFmt.DOC_PAGE, 0)
+        doc.initDocument()
+        for _ in range(3):
+            doc._text = text
+            doc.tokenizeText()
+            doc.countStats()
+            doc.doConvert()
+            if stream:
+                assert len(doc._pars) == 1
+        doc.closeDocument()
+        doc.saveDocument(fncPath / f"stream_{stream}.docx")
+
+    with zipfile.ZipFile(fncPath / "stream_False.docx", mode="r") as zipOne:
+        with zipfile.ZipFile(fncPath / "stream_True.docx", mode="r") as zipTwo:
+            assert zipOne.namelist() == zipTwo.namelist()
+            for name in zipOne.namelist():
+                if name != "docProps/core.xml":
+                    assert zipOne.read(name) == zipTwo.read(name)
+            assert b"<w:t>75</w:t>" in zipTwo.read("word/document.xml")
+            assert b"\x00" not in zipTwo.read("word/document.xml")
+
+
 @pytest.mark.core
 def testFmtToDocX_SaveDocument(mockGUI, prjLipsum, fncPath, tstPaths):
     """Test document output."""
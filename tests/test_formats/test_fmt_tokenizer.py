@@ -25,11 +25,13 @@ import pytest
 from PyQt5.QtGui import QFont
 
 from novelwriter import CONFIG
-from novelwriter.constants import nwHeadFmt, nwStyles
+from novelwriter.constants import nwHeadFmt, nwStyles, nwUnicode
 from novelwriter.core.project import NWProject
 from novelwriter.enum import nwComment
-from novelwriter.formats.shared import BlockFmt, BlockTyp, TextFmt, stripEscape
-from novelwriter.formats.tokenizer import COMMENT_STYLE, HeadingFormatter, Tokenizer
+from novelwriter.formats.shared import BlockFmt, BlockList, BlockTyp, TextFmt, stripEscape
+from novelwriter.formats.tokenizer import (
+    COMMENT_STYLE, DOC_STATS, HEADINGS, HeadingFormatter, Tokenizer
+)
 from novelwriter.formats.tomarkdown import ToMarkdown
 
 from tests.tools import C, buildTestProject
@@ -50,6 +52,46 @@ class BareTokenizer(Tokenizer):
         super().saveDocument(path)  # type: ignore (deliberate check)
 
 
+@pytest.mark.core
+def testFmtToken_BlockList():
+    """Test the compact block storage class."""
+    blocks = BlockList()
+    assert len(blocks) == 0
+    assert list(blocks) == []
+    assert blocks == []
+    assert repr(blocks) == "<BlockList blocks=0>"
+    with pytest.raises(IndexError):
+        _ = blocks[0]
+
+    heading = (BlockTyp.HEAD1, TM1, "Title", [], BlockFmt.CENTRE | BlockFmt.PBB)
+    text = (
+        BlockTyp.TEXT, "", "Some text with a note",
+        [(5, TextFmt.B_B, ""), (9, TextFmt.B_E, ""), (21, TextFmt.FNOTE, f"{TMH}:abcd")],
+        BlockFmt.IND_T,
+    )
+    empty = (BlockTyp.SEP, "", "", [], BlockFmt.NONE)
+
+    blocks.append(heading)
+    blocks.append(text)
+    blocks.append(empty)
+    assert len(blocks) == 3
+    assert blocks[0] == heading
+    assert blocks[1] == text
+    assert blocks[-1] == empty
+    assert blocks == [heading, text, empty]
+    assert blocks == BlockList([heading, text, empty])
+    assert blocks != [heading, text]
+    assert (blocks == "foo") is False
+    assert blocks[1][3][2][1] is TextFmt.FNOTE
+    assert blocks[0][4] == BlockFmt.CENTRE | BlockFmt.PBB
+
+    # Appending after reading works
+    blocks.append(text)
+    assert list(blocks) == [heading, text, empty, text]
+    with pytest.raises(IndexError):
+        _ = blocks[4]
+
+
 @pytest.mark.core
 def testFmtToken_Abstracts(mockGUI, tstPaths):
     """Test all the abstract methods of the Tokenizer class."""
@@ -999,6 +1041,26 @@ def testFmtToken_ExtractFormats(mockGUI):
         (38, TextFmt.B_E, ""), (41, TextFmt.I_E, ""),
     ]
 
+    # Mixed
+    # =====
+
+    # Plain text is returned as-is
+    text, fmt = tokens._extractFormats("Text with no formatting in it.")
+    assert text == "Text with no formatting in it."
+    assert fmt == []
+
+    # Markdown, shortcodes and URLs in the same paragraph
+    text, fmt = tokens._extractFormats(
+        "**Bold** and [u]_underlined italics_[/u] at https://example.com."
+    )
+    assert text == "Bold and underlined italics at https://example.com."
+    assert fmt == [
+        (0, TextFmt.B_B, ""), (4, TextFmt.B_E, ""),
+        (9, TextFmt.U_B, ""), (9, TextFmt.I_B, ""),
+        (27, TextFmt.I_E, ""), (27, TextFmt.U_E, ""),
+        (31, TextFmt.HRF_B, "https://example.com."), (51, TextFmt.HRF_E, ""),
+    ]
+
 
 @pytest.mark.core
 def testFmtToken_Paragraphs(mockGUI):
@@ -2109,6 +2171,74 @@ def testFmtToken_CountStats(mockGUI, ipsumText):
     }
 
 
+@pytest.mark.core
+def testFmtToken_CountBlocks(mockGUI, ipsumText):
+    """Test that the stats counted while tokenizing are the same as a
+    separate pass over the blocks.
+    """
+    def blockStats(blocks: BlockList) -> dict[str, int]:
+        counts = dict.fromkeys(DOC_STATS, 0)
+        for tType, _, tText, _, _ in blocks:
+            tText = tText.replace(nwUnicode.U_ENDASH, " ").replace(nwUnicode.U_EMDASH, " ")
+            words = tText.split()
+            nWords, nChars, nWChars = len(words), len(tText), len("".join(words))
+            if tType == BlockTyp.TEXT:
+                counts["paragraphCount"] += 1
+                counts["textWords"] += nWords
+                counts["textChars"] += nChars
+                counts["textWordChars"] += nWChars
+            elif tType in HEADINGS:
+                counts["titleCount"] += 1
+                counts["titleWords"] += nWords
+                counts["titleChars"] += nChars
+                counts["titleWordChars"] += nWChars
+            elif tType not in (BlockTyp.SEP, BlockTyp.COMMENT, BlockTyp.KEYWORD):
+                continue
+            counts["allWords"] += nWords
+            counts["allChars"] += nChars
+            counts["allWordChars"] += nWChars
+        return counts
+
+    project = NWProject()
+    project.data.setLanguage("en")
+    project._loadProjectLocalisation()
+    tokens = BareTokenizer(project)
+    tokens._isNovel = True
+    tokens.setSceneFormat("* * *", False)
+    tokens.setSynopsis(True)
+    tokens.setComments(True)
+    tokens.setKeywords(True)
+
+    tokens._text = (
+        "# Act One\n\n"
+        "## Chapter \u2013 One\n\n"
+        "### Scene\n\n"
+        "@pov: Jane\n"
+        "@char: Jane, John\n\n"
+        "%Synopsis: A scene\n\n"
+        "% A comment\u2014with a dash\n\n"
+        f"{ipsumText[0]}\n{ipsumText[1]}\n\n"
+        "### Scene\n\n"
+        f"Some\u2013text\u2014with dashes.\n\n{ipsumText[2]}\n\n"
+    )
+    tokens.tokenizeText()
+    types = {b[0] for b in tokens._blocks}
+    assert {BlockTyp.TEXT, BlockTyp.SEP, BlockTyp.COMMENT, BlockTyp.KEYWORD} <= types
+    assert types & set(HEADINGS)
+
+    tokens._counts = {}
+    tokens.countStats()
+    assert tokens.textStats == blockStats(tokens._blocks)
+    assert list(tokens.textStats) == DOC_STATS
+
+    # With counting off, nothing is counted
+    tokens.setCounting(False)
+    tokens.tokenizeText()
+    tokens._counts = {}
+    tokens.countStats()
+    assert tokens.textStats == dict.fromkeys(DOC_STATS, 0)
+
+
 @pytest.mark.core
 def testFmtToken_SceneSeparators(mockGUI):
     """Test the section and scene separators of the Tokenizer class."""
@@ -20,6 +20,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import threading
+
 from unittest.mock import MagicMock
 
 import pytest
@@ -27,16 +29,22 @@ import pytest
 from PyQt5.QtCore import QEvent, QMimeData, Qt, QThreadPool, QUrl
 from PyQt5.QtGui import (
     QClipboard, QDesktopServices, QDragEnterEvent, QDragMoveEvent, QDropEvent,
-    QFont, QMouseEvent, QTextBlock, QTextCursor, QTextOption
+    QFont, QMouseEvent, QTextBlock, QTextCursor, QTextDocument, QTextLayout,
+    QTextOption
 )
 from PyQt5.QtWidgets import QAction, QApplication, QMenu, QPlainTextEdit
 
 from novelwriter import CONFIG, SHARED
 from novelwriter.common import decodeMimeHandles
-from novelwriter.constants import nwKeyWords, nwUnicode
+from novelwriter.constants import nwConst, nwKeyWords, nwUnicode
+from novelwriter.core.spellcheck import FakeEnchant
 from novelwriter.dialogs.editlabel import GuiEditLabel
 from novelwriter.enum import nwDocAction, nwDocInsert, nwItemClass, nwItemLayout, nwTrinary
 from novelwriter.gui.doceditor import GuiDocEditor
+from novelwriter.gui.dochighlight import (
+    BLOCK_META, BLOCK_TEXT, BLOCK_TITLE, GuiDocHighlighter, TextBlockData
+)
+from novelwriter.gui.editordocument import GuiTextDocument
 from novelwriter.text.counting import standardCounter
 from novelwriter.types import (
     QtAlignJustify, QtAlignLeft, QtKeepAnchor, QtModCtrl, QtModNone,
@@ -171,6 +179,273 @@ def testGuiEditor_LoadText(qtbot, nwGUI, projPath, ipsumText, mockRnd):
     # qtbot.stop()
 
 
+@pytest.mark.gui
+def testGuiEditor_Highlighting(qtbot, nwGUI, projPath, mockRnd):
+    """Test that the syntax highlighter sets formats in runs."""
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    qDoc = docEditor.document()
+    docEditor.replaceText(
+        "### Scene\n\n"
+        "Some **bold _both_ text** here.\n\n"
+        "%Note: A **comment** here.\n"
+    )
+
+    def blockStyles(n: int) -> tuple[list[str], list[QTextLayout.FormatRange]]:
+        block = qDoc.findBlockByNumber(n)
+        styles = [""]*len(block.text())
+        ranges = block.layout().formats()
+        for r in ranges:
+            for x in range(r.start, r.start + r.length):
+                styles[x] = r.format.fontStyleName() or ""
+        return styles, ranges
+
+    # Each run of equal format is set once
+    for n in (0, 2, 4):
+        styles, ranges = blockStyles(n)
+        assert all(a.start + a.length <= b.start for a, b in zip(ranges, ranges[1:]))
+        assert all(
+            a.start + a.length < b.start or a.format != b.format
+            for a, b in zip(ranges, ranges[1:])
+        )
+
+    # Heading
+    styles, ranges = blockStyles(0)
+    assert styles == ["head3h"]*3 + ["header3"]*6
+    assert len(ranges) == 2
+
+    # Markup is not styled by the enclosing format
+    styles, ranges = blockStyles(2)
+    assert "".join(s[0] if s else "." for s in styles) == (
+        "....." "mm" "bbbbb" "m" "bbbb" "m" "bbbbb" "mm" "......"
+    )
+    assert ranges[3].format.fontItalic() is True
+    assert ranges[3].format.fontWeight() == QFont.Weight.Bold
+    assert len(ranges) == 7
+
+    # Comments keep their style inside markup
+    styles, ranges = blockStyles(4)
+    assert styles[:9] == ["modifier"]*6 + ["note"]*3
+    assert styles[9:11] == ["markup"]*2
+    assert styles[11:18] == ["bold"]*7
+
+    # qtbot.stop()
+
+
+@pytest.mark.gui
+def testGuiEditor_LazyHighlighting(qtbot, monkeypatch, nwGUI, projPath, ipsumText, mockRnd):
+    """Test highlighting large documents in the background."""
+    monkeypatch.setattr(CONFIG, "largeDocLimit", 1000)
+    monkeypatch.setattr(GuiDocHighlighter, "LAZY_SLICE", 0.0)
+
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    qDoc = docEditor.document()
+    syntax = qDoc.syntaxHighlighter
+
+    longText = "".join(
+        "## Chapter\n\n@pov: Jane\n\n%s\n\nSome **bold** text.\n\n" % "\n\n".join(ipsumText)
+        for _ in range(20)
+    )
+    docEditor.replaceText(longText)
+    nwGUI.saveDocument()
+    nwGUI.closeDocument()
+    assert syntax.lazyPending is False
+
+    # Load the document, which only highlights the viewport
+    assert docEditor.loadText(C.hSceneDoc, tLine=1) is True
+    assert syntax.lazyPending is True
+    first = qDoc.firstBlock()
+    last = qDoc.lastBlock()
+    while not last.text():
+        last = last.previous()
+    assert isinstance(first.userData(), TextBlockData)
+    assert last.userData() is None
+    assert len(first.layout().formats()) == 2
+
+    # The block states are already correct
+    states = [qDoc.findBlockByNumber(i).userState() for i in range(qDoc.blockCount())]
+    assert states.count(BLOCK_TITLE) == 20
+    assert states.count(BLOCK_META) == 20
+    assert states.count(BLOCK_TEXT) == 20*(len(ipsumText) + 1)
+    assert len(list(qDoc.iterBlockByType(BLOCK_TITLE))) == 20
+
+    # Looking up data highlights the block on demand
+    assert qDoc.spellErrorAtPos(last.position()) == ("", -1, -1, [])
+    assert isinstance(last.userData(), TextBlockData)
+    assert len(last.layout().formats()) > 0
+
+    # Run the background highlighting to the end
+    while syntax.lazyPending:
+        syntax._processLazyBlocks()
+    blocks = [qDoc.findBlockByNumber(i) for i in range(qDoc.blockCount())]
+    assert all(isinstance(b.userData(), TextBlockData) for b in blocks if b.text())
+    assert [b.userState() for b in blocks] == states
+
+    # The result is the same as highlighting the whole document
+    lazy = [[(r.start, r.length, r.format) for r in b.layout().formats()] for b in blocks]
+    syntax.rehighlight()
+    full = [[(r.start, r.length, r.format) for r in b.layout().formats()] for b in blocks]
+    assert lazy == full
+    assert [b.userState() for b in blocks] == states
+
+    # Small documents are highlighted immediately
+    docEditor.replaceText("### Scene\n\nText")
+    nwGUI.saveDocument()
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert syntax.lazyPending is False
+
+    # qtbot.stop()
+
+
+@pytest.mark.gui
+def testGuiEditor_LargeDocument(qtbot, monkeypatch, nwGUI, projPath, ipsumText, mockRnd):
+    """Test preparing large documents in the background."""
+    monkeypatch.setattr(CONFIG, "largeDocLimit", 1000)
+    monkeypatch.setattr(GuiTextDocument, "PREP_SLICE", 0.0)
+
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    qDoc = docEditor._qDocument
+    prepText = nwGUI.mainStatus.prepText
+    nwItem = SHARED.project.tree[C.hSceneDoc]
+    assert nwItem is not None
+
+    text = "### Scene\n\n" + "\n\n".join(ipsumText*40)
+    nwGUI.saveDocument()
+    SHARED.project.storage.getDocument(C.hSceneDoc).writeDocument(text)
+    wCount = nwItem.wordCount
+
+    # The document is read only while it is being counted
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert qDoc.isPreparing is True
+    assert docEditor.isReadOnly() is True
+    assert prepText.isHidden() is False
+    assert 0 < len(qDoc._counter) < qDoc.blockCount()
+    assert nwItem.wordCount == wCount
+
+    # Run the counting to the end
+    while qDoc.isPreparing:
+        qDoc._prepareBlocks()
+    assert qDoc.counts == standardCounter(text)
+    assert docEditor.isReadOnly() is False
+    assert prepText.isHidden() is True
+    assert nwItem.wordCount == standardCounter(text)[1]
+
+    # Changing the text while preparing counts the rest right away
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert qDoc.isPreparing is True
+    cursor = docEditor.textCursor()
+    cursor.setPosition(qDoc.characterCount() - 1)
+    cursor.insertText(" More words.")
+    assert qDoc.isPreparing is False
+    assert qDoc.counts == standardCounter(text + " More words.")
+    assert docEditor.isReadOnly() is False
+    assert prepText.isHidden() is True
+
+    # Saving while preparing saves the full counts
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert qDoc.isPreparing is True
+    nwItem.setWordCount(0)
+    assert docEditor.saveText() is True
+    assert qDoc.isPreparing is False
+    assert nwItem.wordCount == standardCounter(text)[1]
+
+    # Clearing the editor ends the preparation
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert prepText.isHidden() is False
+    docEditor.clearEditor()
+    assert qDoc.isPreparing is False
+    assert docEditor.isReadOnly() is True
+    assert prepText.isHidden() is True
+
+    # Small documents are counted immediately
+    SHARED.project.storage.getDocument(C.hSceneDoc).writeDocument("### Scene\n\nText")
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert qDoc.isPreparing is False
+    assert qDoc.counts == (9, 2, 1)
+
+    # qtbot.stop()
+
+
+@pytest.mark.gui
+def testGuiEditor_Outline(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
+    """Test tracking the title blocks for the document outline."""
+    monkeypatch.setattr(CONFIG, "largeDocLimit", 100)
+    monkeypatch.setattr(GuiDocHighlighter, "LAZY_SLICE", 0.0)
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    docHeader = docEditor.docHeader
+    qDoc = docEditor._qDocument
+
+    def checkOutline(changed: bool = True) -> None:
+        expected = {
+            block.blockNumber(): block.text()
+            for block in qDoc.iterBlockByType(BLOCK_TITLE)
+            if block.userState() == BLOCK_TITLE
+        }
+        outline = qDoc.takeOutline()
+        assert outline == (expected if changed else None)
+        assert qDoc.takeOutline() is None
+
+    text = "".join(f"## Chapter {i}\n\n### Scene {i}\n\nText {i}\n\n" for i in range(40))
+    nwGUI.saveDocument()
+    SHARED.project.storage.getDocument(C.hSceneDoc).writeDocument(text)
+    assert docEditor.loadText(C.hSceneDoc) is True
+    assert len(docHeader._docOutline) == 80
+
+    # The outline is up to date after loading, and isn't capped
+    assert qDoc.takeOutline() is None
+    docEditor._runDocumentTasks()
+    assert len(docHeader._docOutline) == 80
+
+    # Editing text doesn't change the outline
+    cursor = docEditor.textCursor()
+    cursor.setPosition(qDoc.findBlockByNumber(4).position())
+    cursor.insertText("More ")
+    checkOutline(False)
+
+    # Adding blocks moves the titles after them
+    cursor.insertText("\n\nNew paragraph")
+    checkOutline()
+
+    # Editing, adding and removing titles
+    cursor.setPosition(qDoc.findBlockByNumber(2).position() + 4)
+    cursor.insertText("New ")
+    checkOutline()
+    cursor.insertText("\n\n#### Section")
+    checkOutline()
+    cursor.setPosition(qDoc.findBlockByNumber(1).position())
+    cursor.setPosition(qDoc.findBlockByNumber(4).position() + 3, QtKeepAnchor)
+    cursor.removeSelectedText()
+    checkOutline()
+
+    # Turning text into a title, and a title into text
+    cursor.setPosition(qDoc.findBlockByNumber(10).position())
+    cursor.insertText("# ")
+    checkOutline()
+    cursor.setPosition(qDoc.findBlockByNumber(0).position())
+    cursor.deleteChar()
+    checkOutline()
+
+    # Undo everything
+    while qDoc.isUndoAvailable():
+        qDoc.undo()
+    assert docEditor.getText() == text
+    checkOutline()
+
+    # Replacing the text
+    docEditor.replaceText("### Scene\n\nText\n")
+    docEditor._runDocumentTasks()
+    assert docHeader._docOutline == {0: "### Scene"}
+
+    # qtbot.stop()
+
+
 @pytest.mark.gui
 def testGuiEditor_SaveText(qtbot, monkeypatch, caplog, nwGUI, projPath, ipsumText, mockRnd):
     """Test saving text from the editor."""
@@ -210,6 +485,83 @@ def testGuiEditor_SaveText(qtbot, monkeypatch, caplog, nwGUI, projPath, ipsumTex
     # qtbot.stop()
 
 
+@pytest.mark.gui
+def testGuiEditor_BackgroundSave(qtbot, monkeypatch, caplog, nwGUI, projPath, mockRnd):
+    """Test saving text from the editor in the background."""
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    docWriter = docEditor._docWriter
+    docPath = projPath / "content" / f"{C.hSceneDoc}.nwd"
+
+    started = []
+    monkeypatch.setattr(SHARED, "runInThreadPool", lambda runnable: started.append(runnable))
+
+    # The file is written by the writer, and the save is completed on
+    # its finished signal
+    docEditor.replaceText("### Scene\n\nSome text.\n")
+    nwGUI.saveDocument(background=True)
+    assert started == [docWriter]
+    assert docWriter.isRunning() is True
+    assert docEditor.docChanged is True
+    assert "Some text." not in docPath.read_text(encoding="utf-8")
+
+    # A second background save is skipped while the writer is busy
+    assert docEditor.saveText(background=True) is False
+    assert started == [docWriter]
+
+    docWriter.run()
+    assert docWriter.isRunning() is False
+    assert docWriter.result is True
+    assert docEditor.docChanged is False
+    assert docPath.read_text(encoding="utf-8").endswith("### Scene\n\nSome text.\n")
+    assert SHARED.project.index.getItemHeading(C.hSceneDoc, "T0001").title == "Scene"
+
+    # Unchanged text is not saved again
+    docEditor.replaceText("### Scene\n\nSome text.\n")
+    assert docEditor.docChanged is True
+    nwGUI._autoSaveDocument()
+    assert started == [docWriter]
+    assert docEditor.docChanged is False
+    assert docEditor._autoSaves == [1, 1]
+
+    # Edits made while writing keep the document changed
+    docEditor.replaceText("### Scene\n\nMore text.\n")
+    assert docEditor.saveText(background=True) is True
+    docEditor.replaceText("### Scene\n\nEven more text.\n")
+    docWriter.run()
+    assert docEditor.docChanged is True
+    assert docPath.read_text(encoding="utf-8").endswith("More text.\n")
+
+    # A blocking save waits for the writer and completes its save, and
+    # the writer's signal is then ignored
+    assert docEditor.saveText(background=True) is True
+    thread = threading.Thread(target=docWriter.run)
+    thread.start()
+    assert docEditor.saveText() is True
+    thread.join()
+    qtbot.wait(20)
+    assert docEditor.docChanged is False
+    assert docEditor._saveJob is None
+
+    # A file changed on disk still asks before overwriting
+    docEditor.replaceText("### Scene\n\nNew text.\n")
+    docPath.write_text("Changed on disk", encoding="utf-8")
+    with monkeypatch.context() as mp:
+        mp.setattr(SHARED, "question", lambda *a, **k: False)
+        assert docEditor.saveText(background=True) is True
+        docWriter.run()
+        assert docEditor.docChanged is True
+        assert "Could not save document." in caplog.text
+        assert docPath.read_text(encoding="utf-8") == "Changed on disk"
+
+    # The next save goes through
+    assert docEditor.saveText() is True
+    assert docPath.read_text(encoding="utf-8").endswith("New text.\n")
+
+    # qtbot.stop()
+
+
 @pytest.mark.gui
 def testGuiEditor_DragAndDrop(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     """Test drag and drop in the editor."""
@@ -553,6 +905,90 @@ def testGuiEditor_SpellChecking(qtbot, monkeypatch, nwGUI, projPath, ipsumText,
     # qtbot.stop()
 
 
+@pytest.mark.gui
+def testGuiEditor_BackgroundSpellCheck(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
+    """Test that spell checking runs in the background."""
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    qDoc = docEditor.document()
+    syntax = qDoc.syntaxHighlighter
+
+    class MockEnchant(FakeEnchant):
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.checked = []
+            self.threads = set()
+
+        def check(self, word: str) -> bool:
+            self.checked.append(word)
+            self.threads.add(threading.current_thread())
+            return "xx" not in word
+
+    def finishWorker() -> None:
+        while syntax._spellBusy:
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.processEvents()
+
+    updated = []
+    rehighlightBlock = GuiDocHighlighter.rehighlightBlock
+
+    def mockRehighlightBlock(self: GuiDocHighlighter, block: QTextBlock) -> None:
+        updated.append(block.blockNumber())
+        rehighlightBlock(self, block)
+
+    monkeypatch.setattr(GuiDocHighlighter, "rehighlightBlock", mockRehighlightBlock)
+
+    SHARED.spelling._enchant = enchant = MockEnchant()
+    SHARED.spelling.clearCache()
+    syntax.setSpellCheck(True)
+
+    # Unchecked words are not errors until they have been checked
+    docEditor.replaceText(
+        "### Scene\n\nSome wrxxd text.\n\nSome text.\n\nMore wrxxd text, and xxwords.\n"
+    )
+    docEditor.setDocumentChanged(False)
+    data = qDoc.findBlockByNumber(2).userData()
+    assert data.spellErrors == []
+    assert data.unchecked == {"Some", "wrxxd", "text"}
+
+    # When the worker is done, only blocks with errors are updated
+    finishWorker()
+    assert updated == [2, 6]
+    assert sorted(enchant.checked) == sorted(set(enchant.checked))
+    assert set(enchant.checked) == {
+        "Scene", "Some", "wrxxd", "text", "More", "and", "xxwords"
+    }
+    assert threading.current_thread() not in enchant.threads
+    assert qDoc.findBlockByNumber(2).userData().spellErrors == [(5, 10)]
+    assert qDoc.findBlockByNumber(4).userData().spellErrors == []
+    assert qDoc.findBlockByNumber(6).userData().spellErrors == [(5, 10), (21, 28)]
+    assert qDoc.spellErrorAtPos(qDoc.findBlockByNumber(2).position() + 6)[0] == "wrxxd"
+    assert docEditor.docChanged is False
+
+    # Known words are looked up directly
+    updated.clear()
+    enchant.checked.clear()
+    cursor = docEditor.textCursor()
+    cursor.setPosition(qDoc.findBlockByNumber(4).position() + 4)
+    cursor.insertText(" text")
+    assert qDoc.findBlockByNumber(4).userData().unchecked == set()
+    assert syntax._spellBusy is False
+    assert enchant.checked == []
+
+    # Disabling spell check while the worker is running drops the result
+    cursor.insertText(" wrxxdy")
+    assert syntax._spellBusy is True
+    syntax.setSpellCheck(False)
+    finishWorker()
+    assert enchant.checked == ["wrxxdy"]
+    assert updated == []
+    assert qDoc.findBlockByNumber(4).userData().spellErrors == []
+
+    # qtbot.stop()
+
+
 @pytest.mark.gui
 def testGuiEditor_Actions(qtbot, nwGUI, projPath, ipsumText, mockRnd):
     """Test the document actions. This is not an extensive test of the
@@ -1943,22 +2379,30 @@ def testGuiEditor_WordCounters(qtbot, monkeypatch, nwGUI, projPath, ipsumText, m
     docEditor.replaceText(text)
 
     # Check that a busy counter is blocked
-    with monkeypatch.context() as mp:
-        mp.setattr(docEditor._wCounterDoc, "isRunning", lambda *a: True)
-        docEditor._runDocumentTasks()
-        assert docEditor.docFooter.wordsText.text() == "Words: 0 (+0)"
-
     with monkeypatch.context() as mp:
         mp.setattr(docEditor._wCounterSel, "isRunning", lambda *a: True)
         docEditor._runSelCounter()
-        assert docEditor.docFooter.wordsText.text() == "Words: 0 (+0)"
+        assert docEditor.docFooter.wordsText.text() == "Words: 2 (+2)"
 
-    # Run the full word counter
-    docEditor._runDocumentTasks()
-    assert threadPool.objectID() == id(docEditor._wCounterDoc)
+    # The document counts are kept up to date while editing
+    assert docEditor._qDocument.counts == (cC, wC, pC)
+    cursor = docEditor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText("### Scene\n\n% Comment\n")
+    assert docEditor._qDocument.counts == standardCounter(docEditor.getText())
+    cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor, 5)
+    cursor.removeSelectedText()
+    assert docEditor._qDocument.counts == standardCounter(docEditor.getText())
+    cursor.insertText("Text")
+    assert docEditor._qDocument.counts == standardCounter(docEditor.getText())
+    docEditor.docAction(nwDocAction.UNDO)
+    docEditor.docAction(nwDocAction.UNDO)
+    docEditor.docAction(nwDocAction.UNDO)
+    assert docEditor.getText() == text
+    assert docEditor._qDocument.counts == (cC, wC, pC)
 
-    docEditor._wCounterDoc.run()
-    # docEditor._updateDocCounts(cC, wC, pC)
+    # Run the document tasks
+    docEditor._runDocumentTasks()
     assert SHARED.project.tree[C.hSceneDoc]._charCount == cC  # type: ignore
     assert SHARED.project.tree[C.hSceneDoc]._wordCount == wC  # type: ignore
     assert SHARED.project.tree[C.hSceneDoc]._paraCount == pC  # type: ignore
@@ -2251,3 +2695,94 @@ def testGuiEditor_Search(qtbot, monkeypatch, nwGUI, prjLipsum):
     assert docEditor.textCursor().selectedText() == ""
 
     # qtbot.stop()
+
+
+@pytest.mark.gui
+def testGuiEditor_FindAllOccurences(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
+    """Test finding all search results in the document."""
+    buildTestProject(nwGUI, projPath)
+    assert nwGUI.openDocument(C.hSceneDoc) is True
+    docEditor = nwGUI.docEditor
+    docSearch = docEditor.docSearch
+    qDoc = docEditor.document()
+
+    def qtFindAll(search, flags) -> tuple[list[int], list[int]]:
+        resS, resE = [], []
+        cursor = qDoc.find(search, 0, flags)
+        while cursor.hasSelection():
+            resS.append(cursor.selectionStart())
+            resE.append(cursor.selectionEnd())
+            cursor = qDoc.find(search, cursor, flags)
+        return resS, resE
+
+    # The emoji is two positions in the document
+    docEditor.replaceText(
+        "### Scene \U0001F600\n\nSome text, some \U0001F600 more Text.\n\n"
+        "SOME texts, and texting.\n"
+    )
+    docEditor.setCursorPosition(5)
+
+    caseFlag = QTextDocument.FindFlag.FindCaseSensitively
+    wordFlag = QTextDocument.FindFlag.FindWholeWords
+    for text, regEx, case, word in [
+        ("text", False, False, False),
+        ("text", False, True, False),
+        ("text", False, False, True),
+        ("some \U0001F600", False, False, False),
+        ("a.b", False, False, False),
+        (r"\bs\w+", True, False, False),
+        (r"\bs\w+", True, True, False),
+        (r"t\w+", True, False, True),
+        (r"^s.*", True, False, False),
+        (r"\s+\w+", True, False, False),
+        (r"[^.]+", True, False, False),
+        (r"\W+", True, False, False),
+    ]:
+        monkeypatch.setattr(CONFIG, "searchRegEx", regEx)
+        monkeypatch.setattr(CONFIG, "searchCase", case)
+        monkeypatch.setattr(CONFIG, "searchWord", word)
+        docSearch.searchBox.setText(text)
+        flags = QTextDocument.FindFlag(0)
+        if case:
+            flags |= caseFlag
+        if word:
+            flags |= wordFlag
+        search = docSearch.getSearchObject() if regEx else text
+        assert docEditor.findAllOccurences() == qtFindAll(search, flags), text
+
+    # The view is not changed
+    assert docEditor.getCursorPosition() == 5
+
+    # Matches don't span paragraphs, and empty matches are skipped
+    monkeypatch.setattr(CONFIG, "searchRegEx", True)
+    monkeypatch.setattr(CONFIG, "searchWord", False)
+    docSearch.searchBox.setText(r"\.\s+s")
+    assert docEditor.findAllOccurences() == ([], [])
+    monkeypatch.setattr(CONFIG, "searchCase", True)
+    docSearch.searchBox.setText(r"\s+SOME")
+    assert docEditor.findAllOccurences() == ([], [])
+    docSearch.searchBox.setText(r"\s+Some")
+    assert docEditor.findAllOccurences() == ([], [])
+    docSearch.searchBox.setText(r"\s+some")
+    assert docEditor.findAllOccurences() == ([24], [29])
+    monkeypatch.setattr(CONFIG, "searchCase", False)
+    docSearch.searchBox.setText(r"x*")
+    assert docEditor.findAllOccurences() == qtFindAll("x", QTextDocument.FindFlag(0))
+    docSearch.searchBox.setText(r"^")
+    assert docEditor.findAllOccurences() == ([], [])
+
+    # An empty search has no results
+    docSearch.searchBox.setText("")
+    assert docEditor.findAllOccurences() == ([], [])
+
+    # Invalid regular expressions have no results
+    docSearch.searchBox.setText(r"\bSus[")
+    assert docEditor.findAllOccurences() == ([], [])
+
+    # The number of results is capped
+    monkeypatch.setattr(nwConst, "MAX_SEARCH_RESULT", 5)
+    docSearch.searchBox.setText(r"\w")
+    resS, _ = docEditor.findAllOccurences()
+    assert len(resS) == 6
+
+    # qtbot.stop()
@@ -25,8 +25,10 @@ from time import time
 import pytest
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QAction
+from PyQt5.QtWidgets import QAction, QApplication
 
+from novelwriter import SHARED
+from novelwriter.constants import nwConst
 from novelwriter.enum import nwView
 from novelwriter.gui.search import GuiProjectSearch
 
@@ -42,13 +44,25 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
         nonlocal search
         res = search.searchResult
         return sum(
-            int(res.topLevelItem(i).text(GuiProjectSearch.C_COUNT).strip("()"))
+            int(res.topLevelItem(i).text(GuiProjectSearch.C_COUNT).strip("()+"))
             for i in range(res.topLevelItemCount())
         )
 
-    # Plain search
+    def finishSearch():
+        while search.isSearching():
+            search._pool.waitForDone()
+            QApplication.processEvents()
+
+    # Plain search, which loads the text index in the background for
+    # the next search
+    assert SHARED.project.index.getTextIndex() is None
     search.searchText.setText("Lorem")
     search.searchAction.activate(QAction.ActionEvent.Trigger)
+    finishSearch()
+    search._pool.waitForDone()
+    QApplication.processEvents()
+    assert search._loading is False
+    assert SHARED.project.index.getTextIndex() is not None
     assert search.searchResult.topLevelItemCount() == 14
     assert totalCount() == 43
 
@@ -57,7 +71,7 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
     assert firstDoc is not None
     handle = firstDoc.data(GuiProjectSearch.C_RESULT, GuiProjectSearch.D_HANDLE)
     result = firstResult.data(GuiProjectSearch.C_RESULT, GuiProjectSearch.D_RESULT)
-    assert result == (handle, 3, 5)
+    assert result == (handle, 3, 5, 1)
 
     # Move down
     search.searchText.setFocus()
@@ -84,7 +98,7 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
         mp.setattr(search.searchResult, "hasFocus", lambda *a: True)
         with qtbot.waitSignal(search.openDocumentSelectRequest, timeout=1000) as signal:
             qtbot.keyClick(search, Qt.Key.Key_Return)
-            assert signal.args == [handle, 3, 5, False]
+            assert signal.args == [handle, 3, 5, 1, False]
 
     assert nwGUI.docEditor.docHandle == handle
     assert nwGUI.docEditor.textCursor().selectedText() == "Lorem"
@@ -92,7 +106,7 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
     # Double-click
     with qtbot.waitSignal(search.openDocumentSelectRequest, timeout=1000) as signal:
         search._searchResultDoubleClicked(firstResult, 0)
-        assert signal.args == [handle, 3, 5, True]
+        assert signal.args == [handle, 3, 5, 1, True]
 
     # Case Sensitive
     search.toggleCase.setChecked(True)
@@ -119,6 +133,7 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
     search.toggleRegEx.setChecked(True)
     search.beginSearch("(dolor|dolorem)")
     search.searchAction.activate(QAction.ActionEvent.Trigger)
+    finishSearch()
     assert search.searchResult.topLevelItemCount() == 10
     assert totalCount() == 34
 
@@ -127,5 +142,32 @@ def testGuiDocSearch_Main(qtbot, monkeypatch, nwGUI, prjLipsum):
     assert search.searchResult.topLevelItemCount() == 10
     assert totalCount() == 34
 
+    # Results are capped across the project
+    with monkeypatch.context() as mp:
+        mp.setattr(nwConst, "MAX_SEARCH_RESULT", 10)
+        search.searchAction.activate(QAction.ActionEvent.Trigger)
+        finishSearch()
+        assert totalCount() == 10
+        last = search.searchResult.topLevelItem(search.searchResult.topLevelItemCount() - 1)
+        assert last.text(GuiProjectSearch.C_COUNT).endswith("+)")
+
+    # A running search is cancelled by a new one
+    search.searchAction.activate(QAction.ActionEvent.Trigger)
+    assert search.isSearching() is True
+    search.beginSearch("ipsum")
+    search.searchAction.activate(QAction.ActionEvent.Trigger)
+    finishSearch()
+    result = search.searchResult.topLevelItem(0).child(0)
+    assert result.text(GuiProjectSearch.C_RESULT).lower().count("ipsum") > 0
+
+    # Closing the project cancels the search
+    search.searchAction.activate(QAction.ActionEvent.Trigger)
+    assert search.isSearching() is True
+    search.closeProjectTasks()
+    assert search.isSearching() is False
+    search._pool.waitForDone()
+    QApplication.processEvents()
+    assert search.searchResult.topLevelItemCount() == 0
+
     # qtbot.stop()
     nwGUI.closeProject()
@@ -62,6 +62,13 @@ def testGuiStatusBar_Main(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     status.setDocumentStatus(nwTrinary.POSITIVE)
     assert status.docIcon.state == nwTrinary.POSITIVE
 
+    # Preparing Status
+    assert status.prepText.isHidden() is True
+    status.updatePreparingStatus(True)
+    assert status.prepText.isHidden() is False
+    status.updatePreparingStatus(False)
+    assert status.prepText.isHidden() is True
+
     # Idle Status
     CONFIG.stopWhenIdle = False
     status.setUserIdle(True)
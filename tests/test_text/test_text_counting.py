@@ -22,7 +22,9 @@ from __future__ import annotations
 
 import pytest
 
-from novelwriter.text.counting import bodyTextCounter, preProcessText, standardCounter
+from novelwriter.text.counting import (
+    IncrementalCounter, bodyTextCounter, preProcessText, standardCounter
+)
 
 
 @pytest.mark.core
@@ -205,3 +207,56 @@ def testTextCounting_bodyTextCounter():
     assert wC == 14
     assert cC == 91
     assert sC == 81
+
+
+@pytest.mark.core
+def testTextCounting_IncrementalCounter():
+    """Test the incremental counter against the standard counter."""
+    lines = [
+        "#! Title", "", "### Scene", "@pov: Jane", "% Comment", "Text in a paragraph.",
+        "More text\u2028# Not a heading", "", "", "> Indented <", "Dashes\u2013and\u2014dashes.",
+    ]
+
+    def check(counter: IncrementalCounter) -> None:
+        assert len(counter) == len(lines)
+        assert counter.counts == standardCounter("\n".join(lines).replace("\u2028", "\n"))
+
+    counter = IncrementalCounter()
+    assert counter.counts == (0, 0, 0)
+    counter.setText(lines)
+    check(counter)
+
+    # Edit a line
+    lines[5] = "Other text"
+    counter.update(5, 1, lines[5:6])
+    check(counter)
+
+    # Merge two paragraphs by removing the empty lines between them
+    del lines[7:9]
+    counter.update(7, 2, [])
+    check(counter)
+
+    # Split a paragraph, which affects the lines after the change
+    lines[3:4] = ["", "@pov: John", ""]
+    counter.update(3, 1, lines[3:6])
+    check(counter)
+
+    # Turn the heading into text, which starts a paragraph after the
+    # meta data and comment lines
+    lines[2] = "Text"
+    lines[3] = "% Another comment"
+    counter.update(2, 2, lines[2:4])
+    check(counter)
+
+    # Insert at the start and end
+    lines[0:0] = ["First", ""]
+    counter.update(0, 0, lines[0:2])
+    check(counter)
+    lines.append("Last")
+    counter.update(len(lines) - 1, 0, lines[-1:])
+    check(counter)
+
+    # Replace everything
+    lines = ["Some text"]
+    counter.setText(lines)
+    check(counter)
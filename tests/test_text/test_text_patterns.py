@@ -26,7 +26,7 @@ import pytest
 
 from novelwriter import CONFIG
 from novelwriter.constants import nwUnicode
-from novelwriter.text.patterns import REGEX_PATTERNS, DialogParser
+from novelwriter.text.patterns import REGEX_PATTERNS, AutoReplace, DialogParser, compileAutoReplace
 
 
 def allMatches(regEx: re.Pattern, text: str) -> list[list[str]]:
@@ -598,3 +598,27 @@ def testTextPatterns_DialogParserPolish():
         "And so on and so forth. However, \"text in quotation marks\" should not be "
         "highlighted at all, and if so, it should be highlighted differently."
     ) == []
+
+
+@pytest.mark.core
+def testTextPatterns_AutoReplace():
+    """Test the compiled auto-replace function."""
+    assert compileAutoReplace({}) is None
+
+    replace = compileAutoReplace({"A": "Alpha", "AB": "Alpha Beta", "x.y": "[dot]"})
+    assert replace is not None
+    assert replace("<A>, <AB> and <C>") == "Alpha, Alpha Beta and <C>"
+    assert replace("<x.y> but not <xzy> or <a>") == "[dot] but not <xzy> or <a>"
+    assert replace("<<A>>") == "<Alpha>"
+    assert replace("No replacements") == "No replacements"
+    assert replace("<A") == "<A"
+    assert replace("A> <A>") == "A> Alpha"
+    assert replace("<xxxxxxxxxx> <A>") == "<xxxxxxxxxx> Alpha"
+
+    # Keys with brackets match as they would in a regex alternation,
+    # where the first key in the list wins
+    replace = AutoReplace({"a<b": "1", "b": "2", "c>d": "3", "c": "4", "c>d>e": "5"})
+    assert replace("<a<b> <b>") == "1 2"
+    assert replace("<c>d> <c> <c>d>e>") == "3 4 3e>"
+    replace = AutoReplace({"c>d>e": "5", "c": "4", "c>d": "3"})
+    assert replace("<c>d>e> <c>d>") == "5 4d>"
@@ -24,11 +24,12 @@ from pathlib import Path
 
 import pytest
 
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import QRunnable, QThreadPool, QUrl
 from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtWidgets import QFileDialog, QListWidgetItem, QMessageBox
 from pytestqt.qtbot import QtBot
 
+from novelwriter import SHARED
 from novelwriter.constants import nwLabels
 from novelwriter.core.buildsettings import BuildSettings
 from novelwriter.enum import nwBuildFmt
@@ -36,6 +37,7 @@ from novelwriter.guimain import GuiMain
 from novelwriter.tools.manusbuild import GuiManuscriptBuild
 from novelwriter.types import QtDialogClose
 
+from tests.mocked import MockSlowBuild, causeOSError
 from tests.tools import buildTestProject
 
 
@@ -87,6 +89,7 @@ def testToolManuscriptBuild_Main(
             raise ValueError("No such key in format list")
 
     # Build documents
+    assert manus.btnReport.isEnabled() is False
     lastFmt = None
     for fmt in nwBuildFmt:
         selectFormat(fmt)
@@ -95,6 +98,18 @@ def testToolManuscriptBuild_Main(
         assert (fncPath / "TestBuild").with_suffix(nwLabels.BUILD_EXT[fmt]).exists()
         lastFmt = fmt
 
+    # Save a report of the last build
+    assert manus.btnReport.isEnabled() is True
+    reportFile = fncPath / "Report.csv"
+    with monkeypatch.context() as mp:
+        mp.setattr(QFileDialog, "getSaveFileName", lambda *a: (str(reportFile), ""))
+        manus.btnReport.click()
+        assert reportFile.read_text(encoding="utf-8").startswith("key,title,total_ms")
+
+        mp.setattr("builtins.open", causeOSError)
+        manus.btnReport.click()
+        assert SHARED.lastAlert == "Could not save the build report."
+
     manus._dialogButtonClicked(manus.buttonBox.button(QtDialogClose))
     manus.deleteLater()
 
@@ -149,6 +164,19 @@ def testToolManuscriptBuild_Main(
         manus.btnOpen.click()
         assert lastUrl.startswith("file://")
 
+    # Closing the dialog during a build cancels the build
+    def runAndClose(runnable: QRunnable, priority: int = 0) -> None:
+        QThreadPool.globalInstance().start(runnable)
+        manus.close()
+
+    with monkeypatch.context() as mp:
+        mp.setattr("novelwriter.tools.manusbuild.BackgroundBuild", MockSlowBuild)
+        mp.setattr(SHARED, "runInThreadPool", runAndClose)
+        mp.setattr(QMessageBox, "result", lambda *a: QMessageBox.StandardButton.Yes)
+        assert manus._runBuild() is False
+    assert manus._buildJob is None
+    assert manus.isVisible() is False
+
     # Finish
     manus._dialogButtonClicked(manus.buttonBox.button(QtDialogClose))
     # qtbot.stop()
@@ -26,10 +26,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from PyQt5.QtCore import QUrl, pyqtSlot
+from PyQt5.QtCore import QThreadPool, QUrl, pyqtSlot
 from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtPrintSupport import QPrintPreviewDialog
-from PyQt5.QtWidgets import QAction, QListWidgetItem
+from PyQt5.QtWidgets import QAction, QApplication, QListWidgetItem
 
 from novelwriter import SHARED
 from novelwriter.constants import nwHeadFmt
@@ -39,6 +39,7 @@ from novelwriter.tools.manuscript import GuiManuscript
 from novelwriter.tools.manussettings import GuiBuildSettings
 from novelwriter.types import QtDialogApply, QtDialogSave
 
+from tests.mocked import MockSlowBuild
 from tests.tools import C, buildTestProject
 
 
@@ -67,8 +68,9 @@ def testToolManuscript_Init(monkeypatch, qtbot, nwGUI, projPath, mockRnd):
     # Build a preview
     manus.buildList.clearSelection()
     manus.buildList.setCurrentRow(0)
-    with qtbot.waitSignal(manus.docPreview.document().contentsChanged):
-        manus.btnPreview.click()
+    manus.btnPreview.click()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
     assert manus.docPreview.toPlainText().strip() == allText
 
     nwGUI.closeProject()  # This should auto-close the manuscript tool
@@ -76,6 +78,52 @@ def testToolManuscript_Init(monkeypatch, qtbot, nwGUI, projPath, mockRnd):
     # qtbot.stop()
 
 
+@pytest.mark.gui
+def testToolManuscript_CancelPreview(monkeypatch, qtbot, nwGUI, projPath):
+    """Test cancelling preview builds in the GuiManuscript dialog."""
+    monkeypatch.setattr("novelwriter.tools.manuscript.BackgroundBuild", MockSlowBuild)
+    monkeypatch.setattr(MockSlowBuild, "hold", True)
+    buildTestProject(nwGUI, projPath)
+    nwGUI.openProject(projPath)
+
+    manus = GuiManuscript(nwGUI)
+    manus.show()
+    manus.loadContent()
+    manus.buildList.setCurrentRow(0)
+
+    # A new preview cancels the running one, and its late signals are
+    # ignored
+    manus.btnPreview.click()
+    first = manus._previewJob
+    assert isinstance(first, MockSlowBuild)
+    monkeypatch.setattr(MockSlowBuild, "hold", False)
+    manus.btnPreview.click()
+    assert first.isCancelled() is True
+    assert manus._previewJob is not first
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    assert first.isFinished() is True
+    assert manus._previewJob is None
+    assert "New Chapter" in manus.docPreview.toPlainText()
+
+    # Closing the dialog cancels the preview, and the thread pool owns
+    # the build job until it is done
+    monkeypatch.setattr(MockSlowBuild, "hold", True)
+    manus.btnPreview.click()
+    job = manus._previewJob
+    assert isinstance(job, MockSlowBuild)
+    manus.close()
+    assert job.isCancelled() is True
+    assert manus._previewJob is None
+    del job
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+    nwGUI.closeProject()
+
+    # qtbot.stop()
+
+
 @pytest.mark.gui
 def testToolManuscript_Builds(qtbot, nwGUI, projPath):
     """Test the handling of builds in the GuiManuscript dialog."""
@@ -210,8 +258,9 @@ def testToolManuscript_Features(monkeypatch, qtbot, nwGUI, projPath, mockRnd):
     manus._builds.setBuild(build)
 
     manus.buildList.setCurrentRow(0)
-    with qtbot.waitSignal(manus.docPreview.document().contentsChanged):
-        manus.btnPreview.click()
+    manus.btnPreview.click()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
     assert manus.docPreview.toPlainText().strip() != ""
 
     # Check Outline
@@ -304,8 +353,9 @@ def testToolManuscript_Print(monkeypatch, qtbot, nwGUI, projPath):
     manus.loadContent()
 
     manus.buildList.setCurrentRow(0)
-    with qtbot.waitSignal(manus.docPreview.document().contentsChanged):
-        manus.btnPreview.click()
+    manus.btnPreview.click()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
     assert manus.docPreview.toPlainText().strip() != ""
 
     with monkeypatch.context() as mp: